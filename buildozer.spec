@@ -19,7 +19,7 @@ android.minapi = 24
 android.ndk_api = 24
 
 # Permissions: SAF gives read access to user-picked files — no broad storage perms needed
-android.permissions = INTERNET
+android.permissions = INTERNET,ACCESS_FINE_LOCATION,ACCESS_COARSE_LOCATION
 
 # Toolchain pins
 android.build_tools_version = 35.0.0
@@ -1,3 +1,5 @@
+import time
+_IMPORTS_STARTED = time.perf_counter()
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
@@ -7,41 +9,102 @@ from kivymd.uix.scrollview import MDScrollView
 from kivymd.uix.toolbar import MDTopAppBar
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
-from kivymd.uix.dialog import MDDialog
 from kivymd.uix.textfield import MDTextField
-from kivymd.uix.filemanager import MDFileManager
 from kivymd.toast import toast
 from kivymd.uix.progressbar import MDProgressBar
-from kivy.metrics import dp
+from kivy.metrics import dp, sp
 from kivy.uix.widget import Widget
+from kivy.graphics import Color, Rectangle, RoundedRectangle, Ellipse, Line, PushMatrix, PopMatrix, Translate, InstructionGroup
+from kivy.core.image import Image as CoreImage
+from kivy.uix.stencilview import StencilView
+from kivy.uix.floatlayout import FloatLayout
+from kivy.core.text import Label as CoreLabel
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.clock import Clock
 from kivy.utils import platform
 from kivy.animation import Animation
-import webbrowser
 import os
+import re
+import sys
+import csv
+import unicodedata
 import json
 import sqlite3
+import importlib
+import importlib.util
+from math import radians, degrees, sin, cos, asin, sqrt, hypot, log, pi
 from urllib.parse import quote_plus
+from collections import OrderedDict
+from itertools import chain
+from heapq import nsmallest
 from datetime import datetime, date, timedelta
 import threading
 import traceback
+import logging
 
-# Optional imports with fallbacks
-try:
-    from openpyxl import load_workbook
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
-
-# Attempt to import the date picker once at module load so we know whether
-# it is available.  Some environments (e.g. KivyMD 1.2.0 on Pydroid) do
-# not include MDDatePicker.  If the import fails, we provide a text
-# input fallback for selecting dates.
-try:
-    from kivymd.uix.pickers import MDDatePicker  # noqa: F401
-    HAS_DATE_PICKER = True
-except Exception:
-    HAS_DATE_PICKER = False
+# Diagnostics go through logging; Kivy's handler shows "Category: message" as [Category] message.
+logger = logging.getLogger("address_navigator")
+
+# -----------------------------
+# Deferred imports - heavy optional modules load on first use
+# -----------------------------
+DEFERRED_IMPORT_TIMES = {}  # module name -> ms spent importing it on first use
+
+
+def lazy_import(module_name, attr=None):
+    """Import ``module_name`` on first use (returning ``attr`` from it if given) and record the cost."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        elapsed = (time.perf_counter() - started) * 1000.0
+        DEFERRED_IMPORT_TIMES[module_name] = elapsed
+        logger.debug("Import: deferred %s took %.1f ms", module_name, elapsed)
+    return getattr(module, attr) if attr else module
+
+
+def module_available(module_name):
+    """Locate a module without executing it, so availability checks stay cheap."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class _LazyCallable:
+    """Stand-in for a class or function that is imported the first time it is called."""
+    def __init__(self, module_name, attr):
+        self.module_name = module_name
+        self.attr = attr
+
+    def __call__(self, *args, **kwargs):
+        return lazy_import(self.module_name, self.attr)(*args, **kwargs)
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+    def __init__(self, module_name):
+        self.module_name = module_name
+
+    def __getattr__(self, name):
+        return getattr(lazy_import(self.module_name), name)
+
+
+MDDialog = _LazyCallable('kivymd.uix.dialog', 'MDDialog')
+MDFileManager = _LazyCallable('kivymd.uix.filemanager', 'MDFileManager')
+load_workbook = _LazyCallable('openpyxl', 'load_workbook')
+webbrowser = _LazyModule('webbrowser')
+
+# Probed, not imported: openpyxl and the pickers are only loaded when a file
+# is imported or a date range is picked.  PICKERS_AVAILABLE only says the
+# kivymd.uix.pickers package exists, not which pickers it has: some
+# environments (e.g. KivyMD 1.2.0 on Pydroid) lack MDDatePicker and KivyMD 2.x
+# replaced it, so open_date_picker looks each class up when it opens and falls
+# back accordingly.
+OPENPYXL_AVAILABLE = module_available('openpyxl')
+PICKERS_AVAILABLE = module_available('kivymd.uix.pickers')
 
 # Android-specific imports
 ANDROID_AVAILABLE = False
@@ -49,7 +112,7 @@ ASK_AVAILABLE = False
 if platform == 'android':
     try:
         from android.permissions import request_permissions, Permission
-        from jnius import autoclass
+        from jnius import autoclass, PythonJavaClass, java_method
         PythonActivity = autoclass('org.kivy.android.PythonActivity')
         Intent = autoclass('android.content.Intent')
         Uri = autoclass('android.net.Uri')
@@ -63,15 +126,70 @@ if platform == 'android':
     except Exception:
         ASK_AVAILABLE = False
 
+HEADER_IMPORT_MS = (time.perf_counter() - _IMPORTS_STARTED) * 1000.0
+
+
+def import_time_report():
+    """Import costs in the style of ``python -X importtime`` (microseconds)."""
+    lines = ["import time:    cumulative [us] | imported package",
+             f"import time: {int(HEADER_IMPORT_MS * 1000):>18} | <module header: kivy/kivymd widgets, stdlib>"]
+    for name, ms in sorted(DEFERRED_IMPORT_TIMES.items(), key=lambda kv: -kv[1]):
+        lines.append(f"import time: {int(ms * 1000):>18} | {name} (deferred)")
+    return "\n".join(lines)
+
 
 # -----------------------------
 # SQLite storage for completions - Updated to include GPS coordinates
 # -----------------------------
+RESULT_CACHE_SIZE = 64
+
+
 class CompletionDB:
     def __init__(self, db_path):
         self.db_path = db_path
+        # Memoised reads: keys carry the write generation, so any write makes every older entry unreachable
+        self.generation = 0
+        self._results = OrderedDict()
+        self._results_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
         self._ensure_db()
 
+    def _bump_generation(self):
+        with self._results_lock:
+            self.generation += 1
+            self._results.clear()
+
+    def memo(self, kind, args, compute):
+        """Return the cached result for ``(kind, args)`` at the current generation, computing it on a miss.
+
+        Cached values are shared between callers and must be treated as read-only.
+        """
+        with self._results_lock:
+            key = (kind, args, self.generation)
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.cache_hits += 1
+                return self._results[key]
+            self.cache_misses += 1
+        value = compute()
+        with self._results_lock:
+            if key[2] == self.generation:
+                self._results[key] = value
+                while len(self._results) > RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+        return value
+
+    def cache_stats(self):
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            'entries': len(self._results),
+            'generation': self.generation,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'hit_rate': (self.cache_hits / lookups) if lookups else 0.0,
+        }
+
     def _connect(self):
         conn = sqlite3.connect(self.db_path)
         conn.execute('PRAGMA journal_mode=WAL;')
@@ -97,6 +215,33 @@ class CompletionDB:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON completions(timestamp);")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_outcome ON completions(outcome);")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_addr ON completions(address);")
+            # Undone completions, kept so incremental exports can tell the receiver what to drop
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS completion_tombstones (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER,
+                    idx INTEGER,
+                    address TEXT,
+                    lat REAL,
+                    lng REAL,
+                    outcome TEXT,
+                    amount REAL,
+                    timestamp TEXT,
+                    deleted_at TEXT
+                );
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS export_state (
+                    name TEXT PRIMARY KEY,
+                    last_id INTEGER,
+                    last_tombstone INTEGER,
+                    exported_at TEXT
+                );
+                """
+            )
 
     def insert_completion(self, idx, address, lat, lng, outcome, amount, ts_iso):
         with self._connect() as conn:
@@ -104,6 +249,7 @@ class CompletionDB:
                 "INSERT INTO completions (idx, address, lat, lng, outcome, amount, timestamp) VALUES (?,?,?,?,?,?,?)",
                 (idx, address, lat, lng, outcome, amount if amount is not None else None, ts_iso),
             )
+        self._bump_generation()
 
     def delete_latest_by_idx(self, idx):
         with self._connect() as conn:
@@ -113,13 +259,28 @@ class CompletionDB:
             )
             row = cur.fetchone()
             if row:
+                self._tombstone(conn, "id=?", (row[0],))
                 conn.execute("DELETE FROM completions WHERE id=?", (row[0],))
+        self._bump_generation()
 
     def clear_all(self):
         with self._connect() as conn:
+            self._tombstone(conn)
             conn.execute("DELETE FROM completions")
+        self._bump_generation()
+
+    def _tombstone(self, conn, condition="1", params=()):
+        """Keep a copy of rows about to be deleted, but only those an incremental export has already sent."""
+        conn.execute(
+            "INSERT INTO completion_tombstones (id, idx, address, lat, lng, outcome, amount, timestamp, deleted_at) "
+            "SELECT id, idx, address, lat, lng, outcome, amount, timestamp, ? FROM completions "
+            f"WHERE id <= (SELECT COALESCE(MAX(last_id), 0) FROM export_state) AND {condition}",
+            (datetime.now().isoformat(timespec='seconds'), *params),
+        )
 
-    def query(self, date_from=None, date_to=None, outcome=None, search_text="", limit=50, offset=0):
+    @staticmethod
+    def _where(date_from=None, date_to=None, outcome=None, search_text="", after=None):
+        """``(" WHERE ...", params)`` for the filters every completion read shares; ``("", [])`` when none apply."""
         where = []
         params = []
         if date_from:
@@ -134,13 +295,32 @@ class CompletionDB:
         if search_text:
             where.append("LOWER(address) LIKE ?")
             params.append(f"%{search_text.lower()}%")
-        where_sql = (" WHERE " + " AND ".join(where)) if where else ""
-        sql = f"SELECT idx, address, lat, lng, outcome, amount, timestamp FROM completions{where_sql} ORDER BY datetime(timestamp) DESC LIMIT ? OFFSET ?"
+        if after:
+            where.append("(datetime(timestamp), id) < (datetime(?), ?)")
+            params.extend(after)
+        return (" WHERE " + " AND ".join(where)) if where else "", params
+
+    def query(self, date_from=None, date_to=None, outcome=None, search_text="", limit=50, offset=0, cache=True, after=None):
+        """Completions matching the filters, newest first; ``cache=False`` for one-off bulk reads.
+
+        ``after`` is the ``page_key`` of the last row already shown: the page
+        starts strictly below it, so inserts and equal timestamps never shift
+        or repeat rows the way ``offset`` does.
+        """
+        args = (date_from, date_to, outcome, search_text, limit, offset, after)
+        if not cache:
+            return self._query(*args)
+        return self.memo('query', args, lambda: self._query(*args))
+
+    def _query(self, date_from, date_to, outcome, search_text, limit, offset, after):
+        where_sql, params = self._where(date_from, date_to, outcome, search_text, after)
+        sql = f"SELECT idx, address, lat, lng, outcome, amount, timestamp, id FROM completions{where_sql} ORDER BY datetime(timestamp) DESC, id DESC LIMIT ? OFFSET ?"
         with self._connect() as conn:
             cur = conn.execute(sql, (*params, limit, offset))
             rows = cur.fetchall()
         return [
             {
+                'id': r[7],
                 'index': r[0],
                 'address': r[1],
                 'lat': r[2],
@@ -153,28 +333,124 @@ class CompletionDB:
             } for r in rows
         ]
 
+    @staticmethod
+    def page_key(item):
+        """Keyset position of a ``query`` row, for the next page's ``after``."""
+        return (item['completion']['timestamp'], item['id'])
+
     def count(self, date_from=None, date_to=None, outcome=None, search_text=""):
-        where = []
-        params = []
-        if date_from:
-            where.append("datetime(timestamp) >= datetime(?)")
-            params.append(date_from.isoformat())
-        if date_to:
-            where.append("datetime(timestamp) <= datetime(?)")
-            params.append(date_to.isoformat())
-        if outcome and outcome in ("PIF", "DA", "Done"):
-            where.append("outcome = ?")
-            params.append(outcome)
-        if search_text:
-            where.append("LOWER(address) LIKE ?")
-            params.append(f"%{search_text.lower()}%")
-        where_sql = (" WHERE " + " AND ".join(where)) if where else ""
+        args = (date_from, date_to, outcome, search_text)
+        return self.memo('count', args, lambda: self._count(*args))
+
+    def _count(self, date_from, date_to, outcome, search_text):
+        where_sql, params = self._where(date_from, date_to, outcome, search_text)
         sql = f"SELECT COUNT(*) FROM completions{where_sql}"
         with self._connect() as conn:
             cur = conn.execute(sql, params)
             (cnt,) = cur.fetchone()
         return int(cnt)
 
+    def iter_rows(self, date_from=None, date_to=None, arraysize=1000):
+        """Yield ``(id, idx, address, lat, lng, outcome, amount, timestamp)`` newest first, reading the cursor in batches."""
+        where_sql, params = self._where(date_from, date_to)
+        return self._iter_cursor(
+            f"SELECT id, idx, address, lat, lng, outcome, amount, timestamp FROM completions{where_sql} ORDER BY datetime(timestamp) DESC",
+            params, arraysize)
+
+    def _iter_cursor(self, sql, params, arraysize):
+        conn = self._connect()
+        try:
+            cur = conn.execute(sql, params)
+            while True:
+                rows = cur.fetchmany(arraysize)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
+    def iter_since(self, after_id, upto_id, arraysize=1000):
+        """Yield completions with ``after_id < id <= upto_id`` in ``iter_rows`` layout, oldest id first."""
+        return self._iter_cursor(
+            "SELECT id, idx, address, lat, lng, outcome, amount, timestamp FROM completions WHERE id > ? AND id <= ? ORDER BY id",
+            (after_id, upto_id), arraysize)
+
+    def iter_tombstones(self, after_seq, upto_seq, max_id, arraysize=1000):
+        """Yield undone completions recorded in ``after_seq < seq <= upto_seq`` whose id is at most ``max_id``."""
+        return self._iter_cursor(
+            "SELECT id, idx, address, lat, lng, outcome, amount, timestamp FROM completion_tombstones "
+            "WHERE seq > ? AND seq <= ? AND id <= ? ORDER BY seq",
+            (after_seq, upto_seq, max_id), arraysize)
+
+    def export_heads(self):
+        """Highest completion id ever issued and highest tombstone seq, read from ``sqlite_sequence``."""
+        with self._connect() as conn:
+            heads = dict(conn.execute(
+                "SELECT name, seq FROM sqlite_sequence WHERE name IN ('completions', 'completion_tombstones')"
+            ).fetchall())
+        return heads.get('completions', 0), heads.get('completion_tombstones', 0)
+
+    def export_watermark(self, name="delta"):
+        """``(last_id, last_tombstone, exported_at)`` of the previous incremental export, zeros if there was none."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT last_id, last_tombstone, exported_at FROM export_state WHERE name=?", (name,)).fetchone()
+        return tuple(row) if row else (0, 0, None)
+
+    def set_export_watermark(self, last_id, last_tombstone, name="delta"):
+        """Move the watermark and drop the tombstones at or below it, which have now been exported."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO export_state (name, last_id, last_tombstone, exported_at) VALUES (?,?,?,?)",
+                (name, last_id, last_tombstone, datetime.now().isoformat(timespec='seconds')),
+            )
+            conn.execute("DELETE FROM completion_tombstones WHERE seq <= ?", (last_tombstone,))
+
+    def visit_history(self, date_from=None):
+        """All completions since ``date_from`` as ``(address, lat, lng, outcome, timestamp)`` tuples, oldest first."""
+        where_sql, params = self._where(date_from)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT address, lat, lng, outcome, timestamp FROM completions{where_sql} ORDER BY datetime(timestamp)", params).fetchall()
+
+    def columns(self, date_from=None, date_to=None):
+        """Rows for analytics: ``(address, lat, lng, outcome, amount, timestamp)``, oldest first."""
+        where_sql, params = self._where(date_from, date_to)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT address, lat, lng, outcome, amount, timestamp FROM completions{where_sql} ORDER BY datetime(timestamp)", params).fetchall()
+
+    def day_totals(self, year, month):
+        """``{date: (visits, pif_count, pif_amount)}`` for one month from a single grouped query.
+
+        Timestamps are ISO strings, so a plain string range on the indexed
+        column selects the month without calling ``datetime()`` per row.
+        """
+        first = date(year, month, 1)
+        following = date(year + month // 12, month % 12 + 1, 1)
+
+        def compute():
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT substr(timestamp, 1, 10) AS day, COUNT(*), SUM(outcome = 'PIF'), "
+                    "COALESCE(SUM(CASE WHEN outcome = 'PIF' THEN amount END), 0) "
+                    "FROM completions WHERE timestamp >= ? AND timestamp < ? GROUP BY day",
+                    (first.isoformat(), following.isoformat()),
+                ).fetchall()
+            totals = {}
+            for day, visits, pifs, amount in rows:
+                try:
+                    totals[date.fromisoformat(day)] = (int(visits), int(pifs or 0), float(amount or 0))
+                except ValueError:
+                    continue
+            return totals
+        return self.memo('day_totals', (year, month), compute)
+
+    def range_signature(self, date_from=None, date_to=None):
+        """Cheap fingerprint of a date range: changes whenever rows are added to or removed from it."""
+        where_sql, params = self._where(date_from, date_to)
+        with self._connect() as conn:
+            cur = conn.execute(f"SELECT COUNT(*), COALESCE(MAX(id), 0) FROM completions{where_sql}", params)
+            cnt, max_id = cur.fetchone()
+        return int(cnt), int(max_id)
+
 
 # -----------------------------
 # Utility date helpers
@@ -211,8 +487,254 @@ def end_of_month():
     return last
 
 
-class AddressCard(MDCard):
-    """Simplified, efficient address card with proper cleanup - Updated for GPS"""
+# -----------------------------
+# Startup timing
+# -----------------------------
+class StartupTimer:
+    """Records named startup phases and prints them once the list is populated."""
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.phases = []
+        self.reported = False
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000.0, (now - self.t0) * 1000.0))
+        self._last = now
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+        lines = [f"  {name:<22}{delta:8.1f} ms   (t+{total:.1f} ms)" for name, delta, total in self.phases]
+        logger.info("Startup: phases\n%s", "\n".join(lines))
+        logger.info("Startup: %s", import_time_report())
+
+
+def _startup_mark(phase, report=False):
+    app = MDApp.get_running_app()
+    timer = getattr(app, 'startup', None)
+    if timer:
+        timer.mark(phase)
+        if report:
+            timer.report()
+
+
+class SkeletonCard(Widget):
+    """Grey placeholder row shown until the saved list has been read"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint_y = None
+        self.height = dp(85)
+        with self.canvas:
+            Color(0.95, 0.95, 0.95, 1)
+            self._bg = RoundedRectangle(radius=[dp(6)])
+            Color(0.88, 0.88, 0.88, 1)
+            self._line1 = Rectangle()
+            self._line2 = Rectangle()
+        self.bind(pos=self._layout, size=self._layout)
+
+    def _layout(self, *args):
+        x, y = self.pos
+        w, h = self.size
+        self._bg.pos = (x, y)
+        self._bg.size = (w, h)
+        self._line1.pos = (x + dp(12), y + h - dp(30))
+        self._line1.size = (w * 0.7, dp(14))
+        self._line2.pos = (x + dp(12), y + dp(16))
+        self._line2.size = (dp(90), dp(12))
+
+
+# -----------------------------
+# Import normalisation - column-wise cleaning and validation of imported rows
+# -----------------------------
+# The gap is spacing only: a newline would let a postcode span two cells of a joined column.
+_POSTCODE_RE = re.compile(r'\b([A-Z]{1,2}[0-9][A-Z0-9]?)[^\S\n]*([0-9][A-Z]{2})\b', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_COMMA_RE = re.compile(r' *,[ ,]*')
+# Dropped from address keys: spacing of any kind (but not the newline that joins a column),
+# zero-width characters and punctuation that varies between exports of the same address.
+_ADDRESS_KEY_DROP_RE = re.compile(r"[^\S\n]|[,.;:'\"\-/#()&\u200b-\u200d\u2060\ufeff]")
+_EMPTY_CELLS = frozenset(('', 'none', 'null', 'nan', 'n/a', '-'))
+# Rows further than this (in degrees) from the bulk of the sheet are checked
+# for a lat/lng swap.
+_SWAP_TOLERANCE_DEG = 2.0
+
+
+def _normalise_postcode(match):
+    return f"{match.group(1).upper()} {match.group(2).upper()}"
+
+
+def address_key(text):
+    """Comparison key for an address: case, width, spacing and punctuation are folded away.
+
+    ``"1 High St."``, ``"1 HIGH ST"`` and ``"1\thigh  st"`` share a key.  Works
+    on a newline-joined column too, keeping one key per line.
+    """
+    return _ADDRESS_KEY_DROP_RE.sub("", unicodedata.normalize('NFKC', text).casefold())
+
+
+def _join_column(texts):
+    # Cells are newline-free once whitespace is collapsed, so a whole column
+    # can go through each regex as a single string.
+    return "\n".join(texts)
+
+
+def _clean_text_column(values):
+    texts = [" ".join(str(v).split()).strip(' ,') if v is not None else "" for v in values]
+    return _COMMA_RE.sub(', ', _join_column(texts)).split("\n")
+
+
+def _to_float_column(values):
+    out = []
+    append = out.append
+    for v in values:
+        if v is None or isinstance(v, bool):
+            append(None)
+            continue
+        try:
+            f = float(v) if isinstance(v, (int, float)) else float(str(v).strip())
+        except ValueError:
+            append(None)
+            continue
+        append(f if f == f else None)  # drop NaN
+    return out
+
+
+def _median(values):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2.0
+
+
+def normalise_import_columns(address_values, lat_values=None, lng_values=None):
+    """Clean whole imported columns and return ``(addresses, report)``.
+
+    Addresses get whitespace, comma and postcode normalisation; empty cells
+    are dropped.  Coordinates are range-checked, swapped lat/lng pairs are
+    corrected (both out-of-range swaps and rows that only make sense swapped
+    relative to the rest of the sheet), zero/invalid pairs are cleared and
+    obvious duplicates are flagged with ``duplicate_of``.
+    """
+    started = time.perf_counter()
+    n = len(address_values)
+    lat_values = lat_values if lat_values is not None else [None] * n
+    lng_values = lng_values if lng_values is not None else [None] * n
+    cleaned = _clean_text_column(address_values)
+    texts = _POSTCODE_RE.sub(_normalise_postcode, _join_column(cleaned)).split("\n")
+    dedupe_keys = address_key(_join_column(texts)).split("\n")
+    keep = [t.lower() not in _EMPTY_CELLS for t in texts]
+    lats = _to_float_column(lat_values)
+    lngs = _to_float_column(lng_values)
+
+    report = {
+        'rows': n,
+        'kept': 0,
+        'dropped_empty': keep.count(False),
+        'postcodes_normalised': sum(1 for k, a, b in zip(keep, cleaned, texts) if k and a != b),
+        'coords_valid': 0,
+        'coords_missing': 0,
+        'coords_swapped': 0,
+        'coords_zero': 0,
+        'coords_out_of_range': 0,
+        'duplicates': 0,
+        'issues': [],
+        'elapsed_ms': 0.0,
+    }
+    issues = report['issues']
+
+    # First pass: hard range checks; swap pairs that are only valid reversed.
+    for i in range(n):
+        if not keep[i]:
+            continue
+        lat, lng = lats[i], lngs[i]
+        if lat is None or lng is None:
+            lats[i] = lngs[i] = None
+            continue
+        if lat == 0:  # blank cells read as 0; an exact-zero latitude is never a real address
+            lats[i] = lngs[i] = None
+            report['coords_zero'] += 1
+            issues.append((i + 2, "zero coordinates"))
+        elif abs(lat) > 90 or abs(lng) > 180:
+            if abs(lng) <= 90 and abs(lat) <= 180:
+                lats[i], lngs[i] = lng, lat
+                report['coords_swapped'] += 1
+                issues.append((i + 2, "lat/lng swapped"))
+            else:
+                lats[i] = lngs[i] = None
+                report['coords_out_of_range'] += 1
+                issues.append((i + 2, "coordinates out of range"))
+
+    # Second pass: rows far from the sheet's centre that land on it when swapped.
+    valid = [i for i in range(n) if keep[i] and lats[i] is not None]
+    if len(valid) >= 3:
+        mid_lat = _median([lats[i] for i in valid])
+        mid_lng = _median([lngs[i] for i in valid])
+        tol = _SWAP_TOLERANCE_DEG
+        for i in valid:
+            lat, lng = lats[i], lngs[i]
+            if abs(lat - mid_lat) <= tol and abs(lng - mid_lng) <= tol:
+                continue
+            if abs(lng - mid_lat) <= tol and abs(lat - mid_lng) <= tol:
+                lats[i], lngs[i] = lng, lat
+                report['coords_swapped'] += 1
+                issues.append((i + 2, "lat/lng swapped"))
+
+    addresses = []
+    first_seen = {}
+    for i in range(n):
+        if not keep[i]:
+            continue
+        text = texts[i]
+        entry = {'address': text, 'lat': lats[i], 'lng': lngs[i]}
+        if lats[i] is None:
+            report['coords_missing'] += 1
+        else:
+            report['coords_valid'] += 1
+        key = dedupe_keys[i]
+        if key in first_seen:
+            entry['duplicate_of'] = first_seen[key]
+            report['duplicates'] += 1
+            issues.append((i + 2, f"duplicate of address {first_seen[key] + 1}"))
+        else:
+            first_seen[key] = len(addresses)
+        addresses.append(entry)
+
+    issues.sort()
+    report['kept'] = len(addresses)
+    report['elapsed_ms'] = (time.perf_counter() - started) * 1000.0
+    return addresses, report
+
+
+def describe_import_report(report):
+    parts = []
+    for key, label in (('coords_swapped', 'swapped'), ('coords_zero', 'zero'),
+                       ('coords_out_of_range', 'out of range'), ('duplicates', 'duplicates')):
+        if report.get(key):
+            parts.append(f"{report[key]} {label}")
+    return ", ".join(parts)
+
+
+def _card_status_style(status_info):
+    if status_info.get('is_active'):
+        return {'bg': (0.9, 0.95, 1.0, 1.0), 'elevation': 3, 'text': "ACTIVE", 'color': [0, 0.5, 0.8, 1]}
+    if status_info.get('is_completed'):
+        completion = status_info.get('completion', {})
+        outcome = completion.get('outcome', 'Done')
+        if outcome == "PIF":
+            amount = completion.get('amount', '')
+            return {'bg': (0.92, 1.0, 0.92, 1.0), 'elevation': 1, 'text': f"PIF £{amount}" if amount else "PIF", 'color': [0, 0.7, 0, 1]}
+        if outcome == "DA":
+            return {'bg': (1.0, 0.96, 0.96, 1.0), 'elevation': 1, 'text': "DA", 'color': [0.8, 0.1, 0.1, 1]}
+        return {'bg': (0.96, 0.96, 0.96, 1.0), 'elevation': 1, 'text': "Done", 'color': [0, 0.5, 0.8, 1]}
+    return {'bg': (1, 1, 1, 1), 'elevation': 2, 'text': "PENDING", 'color': [0.6, 0.6, 0.6, 1]}
+
+
+class AddressCard(RecycleDataViewBehavior, MDCard):
+    """Address card used as the RecycleView view class - Updated for GPS"""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.size_hint_y = None
@@ -251,34 +773,15 @@ class AddressCard(MDCard):
         self._update_appearance(status_info)
         self._update_buttons(status_info, callbacks)
 
+    def refresh_view_attrs(self, rv, index, data):
+        self.update_card(data['index'], data['address'], data['lat'], data['lng'], data['status'], data['callbacks'])
+
     def _update_appearance(self, status_info):
-        if status_info.get('is_active'):
-            self.md_bg_color = (0.9, 0.95, 1.0, 1.0)
-            self.elevation = 3
-            self.status_label.text = "ACTIVE"
-            self.status_label.text_color = [0, 0.5, 0.8, 1]
-        elif status_info.get('is_completed'):
-            self.elevation = 1
-            completion = status_info.get('completion', {})
-            outcome = completion.get('outcome', 'Done')
-            if outcome == "PIF":
-                self.md_bg_color = (0.92, 1.0, 0.92, 1.0)
-                amount = completion.get('amount', '')
-                self.status_label.text = f"PIF £{amount}" if amount else "PIF"
-                self.status_label.text_color = [0, 0.7, 0, 1]
-            elif outcome == "DA":
-                self.md_bg_color = (1.0, 0.96, 0.96, 1.0)
-                self.status_label.text = "DA"
-                self.status_label.text_color = [0.8, 0.1, 0.1, 1]
-            else:
-                self.md_bg_color = (0.96, 0.96, 0.96, 1.0)
-                self.status_label.text = "Done"
-                self.status_label.text_color = [0, 0.5, 0.8, 1]
-        else:
-            self.md_bg_color = (1, 1, 1, 1)
-            self.elevation = 2
-            self.status_label.text = "PENDING"
-            self.status_label.text_color = [0.6, 0.6, 0.6, 1]
+        style = _card_status_style(status_info)
+        self.md_bg_color = style['bg']
+        self.elevation = style['elevation']
+        self.status_label.text = style['text']
+        self.status_label.text_color = style['color']
 
     def _update_buttons(self, status_info, callbacks):
         try:
@@ -328,30 +831,1428 @@ class AddressCard(MDCard):
             self._action_callback = lambda x: activate_callback(self.address_index)
             self.action_button.bind(on_release=self._action_callback)
 
-    def reset_for_reuse(self):
+
+# -----------------------------
+# Canvas-drawn address card - one widget per row, no child layouts
+# -----------------------------
+_TEXT_PRIMARY = (0.13, 0.13, 0.13, 1)
+_TEXT_SECONDARY = (0.45, 0.45, 0.45, 1)
+_BUTTON_BLUE = (0.13, 0.59, 0.95, 1)
+_BUTTON_GREEN = (0, 0.7, 0, 1)
+_BUTTON_RED = (0.8, 0.1, 0.1, 1)
+_shared_textures = {}
+
+
+def _shared_text_texture(text, font_size, color):
+    """Render a short label once and reuse the texture on every card."""
+    key = (text, font_size, tuple(color))
+    texture = _shared_textures.get(key)
+    if texture is None:
+        label = CoreLabel(text=text, font_size=font_size, color=tuple(color))
+        label.refresh()
+        texture = label.texture
+        _shared_textures[key] = texture
+    return texture
+
+
+class LeanAddressCard(RecycleDataViewBehavior, Widget):
+    """Address card drawn straight onto the canvas.
+
+    The address line is the only per-card texture; status and button captions
+    come from a shared texture cache and the buttons are plain hit areas, so a
+    card costs one widget and no layout passes.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint_y = None
+        self.height = dp(85)
         self.address_index = None
         self.address_text = ""
         self.lat = None
         self.lng = None
-        self.opacity = 1
-        self.height = dp(85)
-        self.disabled = False
-        self.md_bg_color = (1, 1, 1, 1)
-        self.elevation = 2
+        self._callbacks = {}
+        self._status = _card_status_style({})
+        self._buttons = []
+        self._hit_areas = []
+        self._pressed = None
+        self._address_label = None
+        self._address_label_width = None
+        self._address_line = ""
+        self._eta = ""
+        with self.canvas:
+            self._shadow_color = Color(0, 0, 0, 0.08)
+            self._shadow = RoundedRectangle(radius=[dp(6)])
+            self._bg_color = Color(1, 1, 1, 1)
+            self._bg = RoundedRectangle(radius=[dp(6)])
+            self._press_color = Color(0, 0, 0, 0)
+            self._press_rect = Rectangle(size=(0, 0))
+            Color(1, 1, 1, 1)
+            self._address_rect = Rectangle(size=(0, 0))
+            self._status_rect = Rectangle(size=(0, 0))
+            self._eta_rect = Rectangle(size=(0, 0))
+            self._button_rects = [Rectangle(size=(0, 0)) for _ in range(3)]
+        self.bind(pos=self._layout, size=self._layout)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.update_card(data['index'], data['address'], data['lat'], data['lng'], data['status'], data['callbacks'], data.get('eta', ""))
+
+    def update_card(self, index, address, lat, lng, status_info, callbacks, eta=""):
+        self.address_index = index
+        self.address_text = address
+        self.lat = lat
+        self.lng = lng
+        self._callbacks = callbacks
+        self._eta = "" if status_info.get('is_completed') else eta
+        prefix = "◯ " if status_info.get('is_active') else ""
+        self._address_line = f"{prefix}{index + 1}. {address}"
+        self._status = _card_status_style(status_info)
+        self._bg_color.rgba = self._status['bg']
+        self._shadow_color.a = 0.04 * self._status['elevation']
+        buttons = [('navigate', "Navigate", _BUTTON_BLUE)]
+        if status_info.get('is_completed'):
+            buttons.append(('undo', "Undo", _TEXT_PRIMARY))
+        elif status_info.get('is_active'):
+            buttons.append(('complete', "Complete", _BUTTON_GREEN))
+            buttons.append(('cancel', "Cancel", _BUTTON_RED))
+        else:
+            buttons.append(('activate', "Set Active", _TEXT_PRIMARY))
+        self._buttons = buttons
+        self._layout()
+
+    def _render_address(self, width):
+        if self._address_label is None or self._address_label_width != width:
+            self._address_label = CoreLabel(font_size=sp(14), color=_TEXT_PRIMARY, text_size=(width, None), shorten=True, shorten_from='right', halign='left', max_lines=1)
+            self._address_label_width = width
+        label = self._address_label
+        if not self._address_line:
+            return None
+        if label.text != self._address_line or label.texture is None:
+            label.text = self._address_line
+            label.refresh()
+        return label.texture
+
+    def _layout(self, *args):
+        x, y = self.pos
+        w, h = self.size
+        pad = dp(12)
+        self._shadow.pos = (x, y - dp(1))
+        self._shadow.size = (w, h)
+        self._bg.pos = (x, y)
+        self._bg.size = (w, h)
+        self._press_color.a = 0
+        texture = self._render_address(max(1, int(w - 2 * pad)))
+        if texture is not None:
+            self._address_rect.texture = texture
+            self._address_rect.size = texture.size
+            self._address_rect.pos = (x + pad, y + h - pad - texture.height)
+        row_h = dp(28)
+        row_y = y + pad
+        status_tex = _shared_text_texture(self._status['text'], sp(12), self._status['color'])
+        self._status_rect.texture = status_tex
+        self._status_rect.size = status_tex.size
+        self._status_rect.pos = (x + pad + (dp(90) - status_tex.width) / 2, row_y + (row_h - status_tex.height) / 2)
+        self._hit_areas = []
+        right = x + w - pad
+        for rect in self._button_rects:
+            rect.size = (0, 0)
+        for rect, (action, caption, color) in zip(self._button_rects, reversed(self._buttons)):
+            bw = dp(60) if action == 'cancel' else dp(80)
+            bx = right - bw
+            tex = _shared_text_texture(caption.upper(), sp(11), color)
+            rect.texture = tex
+            rect.size = tex.size
+            rect.pos = (bx + (bw - tex.width) / 2, row_y + (row_h - tex.height) / 2)
+            self._hit_areas.append((action, bx, row_y, bw, row_h))
+            right = bx - dp(8)
+        self._eta_rect.size = (0, 0)
+        if self._eta:
+            eta_tex = _shared_text_texture(self._eta, sp(11), _TEXT_SECONDARY)
+            eta_x = x + pad + dp(96)
+            if eta_x + eta_tex.width <= right + dp(8):
+                self._eta_rect.texture = eta_tex
+                self._eta_rect.size = eta_tex.size
+                self._eta_rect.pos = (eta_x, row_y + (row_h - eta_tex.height) / 2)
+
+    def _hit_test(self, touch):
+        for area in self._hit_areas:
+            action, bx, by, bw, bh = area
+            if bx <= touch.x <= bx + bw and by <= touch.y <= by + bh:
+                return area
+        return None
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return False
+        area = self._hit_test(touch)
+        if area is None:
+            return False
+        action, bx, by, bw, bh = area
+        self._pressed = action
+        self._press_rect.pos = (bx, by)
+        self._press_rect.size = (bw, bh)
+        self._press_color.a = 0.08
+        touch.grab(self)
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return False
+        touch.ungrab(self)
+        self._press_color.a = 0
+        area = self._hit_test(touch)
+        action = self._pressed
+        self._pressed = None
+        if area is not None and area[0] == action:
+            self._fire(action)
+        return True
+
+    def _fire(self, action):
+        callbacks = self._callbacks
+        if action == 'navigate':
+            callbacks.get('navigate', lambda a, i, lat, lng: None)(self.address_text, self.address_index, self.lat, self.lng)
+        elif action == 'cancel':
+            callbacks.get('cancel', lambda: None)()
+        else:
+            callbacks.get(action, lambda i: None)(self.address_index)
+
+
+def _count_widgets(widget):
+    return sum(1 for _ in widget.walk(restrict=True))
+
+
+def benchmark_address_cards(card_classes=(AddressCard, LeanAddressCard), visible=12, frames=240):
+    """Compare per-frame cost of the card implementations.
+
+    Each card class fills a column of ``visible`` cards and, every frame,
+    every card is rebound to the next row as the RecycleView does while
+    scrolling.  Frame intervals are measured from Clock callbacks, so run
+    with the frame cap and vsync off to see the real cost::
+
+        KCFG_GRAPHICS_MAXFPS=0 KCFG_GRAPHICS_VSYNC=0 ADDRESS_NAV_BENCH=cards python main.py
+    """
+    from kivy.uix.boxlayout import BoxLayout
+    callbacks = {}
+    statuses = [
+        {'is_active': False, 'is_completed': False, 'completion': {}},
+        {'is_active': True, 'is_completed': False, 'completion': {}},
+        {'is_active': False, 'is_completed': True, 'completion': {'outcome': 'PIF', 'amount': '25.00'}},
+        {'is_active': False, 'is_completed': True, 'completion': {'outcome': 'DA', 'amount': ''}},
+    ]
+    rows = [
+        {'index': i, 'address': f"{i + 1} Example Street, Sample Town, AB{i % 9 + 1} {i % 7}CD", 'lat': 51.5, 'lng': -0.12,
+         'status': statuses[i % len(statuses)], 'callbacks': callbacks}
+        for i in range(visible + frames)
+    ]
+    root = BoxLayout(orientation='vertical', spacing=dp(8), padding=dp(12))
+    results = []
+    queue = list(card_classes)
+    state = {}
+
+    def start_next():
+        root.clear_widgets()
+        if not queue:
+            for res in results:
+                logger.info("Bench: %s: %d widgets/card, mean %.2f ms, p95 %.2f ms per frame",
+                            res['card'], res['widgets'], res['mean_ms'], res['p95_ms'])
+            MDApp.get_running_app().stop()
+            return
+        cls = queue.pop(0)
+        cards = [cls() for _ in range(visible)]
+        for card in cards:
+            root.add_widget(card)
+        state.update(cls=cls, cards=cards, frame=0, last=None, samples=[])
+        Clock.schedule_once(tick, 0)
+
+    def tick(dt):
+        now = time.perf_counter()
+        if state['last'] is not None:
+            state['samples'].append((now - state['last']) * 1000.0)
+        state['last'] = now
+        frame = state['frame']
+        if frame >= frames:
+            samples = sorted(state['samples'][5:]) or [0.0]
+            results.append({
+                'card': state['cls'].__name__,
+                'widgets': _count_widgets(state['cards'][0]),
+                'mean_ms': sum(samples) / len(samples),
+                'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            })
+            start_next()
+            return
+        for offset, card in enumerate(state['cards']):
+            card.refresh_view_attrs(None, offset, rows[frame + offset])
+        state['frame'] = frame + 1
+        Clock.schedule_once(tick, 0)
+
+    Clock.schedule_once(lambda dt: start_next(), 0.5)
+    return root
+
+
+class CardBenchmarkApp(MDApp):
+    def build(self):
+        self.theme_cls.theme_style = "Light"
+        self.theme_cls.primary_palette = "Blue"
+        return benchmark_address_cards()
+
+
+# -----------------------------
+# Route optimisation - nearest-neighbour seed, 2-opt and Or-opt under a time budget
+# -----------------------------
+EARTH_RADIUS_M = 6371000.0
+ROUTE_TIME_BUDGET_S = 0.4
+ROUTE_NEIGHBOURS = 10
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    p1, p2 = radians(lat1), radians(lat2)
+    a = sin((p2 - p1) / 2) ** 2 + cos(p1) * cos(p2) * sin(radians(lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * asin(min(1.0, sqrt(a)))
+
+
+def project_points(points):
+    """Project (lat, lng) pairs onto a local plane in metres.
+
+    An equirectangular projection about the points' mean latitude; over a
+    work area (tens of km) distances stay within a fraction of a percent of
+    haversine while costing a single ``hypot`` per pair.
+    """
+    if not points:
+        return [], []
+    lat0 = radians(sum(p[0] for p in points) / len(points))
+    kx = EARTH_RADIUS_M * cos(lat0)
+    xs = [radians(p[1]) * kx for p in points]
+    ys = [radians(p[0]) * EARTH_RADIUS_M for p in points]
+    return xs, ys
+
+
+def distance_matrix(points):
+    xs, ys = project_points(points)
+    pts = list(zip(xs, ys))
+    return [[hypot(x - ox, y - oy) for ox, oy in pts] for x, y in pts]
+
+
+def _path_length(order, d):
+    return sum(d[a][b] for a, b in zip(order, order[1:]))
+
+
+def _nearest_neighbour(d, first):
+    n = len(d)
+    unvisited = set(range(n))
+    unvisited.discard(first)
+    order = [first]
+    current = first
+    while unvisited:
+        row = d[current]
+        current = min(unvisited, key=row.__getitem__)
+        unvisited.discard(current)
+        order.append(current)
+    return order
+
+
+def _two_opt(order, d, neighbours, deadline):
+    """Open-path 2-opt restricted to each node's nearest neighbours; position 0 stays fixed."""
+    n = len(order)
+    pos = [0] * n
+    for i, node in enumerate(order):
+        pos[node] = i
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for i in range(1, n - 1):
+            a, b = order[i - 1], order[i]
+            d_ab = d[a][b]
+            for c in neighbours[a]:
+                j = pos[c]
+                if j <= i:
+                    continue
+                e = order[j + 1] if j + 1 < n else None
+                delta = d[a][c] - d_ab
+                if e is not None:
+                    delta += d[b][e] - d[c][e]
+                if delta < -1e-6:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    for k in range(i, j + 1):
+                        pos[order[k]] = k
+                    improved = True
+                    break
+            if time.perf_counter() >= deadline:
+                break
+    return order
+
+
+def _or_opt(order, d, neighbours, deadline):
+    """Move runs of 1-3 stops next to a nearer neighbour, in either direction."""
+    n = len(order)
+    pos = [0] * n
+    for i, node in enumerate(order):
+        pos[node] = i
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for seg_len in (1, 2, 3):
+            i = 1
+            while i + seg_len <= n and time.perf_counter() < deadline:
+                s, t = order[i], order[i + seg_len - 1]
+                p = order[i - 1]
+                nx = order[i + seg_len] if i + seg_len < n else None
+                removed_gain = d[p][s] + (d[t][nx] - d[p][nx] if nx is not None else 0.0)
+                best = None
+                for u in neighbours[s]:
+                    pu = pos[u]
+                    if i - 1 <= pu < i + seg_len:
+                        continue
+                    after = pu + 1 if pu + 1 != i else i + seg_len
+                    v = order[after] if after < n else None
+                    for first, last, reverse in ((s, t, False), (t, s, True)):
+                        added = d[u][first] + (d[last][v] - d[u][v] if v is not None else 0.0)
+                        gain = removed_gain - added
+                        if gain > 1e-6 and (best is None or gain > best[0]):
+                            best = (gain, u, reverse)
+                if best is not None:
+                    _, u, reverse = best
+                    segment = order[i:i + seg_len]
+                    if reverse:
+                        segment.reverse()
+                    del order[i:i + seg_len]
+                    k = order.index(u) + 1
+                    order[k:k] = segment
+                    for j, node in enumerate(order):
+                        pos[node] = j
+                    improved = True
+                i += 1
+    return order
+
+
+def optimise_route(points, start=None, time_budget=ROUTE_TIME_BUDGET_S):
+    """Order ``points`` ((lat, lng) pairs) into a short open route.
+
+    ``start`` is an optional (lat, lng) the route leaves from.  Returns
+    ``(order, info)`` where ``order`` lists positions into ``points`` and
+    ``info`` holds the seed and final lengths in metres and the time taken.
+    """
+    started = time.perf_counter()
+    if not points:
+        return [], {'stops': 0, 'initial_m': 0.0, 'length_m': 0.0, 'elapsed_ms': 0.0}
+    nodes = ([tuple(start)] if start is not None else []) + [tuple(p) for p in points]
+    offset = 1 if start is not None else 0
+    d = distance_matrix(nodes)
+    n = len(nodes)
+    k = min(ROUTE_NEIGHBOURS, n - 1)
+    neighbours = [sorted(range(n), key=row.__getitem__)[1:k + 1] for row in d]
+    order = _nearest_neighbour(d, 0)
+    initial = _path_length(order, d)
+    deadline = started + time_budget
+    if n > 3:
+        while time.perf_counter() < deadline:
+            before = _path_length(order, d)
+            _two_opt(order, d, neighbours, deadline)
+            _or_opt(order, d, neighbours, deadline)
+            if _path_length(order, d) >= before - 1e-6:
+                break
+    final = _path_length(order, d)
+    route = [node - offset for node in order if node >= offset]
+    return route, {
+        'stops': len(points),
+        'initial_m': initial,
+        'length_m': final,
+        'elapsed_ms': (time.perf_counter() - started) * 1000.0,
+    }
+
+
+# -----------------------------
+# Zone clustering - balanced k-means over projected coordinates
+# -----------------------------
+ZONE_TARGET_STOPS = 60
+ZONE_MAX_ITERATIONS = 12
+
+
+def _bisect_groups(members, xs, ys, k):
+    """Split ``members`` into ``k`` count-balanced groups by cutting the longer axis at a quantile."""
+    if k <= 1 or len(members) <= 1:
+        return [members]
+    span_x = max(xs[i] for i in members) - min(xs[i] for i in members)
+    span_y = max(ys[i] for i in members) - min(ys[i] for i in members)
+    axis = xs if span_x >= span_y else ys
+    ordered = sorted(members, key=axis.__getitem__)
+    left_k = k // 2
+    cut = len(ordered) * left_k // k
+    return _bisect_groups(ordered[:cut], xs, ys, left_k) + _bisect_groups(ordered[cut:], xs, ys, k - left_k)
+
+
+def cluster_zones(points, k=None, target=ZONE_TARGET_STOPS, max_iterations=ZONE_MAX_ITERATIONS):
+    """Partition (lat, lng) points into ``k`` compact zones of near-equal size.
+
+    Seeds come from recursive median bisection (already balanced), then
+    k-means rounds move the centres while a capacity-limited assignment keeps
+    every zone within ``ceil(n / k)`` stops: points with the most to lose
+    from their second choice are placed first. Zones are numbered north to
+    south. Returns ``(labels, info)`` with ``labels`` parallel to ``points``.
+    """
+    started = time.perf_counter()
+    n = len(points)
+    if k is None:
+        k = max(1, round(n / target))
+    k = max(1, min(k, n))
+    xs, ys = project_points(points)
+    labels = [0] * n
+    for zone, members in enumerate(_bisect_groups(list(range(n)), xs, ys, k)):
+        for i in members:
+            labels[i] = zone
+    capacity = -(-n // k)
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        sum_x, sum_y, counts = [0.0] * k, [0.0] * k, [0] * k
+        for i, zone in enumerate(labels):
+            sum_x[zone] += xs[i]
+            sum_y[zone] += ys[i]
+            counts[zone] += 1
+        centres = [(sum_x[z] / counts[z], sum_y[z] / counts[z]) if counts[z] else (0.0, 0.0) for z in range(k)]
+        ranked = []
+        for i in range(n):
+            x, y = xs[i], ys[i]
+            choices = sorted((hypot(x - cx, y - cy), z) for z, (cx, cy) in enumerate(centres))
+            regret = choices[1][0] - choices[0][0] if k > 1 else 0.0
+            ranked.append((-regret, i, choices))
+        ranked.sort()
+        room = [capacity] * k
+        new_labels = [0] * n
+        for _, i, choices in ranked:
+            for _, zone in choices:
+                if room[zone]:
+                    room[zone] -= 1
+                    new_labels[i] = zone
+                    break
+        if new_labels == labels:
+            break
+        labels = new_labels
+    top = [float('-inf')] * k
+    for i, zone in enumerate(labels):
+        top[zone] = max(top[zone], ys[i])
+    renumber = {zone: rank for rank, zone in enumerate(sorted(range(k), key=lambda z: -top[z]))}
+    labels = [renumber[zone] for zone in labels]
+    sizes = [0] * k
+    for zone in labels:
+        sizes[zone] += 1
+    info = {
+        'zones': k,
+        'sizes': sizes,
+        'iterations': iterations,
+        'elapsed_ms': (time.perf_counter() - started) * 1000.0,
+    }
+    return labels, info
+
+
+# -----------------------------
+# Capacity planning - visit times learnt from completion history
+# -----------------------------
+PLANNER_SHIFT_HOURS = 8.0
+PLANNER_HISTORY_DAYS = 90
+PLANNER_MIN_GAP_S = 15.0
+PLANNER_MAX_GAP_S = 45 * 60.0  # longer gaps are breaks, not visits
+PLANNER_MIN_SAMPLES = 5
+PLANNER_DEFAULT_VISIT_S = 6 * 60.0
+PLANNER_SPEED_MPS = 8.0  # average door-to-door travel, roughly 30 km/h in town
+
+
+class VisitTimeModel:
+    """Typical time on the doorstep, per outcome, mixed by each area's outcome history.
+
+    Built in one pass over completions ordered by time: the gap between two
+    completions on the same day, less the estimated travel between them, is
+    the time spent at the second address.
+    """
+    def __init__(self, rows, speed_mps=PLANNER_SPEED_MPS):
+        self.speed_mps = speed_mps
+        by_outcome = {}
+        outcome_counts = {}
+        area_counts = {}
+        self.samples = 0
+        previous = None
+        for address, lat, lng, outcome, ts in rows:
+            try:
+                when = datetime.fromisoformat(ts)
+            except (TypeError, ValueError):
+                continue
+            outcome = outcome or "Done"
+            area = postcode_district(address)
+            outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+            if area:
+                counts = area_counts.setdefault(area, {})
+                counts[outcome] = counts.get(outcome, 0) + 1
+            if previous and previous[0].date() == when.date():
+                gap = (when - previous[0]).total_seconds()
+                if lat is not None and lng is not None and previous[1] is not None and previous[2] is not None:
+                    gap -= haversine_m(previous[1], previous[2], lat, lng) / speed_mps
+                if PLANNER_MIN_GAP_S <= gap <= PLANNER_MAX_GAP_S:
+                    by_outcome.setdefault(outcome, []).append(gap)
+                    self.samples += 1
+            previous = (when, lat, lng)
+        self.outcome_seconds = {oc: _median(gaps) for oc, gaps in by_outcome.items()}
+        self.overall_seconds = _median([g for gaps in by_outcome.values() for g in gaps]) or PLANNER_DEFAULT_VISIT_S
+        self._global_mix = self._mix(outcome_counts)
+        self._area_mix = {area: self._mix(counts) for area, counts in area_counts.items() if sum(counts.values()) >= PLANNER_MIN_SAMPLES}
+
+    def _mix(self, counts):
+        total = sum(counts.values())
+        if not total:
+            return self.overall_seconds
+        return sum(self.outcome_seconds.get(oc, self.overall_seconds) * n for oc, n in counts.items()) / total
+
+    def visit_seconds(self, address_text):
+        return self._area_mix.get(postcode_district(address_text), self._global_mix)
+
+    def travel_seconds(self, distance_m):
+        return distance_m / self.speed_mps
+
+
+def plan_days(stops, model, shift_s=PLANNER_SHIFT_HOURS * 3600.0):
+    """Cut an ordered list of ``(index, address_text, lat, lng)`` stops into shifts.
+
+    Stops keep their route order; a day closes when the next stop's travel
+    plus visit would overrun ``shift_s``. Returns a list of day dicts with
+    ``stops``, ``visit_s``, ``travel_s`` and ``distance_m``.
+    """
+    days = []
+    day = None
+    last = None
+    for index, address_text, lat, lng in stops:
+        visit = model.visit_seconds(address_text)
+        distance = 0.0
+        if last is not None and lat is not None and lng is not None:
+            distance = haversine_m(last[0], last[1], lat, lng)
+        travel = model.travel_seconds(distance)
+        if day is None or (day['stops'] and day['visit_s'] + day['travel_s'] + travel + visit > shift_s):
+            day = {'stops': [], 'visit_s': 0.0, 'travel_s': 0.0, 'distance_m': 0.0}
+            days.append(day)
+            travel = distance = 0.0
+        day['stops'].append(index)
+        day['visit_s'] += visit
+        day['travel_s'] += travel
+        day['distance_m'] += distance
+        if lat is not None and lng is not None:
+            last = (lat, lng)
+    return days
+
+
+# -----------------------------
+# Completion analytics - columnar arrays and single-pass aggregates
+# -----------------------------
+OUTCOME_CODES = ("Done", "DA", "PIF")
+ANALYTICS_DEFAULT_DAYS = 90
+ANALYTICS_MIN_AREA_VISITS = 5
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+class CompletionColumns:
+    """A date range of completions held column-wise in typed arrays.
+
+    ``outcome`` holds indices into ``OUTCOME_CODES``; ``area`` holds indices
+    into ``areas`` (postcode districts, -1 when the address has none);
+    missing amounts are 0 and missing coordinates NaN.
+    """
+    def __init__(self, rows):
+        from array import array
+        self.when = []
+        self.ts = array('d')
+        self.outcome = array('b')
+        self.amount = array('d')
+        self.lat = array('d')
+        self.lng = array('d')
+        self.area = array('i')
+        self.areas = []
+        area_codes = {}
+        codes = {name: code for code, name in enumerate(OUTCOME_CODES)}
+        nan = float('nan')
+        for address, lat, lng, outcome, amount, ts in rows:
+            try:
+                when = datetime.fromisoformat(ts)
+            except (TypeError, ValueError):
+                continue
+            district = postcode_district(address)
+            if district is None:
+                area = -1
+            else:
+                area = area_codes.get(district)
+                if area is None:
+                    area = area_codes[district] = len(self.areas)
+                    self.areas.append(district)
+            self.when.append(when)
+            self.ts.append(when.timestamp())
+            self.outcome.append(codes.get(outcome, 0))
+            self.amount.append(amount or 0.0)
+            self.lat.append(nan if lat is None else lat)
+            self.lng.append(nan if lng is None else lng)
+            self.area.append(area)
+
+    def __len__(self):
+        return len(self.ts)
+
+
+def compute_analytics(cols):
+    """Heatmap, PIF trend, earnings rate and area conversion from ``CompletionColumns``.
+
+    Every aggregate is filled in the same pass over the columns; only the
+    per-day spans need a second, much smaller loop.
+    """
+    started = time.perf_counter()
+    pif = OUTCOME_CODES.index("PIF")
+    heatmap = [[0] * 24 for _ in range(7)]
+    heatmap_pif = [[0] * 24 for _ in range(7)]
+    earnings_by_hour = [0.0] * 24
+    weeks = {}
+    days = {}
+    n_areas = len(cols.areas)
+    area_visits = [0] * n_areas
+    area_pif = [0] * n_areas
+    area_amount = [0.0] * n_areas
+    total_amount = 0.0
+    total_pif = 0
+    for when, ts, outcome, amount, area in zip(cols.when, cols.ts, cols.outcome, cols.amount, cols.area):
+        weekday, hour = when.weekday(), when.hour
+        is_pif = outcome == pif
+        heatmap[weekday][hour] += 1
+        iso = when.isocalendar()
+        week = weeks.setdefault((iso[0], iso[1]), [0, 0, 0.0])
+        week[0] += 1
+        day = days.setdefault(when.date(), [ts, ts])
+        if ts < day[0]:
+            day[0] = ts
+        elif ts > day[1]:
+            day[1] = ts
+        total_amount += amount
+        earnings_by_hour[hour] += amount
+        week[2] += amount
+        if area >= 0:
+            area_visits[area] += 1
+            area_amount[area] += amount
+        if is_pif:
+            total_pif += 1
+            heatmap_pif[weekday][hour] += 1
+            week[1] += 1
+            if area >= 0:
+                area_pif[area] += 1
+    hours_worked = sum(last - first for first, last in days.values()) / 3600.0
+    trend = [
+        {'week': f"{year}-W{number:02d}", 'visits': visits, 'pif': pifs, 'rate': pifs / visits if visits else 0.0, 'amount': amount}
+        for (year, number), (visits, pifs, amount) in sorted(weeks.items())
+    ]
+    areas = sorted(
+        ({'area': cols.areas[a], 'visits': area_visits[a], 'pif': area_pif[a], 'rate': area_pif[a] / area_visits[a], 'amount': area_amount[a]}
+         for a in range(n_areas) if area_visits[a] >= ANALYTICS_MIN_AREA_VISITS),
+        key=lambda row: (-row['rate'], -row['visits']))
+    return {
+        'visits': len(cols),
+        'pif': total_pif,
+        'pif_rate': total_pif / len(cols) if len(cols) else 0.0,
+        'amount': total_amount,
+        'days': len(days),
+        'hours_worked': hours_worked,
+        'earnings_per_hour': total_amount / hours_worked if hours_worked else None,
+        'earnings_by_hour': earnings_by_hour,
+        'heatmap': heatmap,
+        'heatmap_pif': heatmap_pif,
+        'pif_trend': trend,
+        'areas': areas,
+        'elapsed_ms': (time.perf_counter() - started) * 1000.0,
+    }
+
+
+# -----------------------------
+# Spatial index - uniform grid over projected coordinates
+# -----------------------------
+SPATIAL_CELL_M = 250.0
+SPATIAL_MIN_SCAN_CELLS = 256  # ring cells a nearest query may visit before scanning every point instead
+ARRIVAL_RADIUS_M = 40.0
+
+
+class SpatialIndex:
+    """Grid buckets of address indices for nearest and radius queries.
+
+    Points are projected about the latitude the index was built at and
+    bucketed into ``cell_m`` squares; queries widen ring by ring until no
+    unvisited cell can hold anything closer, falling back to a plain scan
+    once the rings would cost more than visiting every point.  Entries are
+    added and removed individually as addresses complete or are undone.
+    """
+    def __init__(self, entries=(), cell_m=SPATIAL_CELL_M):
+        entries = list(entries)
+        self.cell_m = cell_m
+        lat0 = sum(lat for _, lat, _ in entries) / len(entries) if entries else 0.0
+        self._kx = EARTH_RADIUS_M * cos(radians(lat0))
+        self._cells = {}
+        self._points = {}
+        self._extent = None
+        for index, lat, lng in entries:
+            self.add(index, lat, lng)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __contains__(self, index):
+        return index in self._points
+
+    def _cell(self, lat, lng):
+        return (int(radians(lng) * self._kx // self.cell_m), int(radians(lat) * EARTH_RADIUS_M // self.cell_m))
+
+    def add(self, index, lat, lng):
+        if index in self._points:
+            self.remove(index)
+        cell = self._cell(lat, lng)
+        self._cells.setdefault(cell, set()).add(index)
+        self._points[index] = (lat, lng, cell)
+        if self._extent is None:
+            self._extent = [cell[0], cell[1], cell[0], cell[1]]
+        else:
+            ext = self._extent
+            ext[0], ext[1] = min(ext[0], cell[0]), min(ext[1], cell[1])
+            ext[2], ext[3] = max(ext[2], cell[0]), max(ext[3], cell[1])
+
+    def remove(self, index):
+        entry = self._points.pop(index, None)
+        if entry is None:
+            return
+        bucket = self._cells.get(entry[2])
+        if bucket is not None:
+            bucket.discard(index)
+            if not bucket:
+                del self._cells[entry[2]]
+
+    def _ring(self, cx, cy, r):
+        if r == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - r, cx + r + 1):
+            yield (x, cy - r)
+            yield (x, cy + r)
+        for y in range(cy - r + 1, cy + r):
+            yield (cx - r, y)
+            yield (cx + r, y)
+
+    def nearest(self, lat, lng, k=1, exclude=()):
+        """Return up to ``k`` ``(index, distance_m)`` pairs, closest first."""
+        if not self._points:
+            return []
+        cx, cy = self._cell(lat, lng)
+        ext = self._extent
+        max_r = max(abs(cx - ext[0]), abs(cx - ext[2]), abs(cy - ext[1]), abs(cy - ext[3]))
+        # Rings that do not reach the occupied extent are empty; start at the first one that does
+        r = max(0, ext[0] - cx, cx - ext[2], ext[1] - cy, cy - ext[3])
+        budget = max(SPATIAL_MIN_SCAN_CELLS, 4 * len(self._points))
+        found = []
+        while r <= max_r:
+            budget -= 8 * r or 1
+            if budget < 0:
+                return self._nearest_linear(lat, lng, k, exclude)
+            for cell in self._ring(cx, cy, r):
+                for index in self._cells.get(cell, ()):
+                    if index in exclude:
+                        continue
+                    plat, plng, _ = self._points[index]
+                    found.append((haversine_m(lat, lng, plat, plng), index))
+            found.sort()
+            # Anything in ring r+1 or beyond is at least r cells away.
+            if len(found) >= k and found[k - 1][0] <= r * self.cell_m:
+                break
+            r += 1
+        return [(index, dist) for dist, index in found[:k]]
+
+    def _nearest_linear(self, lat, lng, k, exclude):
+        found = nsmallest(k, ((haversine_m(lat, lng, plat, plng), index)
+                              for index, (plat, plng, _) in self._points.items() if index not in exclude))
+        return [(index, dist) for dist, index in found]
+
+    def within(self, lat, lng, radius_m):
+        """Return ``(index, distance_m)`` pairs within ``radius_m``, closest first."""
+        if not self._points:
+            return []
+        cx, cy = self._cell(lat, lng)
+        reach = int(radius_m // self.cell_m) + 1
+        hits = []
+        for x in range(cx - reach, cx + reach + 1):
+            for y in range(cy - reach, cy + reach + 1):
+                for index in self._cells.get((x, y), ()):
+                    plat, plng, _ = self._points[index]
+                    dist = haversine_m(lat, lng, plat, plng)
+                    if dist <= radius_m:
+                        hits.append((dist, index))
+        hits.sort()
+        return [(index, dist) for dist, index in hits]
+
+
+# -----------------------------
+# Distance annotations - straight-line distance and rough ETA per stop
+# -----------------------------
+ETA_RECALC_M = 75.0  # recompute the card labels only once the reference point moves this far
+ETA_DETOUR_FACTOR = 1.3  # roads are rarely straight
+
+
+def format_eta(distance_m):
+    """Short card label such as ``"350 m · 2 min"``; rounded so the shared texture cache stays small."""
+    minutes = max(1, round(distance_m * ETA_DETOUR_FACTOR / PLANNER_SPEED_MPS / 60.0))
+    # Round to the shown precision before choosing the unit, so 999 m reads "1.0 km" rather than "1000 m"
+    metres = int(round(distance_m / 50.0) * 50)
+    tenths_km = round(distance_m / 100.0)
+    if metres < 1000:
+        distance = f"{metres} m"
+    elif tenths_km < 100:
+        distance = f"{tenths_km / 10:.1f} km"
+    else:
+        distance = f"{round(distance_m / 1000.0)} km"
+    return f"{distance} · {minutes} min"
+
+
+def eta_labels(origin, points, skip_within_m=ARRIVAL_RADIUS_M):
+    """Labels for every (lat, lng) in ``points`` measured from ``origin`` in one pass.
+
+    Uses the same equirectangular approximation as the route code: one
+    ``hypot`` per point against a scale factor worked out once. Points
+    closer than ``skip_within_m`` get an empty label.
+    """
+    lat0, lng0 = origin
+    ky = radians(1.0) * EARTH_RADIUS_M
+    kx = ky * cos(radians(lat0))
+    labels = []
+    for lat, lng in points:
+        d = hypot((lng - lng0) * kx, (lat - lat0) * ky)
+        labels.append(format_eta(d) if d >= skip_within_m else "")
+    return labels
+
+
+# -----------------------------
+# GPS breadcrumb track - delta/zigzag/varint encoded per-day blobs
+# -----------------------------
+TRACK_SCALE = 100000  # fixed-point degrees: 1e-5 deg is about a metre
+TRACK_MIN_INTERVAL_S = 10
+TRACK_MIN_MOVE_M = 8.0
+TRACK_FLUSH_EVERY = 30
+TRACK_GAP_S = 10 * 60  # no fix for this long is a recording gap, not time worked
+TRACK_IDLE_SPEED_MPS = 0.5
+
+
+def _zigzag(n):
+    return (n << 1) ^ (n >> 63)
+
+
+def _unzigzag(n):
+    return (n >> 1) ^ -(n & 1)
+
+
+def _fixed_sample(t, lat, lng):
+    return int(round(t)), int(round(lat * TRACK_SCALE)), int(round(lng * TRACK_SCALE))
+
+
+def encode_track(samples, previous=(0, 0, 0)):
+    """Encode fixed-point ``(t, lat, lng)`` samples as varint zigzag deltas from ``previous``.
+
+    A fix a few seconds and metres from the last one costs three or four
+    bytes, so a full day at one fix per ten seconds stays in the low tens
+    of kilobytes. Encoded runs concatenate: encode the next batch from the
+    last sample of the one before.
+    """
+    out = bytearray()
+    pt, plat, plng = previous
+    for t, lat, lng in samples:
+        for delta in (t - pt, lat - plat, lng - plng):
+            n = _zigzag(delta)
+            while n > 0x7F:
+                out.append((n & 0x7F) | 0x80)
+                n >>= 7
+            out.append(n)
+        pt, plat, plng = t, lat, lng
+    return bytes(out)
+
+
+def decode_track(blob):
+    """Inverse of ``encode_track``: ``[(t, lat, lng), ...]`` with epoch seconds and float degrees."""
+    values = []
+    n = shift = 0
+    for byte in blob:
+        n |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(_unzigzag(n))
+        n = shift = 0
+    samples = []
+    t = lat = lng = 0
+    for i in range(0, len(values) - 2, 3):
+        t += values[i]
+        lat += values[i + 1]
+        lng += values[i + 2]
+        samples.append((t, lat / TRACK_SCALE, lng / TRACK_SCALE))
+    return samples
+
+
+def track_stats(samples):
+    """Distance travelled, moving and idle time from decoded samples in a single pass."""
+    distance = moving = idle = 0.0
+    previous = None
+    for t, lat, lng in samples:
+        if previous is not None:
+            dt = t - previous[0]
+            if 0 < dt <= TRACK_GAP_S:
+                step = haversine_m(previous[1], previous[2], lat, lng)
+                if step / dt < TRACK_IDLE_SPEED_MPS:
+                    idle += dt
+                else:
+                    moving += dt
+                    distance += step
+        previous = (t, lat, lng)
+    return {
+        'samples': len(samples),
+        'distance_m': distance,
+        'moving_s': moving,
+        'idle_s': idle,
+        'start': samples[0][0] if samples else None,
+        'end': samples[-1][0] if samples else None,
+    }
+
+
+class TrackStore:
+    """One row per day holding the encoded breadcrumb blob and its last sample."""
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.generation = 0  # bumped on every append so memoised day summaries notice new fixes
+        self._write_lock = threading.Lock()  # append is a read-modify-write of one row
+        self._ensure_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA journal_mode=WAL;')
+        conn.execute('PRAGMA synchronous=NORMAL;')
+        return conn
+
+    def _ensure_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tracks (
+                    day TEXT PRIMARY KEY,
+                    samples INTEGER,
+                    last_t INTEGER,
+                    last_lat INTEGER,
+                    last_lng INTEGER,
+                    data BLOB
+                );
+                """
+            )
+
+    def append(self, day, samples):
+        """Append fixed-point samples to a day's blob in one read-modify-write."""
+        if not samples:
+            return
+        with self._write_lock, self._connect() as conn:
+            row = conn.execute("SELECT samples, last_t, last_lat, last_lng, data FROM tracks WHERE day=?", (day,)).fetchone()
+            if row:
+                count, pt, plat, plng, data = row
+                blob = bytes(data) + encode_track(samples, (pt, plat, plng))
+                count += len(samples)
+            else:
+                blob = encode_track(samples)
+                count = len(samples)
+            t, lat, lng = samples[-1]
+            conn.execute("INSERT OR REPLACE INTO tracks (day, samples, last_t, last_lat, last_lng, data) VALUES (?,?,?,?,?,?)",
+                         (day, count, t, lat, lng, sqlite3.Binary(blob)))
+        self.generation += 1
+
+    def load(self, day):
+        with self._connect() as conn:
+            row = conn.execute("SELECT data FROM tracks WHERE day=?", (day,)).fetchone()
+        return decode_track(bytes(row[0])) if row and row[0] else []
+
+    def stats(self, day):
+        return track_stats(self.load(day))
+
+
+class TrackRecorder:
+    """Thins incoming fixes and writes them to a ``TrackStore`` in batches off the UI thread.
+
+    Background batches go through one writer thread so they land in the order they were recorded.
+    """
+    def __init__(self, store, day):
+        self.store = store
+        self.day = day
+        self._pending = []
+        self._last = None
+        self._queue = None
+
+    def add_fix(self, lat, lng, t=None):
+        t = time.time() if t is None else t
+        if self._last is not None:
+            lt, llat, llng = self._last
+            if t - lt < TRACK_MIN_INTERVAL_S or (haversine_m(llat, llng, lat, lng) < TRACK_MIN_MOVE_M and t - lt < TRACK_GAP_S / 2):
+                return False
+        self._last = (t, lat, lng)
+        self._pending.append(_fixed_sample(t, lat, lng))
+        if len(self._pending) >= TRACK_FLUSH_EVERY:
+            self.flush(background=True)
+        return True
+
+    def flush(self, background=False):
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if background:
+            if self._queue is None:
+                import queue
+                self._queue = queue.Queue()
+                threading.Thread(target=self._writer, daemon=True).start()
+            self._queue.put(batch)
+        else:
+            self.wait()
+            self._write(batch)
+
+    def wait(self):
+        """Block until every background batch has been written."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self):
+        """Write what is pending, wait for the writer and stop it; stats read afterwards are complete."""
+        self.flush()
+        if self._queue is not None:
+            self._queue.put(None)
+            self._queue.join()
+            self._queue = None
+
+    def _writer(self):
+        q = self._queue
+        while True:
+            batch = q.get()
+            try:
+                if batch is None:
+                    return
+                self._write(batch)
+            finally:
+                q.task_done()
+
+    def _write(self, batch):
         try:
-            self.nav_button.unbind(on_release=self._nav_callback)
-        except:
+            self.store.append(self.day, batch)
+        except Exception as e:
+            logger.warning("Track: write error: %s", e)
+
+
+if ANDROID_AVAILABLE:
+    class _LocationListener(PythonJavaClass):
+        __javainterfaces__ = ['android/location/LocationListener']
+        __javacontext__ = 'app'
+
+        def __init__(self, callback):
+            super().__init__()
+            self.callback = callback
+
+        @java_method('(Landroid/location/Location;)V')
+        def onLocationChanged(self, location):
+            self.callback(location.getLatitude(), location.getLongitude(), location.getTime() / 1000.0)
+
+        @java_method('(Ljava/lang/String;)V')
+        def onProviderEnabled(self, provider):
             pass
-        try:
-            self.action_button.unbind(on_release=self._action_callback)
-        except:
+
+        @java_method('(Ljava/lang/String;)V')
+        def onProviderDisabled(self, provider):
             pass
-        if hasattr(self, 'cancel_button') and self.cancel_button and self.cancel_button.parent:
+
+        @java_method('(Ljava/lang/String;ILandroid/os/Bundle;)V')
+        def onStatusChanged(self, provider, status, extras):
+            pass
+
+
+class LocationFeed:
+    """GPS fixes from the Android LocationManager, handed to ``on_fix(lat, lng, t)`` on the Kivy thread."""
+    def __init__(self, on_fix, min_time_ms=5000, min_distance_m=5.0):
+        self.on_fix = on_fix
+        self.min_time_ms = min_time_ms
+        self.min_distance_m = min_distance_m
+        self._manager = None
+        self._listener = None
+
+    def start(self):
+        if not ANDROID_AVAILABLE or self._listener is not None:
+            return False
+        try:
+            Context = autoclass('android.content.Context')
+            LocationManager = autoclass('android.location.LocationManager')
+            Looper = autoclass('android.os.Looper')
+            self._manager = PythonActivity.mActivity.getSystemService(Context.LOCATION_SERVICE)
+            self._listener = _LocationListener(self._deliver)
+            self._manager.requestLocationUpdates(LocationManager.GPS_PROVIDER, self.min_time_ms, float(self.min_distance_m), self._listener, Looper.getMainLooper())
+            return True
+        except Exception as e:
+            logger.warning("Location: start error: %s", e)
+            self._listener = None
+            return False
+
+    def stop(self):
+        if self._manager is not None and self._listener is not None:
             try:
-                self.cancel_button.unbind(on_release=self._cancel_callback)
-                self.bottom_row.remove_widget(self.cancel_button)
-            except:
-                pass
+                self._manager.removeUpdates(self._listener)
+            except Exception as e:
+                logger.warning("Location: stop error: %s", e)
+        self._listener = None
+
+    def _deliver(self, lat, lng, t):
+        Clock.schedule_once(lambda dt: self.on_fix(lat, lng, t), 0)
+
+
+# -----------------------------
+# Offline geocoding - postcode gazetteer with a SQLite memo table
+# -----------------------------
+GAZETTEER_FILENAME = "postcodes.csv"  # postcode,latitude,longitude (e.g. a UK postcode centroid export)
+
+
+def postcode_key(text):
+    """Compact upper-case form of the last postcode in ``text`` (``"SW1A1AA"``), or None."""
+    matches = _POSTCODE_RE.findall(text or "")
+    if not matches:
+        return None
+    outward, inward = matches[-1]
+    return (outward + inward).upper()
+
+
+def postcode_district(text):
+    """Outward code of the last postcode in ``text`` (``"SW1A"``), or None."""
+    matches = _POSTCODE_RE.findall(text or "")
+    return matches[-1][0].upper() if matches else None
+
+
+class GeocodeCache:
+    """Persistent postcode -> coordinate memo stored next to the completions.
+
+    Negative results are cached too (with NULL coordinates) so a postcode
+    missing from the gazetteer is not searched for again.
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._ensure_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA journal_mode=WAL;')
+        conn.execute('PRAGMA synchronous=NORMAL;')
+        return conn
+
+    def _ensure_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS geocode_cache (
+                    key TEXT PRIMARY KEY,
+                    lat REAL,
+                    lng REAL,
+                    source TEXT,
+                    updated TEXT
+                );
+                """
+            )
+
+    def get_many(self, keys):
+        """Return ``{key: (lat, lng) or None}`` for the keys that are cached."""
+        keys = list(keys)
+        found = {}
+        with self._connect() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, lat, lng in conn.execute(f"SELECT key, lat, lng FROM geocode_cache WHERE key IN ({placeholders})", chunk):
+                    found[key] = (lat, lng) if lat is not None and lng is not None else None
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, results, source="gazetteer"):
+        now = datetime.now().isoformat()
+        rows = [(key, coords[0] if coords else None, coords[1] if coords else None, source, now) for key, coords in results.items()]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO geocode_cache (key, lat, lng, source, updated) VALUES (?,?,?,?,?)", rows)
+
+    def stats(self):
+        with self._connect() as conn:
+            (entries,) = conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'entries': int(entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+def scan_gazetteer(path, wanted):
+    """Stream a postcode CSV once and return ``{key: (lat, lng)}`` for the wanted compact keys."""
+    found = {}
+    if not wanted or not path or not os.path.exists(path):
+        return found
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = [h.strip().lower() for h in next(reader, [])]
+        pc_col = next((i for i, h in enumerate(header) if 'postcode' in h or h in ('pcd', 'pcds')), 0)
+        lat_col = next((i for i, h in enumerate(header) if h.startswith('lat')), 1)
+        lng_col = next((i for i, h in enumerate(header) if h.startswith(('long', 'lng', 'lon'))), 2)
+        width = max(pc_col, lat_col, lng_col)
+        for row in reader:
+            if len(row) <= width:
+                continue
+            key = row[pc_col].replace(' ', '').upper()
+            if key in wanted:
+                try:
+                    found[key] = (float(row[lat_col]), float(row[lng_col]))
+                except ValueError:
+                    continue
+                if len(found) == len(wanted):
+                    break
+    return found
+
+
+def geocode_addresses(entries, cache, gazetteer_path):
+    """Resolve ``(index, address_text)`` entries by postcode.
+
+    Returns ``({index: (lat, lng)}, stats)``; lookups go to the cache first
+    and only the remaining postcodes are searched for in the gazetteer.
+    """
+    started = time.perf_counter()
+    keys = {}
+    for index, text in entries:
+        key = postcode_key(text)
+        if key:
+            keys[index] = key
+    wanted = set(keys.values())
+    hits_before, misses_before = cache.hits, cache.misses
+    known = cache.get_many(wanted)
+    missing = wanted - set(known)
+    if missing:
+        scanned = scan_gazetteer(gazetteer_path, missing)
+        if os.path.exists(gazetteer_path or ""):
+            cache.put_many({key: scanned.get(key) for key in missing})
+        known.update(scanned)
+    results = {index: known[key] for index, key in keys.items() if known.get(key)}
+    stats = {
+        'rows': len(entries),
+        'no_postcode': len(entries) - len(keys),
+        'cache_hits': cache.hits - hits_before,
+        'cache_misses': cache.misses - misses_before,
+        'resolved': len(results),
+        'unresolved': len(entries) - len(results),
+        'gazetteer_found': os.path.exists(gazetteer_path or ""),
+        'elapsed_ms': (time.perf_counter() - started) * 1000.0,
+    }
+    return results, stats
+
+
+# -----------------------------
+# Keyed list reconciliation - minimal edits to RecycleView data
+# -----------------------------
+# Beyond this many row edits a single data replacement is cheaper than
+# replaying individual inserts/removals through the RecycleView.
+RECONCILE_MAX_EDITS = 64
+
+
+def diff_keyed_rows(old_keys, new_keys):
+    """Return ``(removals, insertions)`` that turn ``old_keys`` into ``new_keys``.
+
+    ``removals`` are positions in ``old_keys``, highest first, and
+    ``insertions`` are ``(position, key)`` pairs in ``new_keys``, lowest
+    first; applying the removals and then the insertions in order yields
+    ``new_keys``.  Returns ``None`` when the surviving keys changed their
+    relative order, in which case the caller should replace the list.
+    """
+    new_set = set(new_keys)
+    old_set = set(old_keys)
+    removals = [pos for pos in range(len(old_keys) - 1, -1, -1) if old_keys[pos] not in new_set]
+    kept_old = [k for k in old_keys if k in new_set]
+    kept_new = [k for k in new_keys if k in old_set]
+    if kept_old != kept_new:
+        return None
+    insertions = [(pos, k) for pos, k in enumerate(new_keys) if k not in old_set]
+    return removals, insertions
+
+
+# -----------------------------
+# Address search index - trigram postings with incremental narrowing
+# -----------------------------
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+class AddressSearchIndex:
+    """Lower-cased token and trigram index over the loaded address texts.
+
+    ``search`` keeps the substring semantics of the old widget scan but
+    only verifies trigram candidates, and narrows from the results of a
+    cached query whenever the new query contains it (typing forwards or
+    deleting back to an earlier query).
+    """
+    GRAM = 3
+    HISTORY = 16
+
+    def __init__(self, texts):
+        self._texts = [t.lower() for t in texts]
+        self._tokens = [frozenset(_TOKEN_RE.findall(t)) for t in self._texts]
+        grams = {}
+        n = self.GRAM
+        for i, text in enumerate(self._texts):
+            for gram in {text[j:j + n] for j in range(len(text) - n + 1)}:
+                postings = grams.get(gram)
+                if postings is None:
+                    grams[gram] = [i]
+                else:
+                    postings.append(i)
+        self._grams = grams
+        self._history = OrderedDict()
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _candidates(self, query):
+        best = None
+        for previous, matches in self._history.items():
+            if previous in query and (best is None or len(previous) > len(best[0])):
+                best = (previous, matches)
+        if best is not None:
+            return best[1]
+        n = self.GRAM
+        if len(query) < n:
+            return range(len(self._texts))
+        postings = sorted((self._grams.get(query[j:j + n], ()) for j in range(len(query) - n + 1)), key=len)
+        if not postings[0]:
+            return ()
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            candidates.intersection_update(other)
+            if not candidates:
+                break
+        return sorted(candidates)
+
+    def _rank(self, query, index):
+        text = self._texts[index]
+        if query in self._tokens[index] or text.startswith(query):
+            return 0
+        pos = text.find(query)
+        return 1 if pos > 0 and not text[pos - 1].isalnum() else 2
+
+    def search(self, query, positions=None):
+        """Return the indices whose text contains ``query``, best matches first.
+
+        Equal-ranked matches keep list order, or the order given by
+        ``positions`` (index -> display position) when supplied.
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(range(len(self._texts)))
+        matches = self._history.get(query)
+        if matches is None:
+            texts = self._texts
+            matches = [i for i in self._candidates(query) if query in texts[i]]
+            self._history[query] = matches
+            if len(self._history) > self.HISTORY:
+                self._history.popitem(last=False)
+        else:
+            self._history.move_to_end(query)
+        if positions is not None:
+            return sorted(matches, key=lambda i: (self._rank(query, i), positions[i]))
+        return sorted(matches, key=lambda i: self._rank(query, i))
 
 
 class SearchField(MDTextField):
@@ -368,27 +2269,65 @@ class SearchField(MDTextField):
     def _on_text_change(self, instance, text):
         if self._search_event:
             self._search_event.cancel()
-        self._search_event = Clock.schedule_once(lambda dt: self._perform_search(text), 0.3)
+        self._search_event = Clock.schedule_once(lambda dt: self._perform_search(text), 0.15)
 
     def _perform_search(self, text):
-        query = text.strip().lower()
-        self.screen.current_search_query = query
-        visible_count = 0
-        for child in self.screen.address_layout.children:
-            if isinstance(child, AddressCard):
-                if not query or query in child.address_text.lower():
-                    child.opacity = 1
-                    child.height = dp(85)
-                    child.disabled = False
-                    visible_count += 1
-                else:
-                    child.opacity = 0
-                    child.height = 0
-                    child.disabled = True
-        if visible_count == 0 and query:
-            self.screen.show_no_results()
-        else:
-            self.screen.hide_no_results()
+        self.screen.current_search_query = text.strip().lower()
+        self.screen._reconcile_rows(changed=[])
+
+
+class DaySessionTally:
+    """Running totals for the active day session.
+
+    Entries are keyed by address index (dicts keep completion order), so
+    completing, undoing and reading the counts are all constant time; the
+    entry list is only materialised when the session is saved or ended.
+    """
+    def __init__(self, entries=()):
+        self.entries = {}
+        self.outcomes = {}
+        self.pif_pence = 0
+        for entry in entries:
+            self.add(entry)
+
+    @staticmethod
+    def _pence(entry):
+        try:
+            return int(round(float(entry.get('amount') or 0) * 100))
+        except (TypeError, ValueError):
+            return 0
+
+    def add(self, entry):
+        index = entry.get('index')
+        if index in self.entries:
+            self.remove(index)
+        self.entries[index] = entry
+        outcome = entry.get('outcome', 'Done')
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if outcome == 'PIF':
+            self.pif_pence += self._pence(entry)
+
+    def remove(self, index):
+        entry = self.entries.pop(index, None)
+        if entry is None:
+            return None
+        outcome = entry.get('outcome', 'Done')
+        self.outcomes[outcome] -= 1
+        if not self.outcomes[outcome]:
+            del self.outcomes[outcome]
+        if outcome == 'PIF':
+            self.pif_pence -= self._pence(entry)
+        return entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def pif_total(self):
+        return self.pif_pence / 100.0
+
+    def as_list(self):
+        return list(self.entries.values())
 
 
 class MainScreen(MDScreen):
@@ -399,10 +2338,30 @@ class MainScreen(MDScreen):
         self.completed_data = {}
         self.active_index = None
         self.current_search_query = ""
-        self.current_day_data = None
+        self.current_day_data = None  # active session: date, start_time, total_addresses
+        self._session = None  # DaySessionTally of the active session's completions
         self.day_history = {}
-        self._card_pool = []
-        self._active_cards = {}
+        self._row_keys = []  # address indices in the order they appear in address_list.data
+        self._search_index = None
+        self.route_order = []  # address indices in visiting order; empty means spreadsheet order
+        self._display_positions = None
+        self._route_running = False
+        self._spatial_index = None
+        self._geocoding = False
+        self._geocode_again = False
+        self.coords_generation = 0  # bumped whenever coordinates are filled into existing address dicts
+        self.zone_filter = None  # zone number the list is narrowed to; None shows every zone
+        self._clustering = False
+        self.current_position = None  # (lat, lng) of the device when a location fix is available
+        self._arrived_index = None  # pending address whose arrival radius the last fix was inside
+        self._etas = {}  # address index -> distance/ETA card label from _eta_origin
+        self._eta_origin = None
+        self._etas_stale = True
+        self.track_enabled = False  # record a GPS breadcrumb track while a day session is active
+        self.map_settings = {}  # map tile source overrides, see map_settings()
+        self._track_recorder = None
+        self._location_feed = None
+        self._welcome_card = None
         self._no_results_card = None
         self.data_file = "address_navigator_data.json"
         self.file_manager = None
@@ -411,17 +2370,59 @@ class MainScreen(MDScreen):
         self._payment_field = None
         self._current_completion_index = None
         self._day_tracking_dialog = None
-        self._setup_android_storage()
+        self._zone_dialog = None
+        self._plan_dialog = None
+        self._planning = False
+        self.last_import_report = None
+        self._card_callbacks = {
+            'navigate': self.navigate_to_address,
+            'activate': self.set_active_address,
+            'complete': self.show_completion_dialog,
+            'undo': self.undo_completion,
+            'cancel': self.cancel_active_address,
+        }
+        self._state_loaded = False
+        self._after_state_loaded = []
+        self._skeleton = None
+        self.storage_handler = None
+        self.chooser = None
+        # Staged start: toolbar and skeleton now, saved state from a worker thread, the rest after first paint
         self._setup_ui()
-        self._load_data()
-        self._update_display()
-        Clock.schedule_once(lambda dt: self._update_day_status_bar(), 0.2)
+        self._show_skeleton()
+        _startup_mark("main screen built")
+        Clock.schedule_once(lambda dt: self._start_state_load(), 0)
+        Clock.schedule_once(lambda dt: self._setup_android_storage(), 0.3)
         if platform == 'android' and ANDROID_AVAILABLE:
             Clock.schedule_once(self._request_permissions, 0.5)
 
+    def _show_skeleton(self):
+        box = MDBoxLayout(orientation='vertical', adaptive_height=True, spacing=dp(8), padding=[dp(12), dp(12)])
+        for _ in range(6):
+            box.add_widget(SkeletonCard())
+        self._skeleton = box
+        self.list_container.add_widget(box, index=len(self.list_container.children))
+
+    def _hide_skeleton(self):
+        if self._skeleton:
+            self.list_container.remove_widget(self._skeleton)
+            self._skeleton = None
+
+    def _start_state_load(self):
+        _startup_mark("state load started")
+        filepath = self._get_data_file_path()
+
+        def worker():
+            state = self._read_saved_state(filepath)
+            Clock.schedule_once(lambda dt: self._apply_saved_state(state), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _run_when_state_loaded(self, callback):
+        if self._state_loaded:
+            callback()
+        else:
+            self._after_state_loaded.append(callback)
+
     def _setup_android_storage(self):
-        self.storage_handler = None
-        self.chooser = None
         if platform == 'android' and ASK_AVAILABLE:
             try:
                 self.storage_handler = SharedStorage()
@@ -432,11 +2433,17 @@ class MainScreen(MDScreen):
     def _setup_ui(self):
         layout = MDBoxLayout(orientation='vertical')
         self.toolbar = MDTopAppBar(title="Address Navigator", size_hint_y=None, height=dp(56))
+        self.toolbar.use_overflow = True
         self.toolbar.right_action_items = [
-            ["folder-open", lambda x: self.load_file()],
-            ["playlist-check", lambda x: self.show_completed_screen()],
-            ["calendar-clock", lambda x: self.show_day_tracking_dialog()],
-            ["refresh", lambda x: self.refresh_display()],
+            ["folder-open", lambda x: self.load_file(), "Load file", "Load file"],
+            ["playlist-check", lambda x: self.show_completed_screen(), "Completed", "Completed"],
+            ["calendar-clock", lambda x: self.show_day_tracking_dialog(), "Day tracking", "Day tracking"],
+            ["crosshairs-gps", lambda x: self.navigate_to_nearest(), "Next nearest", "Next nearest"],
+            ["map-marker-path", lambda x: self.optimise_route_order(), "Optimise route", "Optimise route"],
+            ["vector-polygon", lambda x: self.show_zone_dialog(), "Zones", "Zones"],
+            ["calendar-multiselect", lambda x: self.show_plan_dialog(), "Plan days", "Plan days"],
+            ["map", lambda x: self.show_map_screen(), "Map", "Map"],
+            ["refresh", lambda x: self.refresh_display(), "Refresh", "Refresh"],
         ]
         layout.add_widget(self.toolbar)
         self.day_status_card = MDCard(size_hint_y=None, height=dp(0), opacity=0, elevation=1, padding=[dp(12), dp(6)])
@@ -453,82 +2460,528 @@ class MainScreen(MDScreen):
         self.search_field = SearchField(self)
         search_container.add_widget(self.search_field)
         layout.add_widget(search_container)
-        scroll = MDScrollView()
-        self.address_layout = MDBoxLayout(orientation='vertical', adaptive_height=True, spacing=dp(8), padding=[dp(12), dp(12)])
-        scroll.add_widget(self.address_layout)
-        layout.add_widget(scroll)
+        # Only the visible rows get an AddressCard; the RecycleView recycles them while scrolling
+        self.list_container = MDBoxLayout(orientation='vertical')
+        self.address_list = RecycleView(scroll_type=['bars', 'content'], bar_width=dp(4))
+        self.address_list.viewclass = LeanAddressCard
+        rv_layout = RecycleBoxLayout(orientation='vertical', default_size=(None, dp(85)), default_size_hint=(1, None), size_hint_y=None, spacing=dp(8), padding=[dp(12), dp(12)])
+        rv_layout.bind(minimum_height=rv_layout.setter('height'))
+        self.address_list.add_widget(rv_layout)
+        self.list_container.add_widget(self.address_list)
+        layout.add_widget(self.list_container)
         self.add_widget(layout)
-        self._init_file_manager()
 
     def _init_file_manager(self):
+        if self.file_manager is not None:
+            return
         try:
             self.file_manager = MDFileManager(exit_manager=self._close_file_manager, select_path=self._on_file_selected, preview=False)
         except:
             self.file_manager = None
 
-    def _get_card_from_pool(self):
-        if self._card_pool:
-            return self._card_pool.pop()
-        return AddressCard()
-
-    def _return_card_to_pool(self, card):
-        if len(self._card_pool) < 20:
-            card.reset_for_reuse()
-            self._card_pool.append(card)
-
     def show_progress(self, show=True):
         Animation(opacity=1 if show else 0, duration=0.2).start(self.progress_bar)
 
-    def _update_display(self):
-        self._clear_address_display()
-        if not self.addresses:
-            self._show_welcome_card()
-            return
-        callbacks = {
-            'navigate': self.navigate_to_address,
-            'activate': self.set_active_address,
-            'complete': self.show_completion_dialog,
-            'undo': self.undo_completion,
-            'cancel': self.cancel_active_address,
+    def _address_fields(self, index):
+        addr_data = self.addresses[index] if 0 <= index < len(self.addresses) else {}
+        if isinstance(addr_data, dict):
+            return addr_data.get('address', ''), addr_data.get('lat'), addr_data.get('lng')
+        return str(addr_data), None, None
+
+    def _make_row(self, index):
+        address_text, lat, lng = self._address_fields(index)
+        return {
+            'index': index,
+            'address': address_text,
+            'lat': lat,
+            'lng': lng,
+            'status': {
+                'is_active': index == self.active_index,
+                'is_completed': index in self.completed_data,
+                'completion': self.completed_data.get(index, {}),
+            },
+            'callbacks': self._card_callbacks,
+            'eta': self._etas.get(index, ""),
         }
-        for i, addr_data in enumerate(self.addresses):
+
+    def _display_order(self):
+        """Address indices in display order: the optimised route first, then anything it does not cover."""
+        if not self.route_order:
+            return range(len(self.addresses))
+        in_route = set(self.route_order)
+        return list(self.route_order) + [i for i in range(len(self.addresses)) if i not in in_route]
+
+    def _get_display_positions(self):
+        if self._display_positions is None:
+            positions = [0] * len(self.addresses)
+            for pos, index in enumerate(self._display_order()):
+                positions[index] = pos
+            self._display_positions = positions
+        return self._display_positions
+
+    def _visible_indices(self):
+        if self.current_search_query:
+            positions = self._get_display_positions() if self.route_order else None
+            candidates = self._get_search_index().search(self.current_search_query, positions)
+        else:
+            candidates = self._display_order()
+        completed = self.completed_data
+        if self.zone_filter is not None:
+            return [i for i in candidates if i not in completed and self._zone_of(i) == self.zone_filter]
+        return [i for i in candidates if i not in completed]
+
+    def _set_route_order(self, route_order):
+        self.route_order = [i for i in route_order if 0 <= i < len(self.addresses)]
+        self._display_positions = None
+
+    def _reference_position(self):
+        """Where a route or distance is measured from: the device, else the active or last completed address."""
+        if self.current_position is not None:
+            return self.current_position
+        candidates = []
+        if self.active_index is not None:
+            candidates.append(self.active_index)
+        if self.completed_data:
+            latest = max(self.completed_data.items(), key=lambda kv: kv[1].get('timestamp', '') if isinstance(kv[1], dict) else '')
+            candidates.append(latest[0])
+        for index in candidates:
+            _, lat, lng = self._address_fields(index)
+            if lat is not None and lng is not None:
+                return (lat, lng)
+        return None
+
+    def _refresh_etas(self):
+        """Recompute every card's distance/ETA label if the reference point moved past ETA_RECALC_M.
+
+        Returns True when the labels changed. Labels cover all located
+        addresses, so completing or undoing a stop never needs a recompute.
+        """
+        origin = self._reference_position()
+        if not self._etas_stale:
+            if origin == self._eta_origin:
+                return False
+            if origin is not None and self._eta_origin is not None and haversine_m(origin[0], origin[1], self._eta_origin[0], self._eta_origin[1]) < ETA_RECALC_M:
+                return False
+        self._etas_stale = False
+        self._eta_origin = origin
+        if origin is None:
+            changed = bool(self._etas)
+            self._etas = {}
+            return changed
+        indices = []
+        points = []
+        for i in range(len(self.addresses)):
+            _, lat, lng = self._address_fields(i)
+            if lat is not None and lng is not None:
+                indices.append(i)
+                points.append((lat, lng))
+        self._etas = dict(zip(indices, eta_labels(origin, points)))
+        return True
+
+    def _apply_etas(self):
+        """Patch the labels into the existing rows in place when they change."""
+        if not self._refresh_etas():
+            return
+        data = self.address_list.data
+        dirty = False
+        for row in data:
+            eta = self._etas.get(row['index'], "")
+            if row.get('eta') != eta:
+                row['eta'] = eta
+                dirty = True
+        if dirty:
+            self.address_list.refresh_from_data()
+
+    def _rebuild_spatial_index(self):
+        self._etas_stale = True
+        entries = []
+        for i in range(len(self.addresses)):
             if i in self.completed_data:
                 continue
-            card = self._get_card_from_pool()
-            status_info = {
-                'is_active': i == self.active_index,
-                'is_completed': i in self.completed_data,
-                'completion': self.completed_data.get(i, {}),
-            }
-            # Pass GPS coordinates to the card
-            address_text = addr_data.get('address', '') if isinstance(addr_data, dict) else str(addr_data)
-            lat = addr_data.get('lat') if isinstance(addr_data, dict) else None
-            lng = addr_data.get('lng') if isinstance(addr_data, dict) else None
-            card.update_card(i, address_text, lat, lng, status_info, callbacks)
-            self.address_layout.add_widget(card)
-            self._active_cards[i] = card
-        if self.current_search_query:
-            Clock.schedule_once(lambda dt: self.search_field._perform_search(self.current_search_query), 0.1)
+            _, lat, lng = self._address_fields(i)
+            if lat is not None and lng is not None:
+                entries.append((i, lat, lng))
+        self._spatial_index = SpatialIndex(entries)
 
-    def _clear_address_display(self):
-        for card in list(self._active_cards.values()):
+    def _spatial_add(self, index):
+        if self._spatial_index is None:
+            return
+        _, lat, lng = self._address_fields(index)
+        if lat is not None and lng is not None:
+            self._spatial_index.add(index, lat, lng)
+
+    def _spatial_remove(self, index):
+        if self._spatial_index is not None:
+            self._spatial_index.remove(index)
+
+    def nearest_pending(self, k=1, position=None):
+        """``(index, distance_m)`` for the ``k`` closest pending addresses, excluding the active one."""
+        position = position or self._reference_position()
+        if position is None or self._spatial_index is None:
+            return []
+        exclude = {self.active_index} if self.active_index is not None else ()
+        return self._spatial_index.nearest(position[0], position[1], k=k, exclude=exclude)
+
+    def check_arrival(self, lat, lng, radius_m=ARRIVAL_RADIUS_M):
+        """Return the pending address index within ``radius_m`` of a fix, if any."""
+        if self._spatial_index is None:
+            return None
+        hits = self._spatial_index.within(lat, lng, radius_m)
+        return hits[0][0] if hits else None
+
+    def update_position(self, lat, lng):
+        """Record a location fix and activate a pending address the device has arrived at."""
+        self.current_position = (lat, lng)
+        index = self.check_arrival(lat, lng)
+        # Only entering a radius counts: later fixes inside it must not undo a manual switch
+        if index != self._arrived_index:
+            self._arrived_index = index
+            if index is not None and index != self.active_index:
+                self.set_active_address(index)
+                toast(f"Arrived: {self._address_fields(index)[0][:40]}")
+        self._apply_etas()
+
+    def optimise_route_order(self):
+        if self._route_running:
+            return
+        pending = [i for i in range(len(self.addresses)) if i not in self.completed_data]
+        if self.zone_filter is not None:
+            pending = [i for i in pending if self._zone_of(i) == self.zone_filter]
+        located = []
+        points = []
+        for i in pending:
+            _, lat, lng = self._address_fields(i)
+            if lat is not None and lng is not None:
+                located.append(i)
+                points.append((lat, lng))
+        if len(located) < 2:
+            toast("Need at least two pending addresses with GPS coordinates")
+            return
+        start = self._reference_position()
+        located_set = set(located)
+        unlocated = [i for i in pending if i not in located_set]
+        addresses = self.addresses
+        self._route_running = True
+        self.show_progress(True)
+
+        def worker():
             try:
-                if card.parent:
-                    card.parent.remove_widget(card)
-            except Exception:
-                pass
-            self._return_card_to_pool(card)
-        self._active_cards.clear()
-        self.address_layout.clear_widgets()
+                order, info = optimise_route(points, start=start)
+                route = [located[k] for k in order] + unlocated
+                error = None
+            except Exception as e:
+                route, info, error = None, None, str(e)
+            Clock.schedule_once(lambda dt: self._on_route_optimised(addresses, route, info, error), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_route_optimised(self, addresses, route, info, error):
+        self._route_running = False
+        self.show_progress(False)
+        if error:
+            toast(f"Route optimisation failed: {error}")
+            return
+        if addresses is not self.addresses:
+            return
+        self._set_route_order(route)
+        self._reconcile_rows()
+        self._save_data()
+        saved = info['initial_m'] - info['length_m']
+        toast(f"Route: {info['stops']} stops, {info['length_m'] / 1000:.1f} km ({saved / 1000:.1f} km saved, {info['elapsed_ms']:.0f} ms)")
+
+    def _zone_of(self, index):
+        addr_data = self.addresses[index] if 0 <= index < len(self.addresses) else None
+        return addr_data.get('zone') if isinstance(addr_data, dict) else None
+
+    def _zone_counts(self):
+        """``{zone: [stops, pending]}`` for every clustered zone."""
+        counts = {}
+        for i in range(len(self.addresses)):
+            zone = self._zone_of(i)
+            if zone is None:
+                continue
+            entry = counts.setdefault(zone, [0, 0])
+            entry[0] += 1
+            if i not in self.completed_data:
+                entry[1] += 1
+        return counts
+
+    def cluster_addresses(self, zones=None, then=None):
+        """Split located addresses into balanced work zones off the UI thread."""
+        if self._clustering:
+            return
+        located = []
+        points = []
+        for i in range(len(self.addresses)):
+            _, lat, lng = self._address_fields(i)
+            if lat is not None and lng is not None:
+                located.append(i)
+                points.append((lat, lng))
+        if len(located) < 2:
+            toast("Need GPS coordinates to split addresses into zones")
+            return
+        addresses = self.addresses
+        self._clustering = True
+        self.show_progress(True)
+
+        def worker():
+            try:
+                labels, info = cluster_zones(points, k=zones)
+                error = None
+            except Exception as e:
+                labels, info, error = None, None, str(e)
+            Clock.schedule_once(lambda dt: self._on_clustered(addresses, located, labels, info, error, then), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_clustered(self, addresses, located, labels, info, error, then):
+        self._clustering = False
+        self.show_progress(False)
+        if error:
+            toast(f"Zone clustering failed: {error}")
+            return
+        if addresses is not self.addresses:
+            return
+        for addr_data in self.addresses:
+            if isinstance(addr_data, dict):
+                addr_data.pop('zone', None)
+        for i, zone in zip(located, labels):
+            self.addresses[i]['zone'] = zone
+        logger.info("Zones: %d zones, sizes %s, %d rounds, %.0f ms", info['zones'], info['sizes'], info['iterations'], info['elapsed_ms'])
+        self.set_zone_filter(None)
+        if then:
+            then()
+
+    def set_zone_filter(self, zone):
+        self.zone_filter = zone
+        self.toolbar.title = "Address Navigator" if zone is None else f"Zone {zone + 1}"
+        self._reconcile_rows()
+        self._save_data()
+        if self._zone_dialog:
+            self._zone_dialog.dismiss()
+
+    def show_zone_dialog(self):
+        if not self._state_loaded:
+            toast("Still loading saved data...")
+            return
+        counts = self._zone_counts()
+        if not counts:
+            self.cluster_addresses(then=self.show_zone_dialog)
+            return
+        content = MDBoxLayout(orientation='vertical', spacing=dp(4), adaptive_height=True)
+        pending = len(self.addresses) - len(self.completed_data)
+        content.add_widget(MDFlatButton(text=f"All addresses ({pending} pending)", on_release=lambda _: self.set_zone_filter(None)))
+        for zone in sorted(counts):
+            stops, left = counts[zone]
+            label = f"Zone {zone + 1}: {left} of {stops} pending"
+            if zone == self.zone_filter:
+                label += " (showing)"
+            content.add_widget(MDFlatButton(text=label, on_release=lambda _, z=zone: self.set_zone_filter(z)))
+
+        def recluster(_):
+            self._zone_dialog.dismiss()
+            self.cluster_addresses(then=self.show_zone_dialog)
+        dialog = MDDialog(title="Work Zones", type="custom", content_cls=content,
+                          buttons=[MDFlatButton(text="Re-cluster", on_release=recluster),
+                                   MDFlatButton(text="Close", on_release=lambda _: dialog.dismiss())])
+
+        def forget(*_):
+            # Any way out (buttons, back, tapping outside) forgets the dialog
+            if self._zone_dialog is dialog:
+                self._zone_dialog = None
+        dialog.bind(on_dismiss=forget)
+        self._zone_dialog = dialog
+        dialog.open()
+
+    def _assign_nearest_zones(self, indices):
+        """Put newly located addresses into the zone with the closest centre so a zone filter keeps showing them."""
+        if not indices:
+            return
+        sums = {}
+        for i in range(len(self.addresses)):
+            zone = self._zone_of(i)
+            if zone is None:
+                continue
+            _, lat, lng = self._address_fields(i)
+            if lat is None or lng is None:
+                continue
+            entry = sums.setdefault(zone, [0.0, 0.0, 0])
+            entry[0] += lat
+            entry[1] += lng
+            entry[2] += 1
+        if not sums:
+            return
+        centres = {zone: (slat / n, slng / n) for zone, (slat, slng, n) in sums.items()}
+        for i in indices:
+            addr_data = self.addresses[i]
+            if not isinstance(addr_data, dict) or addr_data.get('zone') is not None:
+                continue
+            _, lat, lng = self._address_fields(i)
+            if lat is not None and lng is not None:
+                addr_data['zone'] = min(centres, key=lambda z: haversine_m(lat, lng, *centres[z]))
+
+    def show_plan_dialog(self, shift_hours=PLANNER_SHIFT_HOURS):
+        """Split the pending stops, in route order, into days using visit times learnt from history."""
+        if not self._state_loaded:
+            toast("Still loading saved data...")
+            return
+        if self._planning:
+            return
+        app = MDApp.get_running_app()
+        stops = []
+        for i in self._display_order():
+            if i in self.completed_data or (self.zone_filter is not None and self._zone_of(i) != self.zone_filter):
+                continue
+            address_text, lat, lng = self._address_fields(i)
+            stops.append((i, address_text, lat, lng))
+        if not stops:
+            toast("No pending addresses to plan")
+            return
+        since = start_of_today() - timedelta(days=PLANNER_HISTORY_DAYS)
+        self._planning = True
+        self.show_progress(True)
+
+        def worker():
+            try:
+                started = time.perf_counter()
+                model = VisitTimeModel(app.db.visit_history(since))
+                days = plan_days(stops, model, shift_hours * 3600.0)
+                logger.info("Planner: %d stops into %d days from %d visits in %.0f ms",
+                            len(stops), len(days), model.samples, (time.perf_counter() - started) * 1000)
+                error = None
+            except Exception as e:
+                model, days, error = None, None, str(e)
+            Clock.schedule_once(lambda dt: self._on_plan_ready(model, days, shift_hours, error), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_plan_ready(self, model, days, shift_hours, error):
+        self._planning = False
+        self.show_progress(False)
+        if error:
+            toast(f"Planning failed: {error}")
+            return
+        content = MDBoxLayout(orientation='vertical', spacing=dp(6), adaptive_height=True)
+        if model.samples:
+            typical = ", ".join(f"{oc} {sec / 60:.0f} min" for oc, sec in sorted(model.outcome_seconds.items()))
+            basis = f"Typical visit: {typical} (from {model.samples} visits)"
+        else:
+            basis = f"No visit history yet - assuming {PLANNER_DEFAULT_VISIT_S / 60:.0f} min per visit"
+        content.add_widget(MDLabel(text=basis, font_size='12sp', theme_text_color="Secondary", adaptive_height=True))
+        for number, day in enumerate(days, 1):
+            hours = (day['visit_s'] + day['travel_s']) / 3600.0
+            content.add_widget(MDLabel(text=f"Day {number}: {len(day['stops'])} stops, {hours:.1f} h ({day['distance_m'] / 1000:.1f} km travel)", font_size='14sp', theme_text_color="Primary", adaptive_height=True))
+        hours_field = MDTextField(hint_text="Shift length (hours)", text=f"{shift_hours:g}", input_filter="float", size_hint_x=None, width=dp(200))
+        content.add_widget(hours_field)
+
+        def replan(_):
+            try:
+                hours = float(hours_field.text)
+            except ValueError:
+                toast("Enter a shift length in hours")
+                return
+            if hours <= 0:
+                toast("Shift length must be greater than 0")
+                return
+            self._plan_dialog.dismiss()
+            self.show_plan_dialog(hours)
+        self._plan_dialog = MDDialog(title=f"Plan: {len(days)} day{'s' if len(days) != 1 else ''}", type="custom", content_cls=content,
+                                     buttons=[MDFlatButton(text="Re-plan", on_release=replan),
+                                              MDFlatButton(text="Close", on_release=lambda _: self._plan_dialog.dismiss())])
+        self._plan_dialog.open()
+
+    def _address_texts(self):
+        return [a.get('address', '') if isinstance(a, dict) else str(a) for a in self.addresses]
+
+    def _get_search_index(self):
+        if self._search_index is None or len(self._search_index) != len(self.addresses):
+            self._search_index = AddressSearchIndex(self._address_texts())
+        return self._search_index
+
+    def _rebuild_search_index(self):
+        """Index the current addresses off the UI thread; search builds inline if it gets there first."""
+        self._search_index = None
+        addresses = self.addresses
+        texts = self._address_texts()
+
+        def build():
+            index = AddressSearchIndex(texts)
+            if self.addresses is addresses and self._search_index is None:
+                self._search_index = index
+        threading.Thread(target=build, daemon=True).start()
+
+    def _update_display(self):
+        if not self.addresses:
+            self._row_keys = []
+            self.address_list.data = []
+            self.hide_no_results()
+            self._show_welcome_card()
+            return
+        self._hide_welcome_card()
+        self._refresh_etas()
+        self._row_keys = self._visible_indices()
+        self.address_list.data = [self._make_row(i) for i in self._row_keys]
+        if self.current_search_query and not self._row_keys:
+            self.show_no_results()
+        else:
+            self.hide_no_results()
+
+    def _reconcile_rows(self, changed=None):
+        """Bring ``address_list.data`` in line with the visible indices.
+
+        Only rows that appear, disappear or are listed in ``changed`` are
+        touched; ``changed=None`` compares every surviving row instead.
+        """
+        if self._refresh_etas():
+            changed = None
+        new_keys = self._visible_indices()
+        diff = diff_keyed_rows(self._row_keys, new_keys)
+        if diff is None or len(diff[0]) + len(diff[1]) > RECONCILE_MAX_EDITS:
+            self._row_keys = new_keys
+            self.address_list.data = [self._make_row(i) for i in new_keys]
+        else:
+            removals, insertions = diff
+            data = self.address_list.data
+            for pos in removals:
+                del data[pos]
+            for pos, key in insertions:
+                data.insert(pos, self._make_row(key))
+            self._row_keys = new_keys
+            inserted = {key for _, key in insertions}
+            if changed is None:
+                for pos, key in enumerate(new_keys):
+                    if key not in inserted:
+                        row = self._make_row(key)
+                        if row != data[pos]:
+                            data[pos] = row
+            else:
+                for key in changed:
+                    if key not in inserted and key in new_keys:
+                        data[new_keys.index(key)] = self._make_row(key)
+        if self.current_search_query and not self._row_keys:
+            self.show_no_results()
+        else:
+            self.hide_no_results()
+
+    def _remove_row(self, index):
+        if index in self._row_keys:
+            pos = self._row_keys.index(index)
+            del self._row_keys[pos]
+            del self.address_list.data[pos]
 
     def _show_welcome_card(self):
+        if self._welcome_card:
+            return
         welcome_card = MDCard(size_hint_y=None, height=dp(160), elevation=2, padding=dp(20))
         layout = MDBoxLayout(orientation='vertical', spacing=dp(12))
         layout.add_widget(MDLabel(text="Welcome to Address Navigator", theme_text_color="Primary", font_style="H6", halign="center"))
         layout.add_widget(MDLabel(text="Load an Excel file with addresses and GPS coordinates to get started", theme_text_color="Secondary", halign="center"))
         layout.add_widget(MDRaisedButton(text="Load File", size_hint=(None, None), size=(dp(120), dp(36)), pos_hint={"center_x": 0.5}, on_release=lambda x: self.load_file()))
         welcome_card.add_widget(layout)
-        self.address_layout.add_widget(welcome_card)
+        self._welcome_card = welcome_card
+        self.list_container.add_widget(welcome_card, index=len(self.list_container.children))
+
+    def _hide_welcome_card(self):
+        if self._welcome_card:
+            self.list_container.remove_widget(self._welcome_card)
+            self._welcome_card = None
 
     def show_no_results(self):
         if self._no_results_card:
@@ -536,11 +2989,11 @@ class MainScreen(MDScreen):
         self._no_results_card = MDCard(size_hint_y=None, height=dp(80), elevation=1, padding=dp(16))
         label = MDLabel(text="No addresses match your search", theme_text_color="Secondary", halign="center")
         self._no_results_card.add_widget(label)
-        self.address_layout.add_widget(self._no_results_card, index=0)
+        self.list_container.add_widget(self._no_results_card, index=len(self.list_container.children))
 
     def hide_no_results(self):
         if self._no_results_card:
-            self.address_layout.remove_widget(self._no_results_card)
+            self.list_container.remove_widget(self._no_results_card)
             self._no_results_card = None
 
     def set_active_address(self, index):
@@ -552,6 +3005,7 @@ class MainScreen(MDScreen):
         if previous_active is not None:
             indices_to_update.append(previous_active)
         self._update_specific_cards(indices_to_update)
+        self._apply_etas()
         self._save_data()
 
     def cancel_active_address(self):
@@ -559,30 +3013,14 @@ class MainScreen(MDScreen):
             previous_active = self.active_index
             self.active_index = None
             self._update_specific_cards([previous_active])
+            self._apply_etas()
             self._save_data()
             toast("Active address cancelled")
 
     def _update_specific_cards(self, indices):
-        callbacks = {
-            'navigate': self.navigate_to_address,
-            'activate': self.set_active_address,
-            'complete': self.show_completion_dialog,
-            'undo': self.undo_completion,
-            'cancel': self.cancel_active_address,
-        }
         for index in indices:
-            if index in self._active_cards:
-                card = self._active_cards[index]
-                status_info = {
-                    'is_active': index == self.active_index,
-                    'is_completed': index in self.completed_data,
-                    'completion': self.completed_data.get(index, {}),
-                }
-                addr_data = self.addresses[index] if index < len(self.addresses) else {}
-                address_text = addr_data.get('address', '') if isinstance(addr_data, dict) else str(addr_data)
-                lat = addr_data.get('lat') if isinstance(addr_data, dict) else None
-                lng = addr_data.get('lng') if isinstance(addr_data, dict) else None
-                card.update_card(index, address_text, lat, lng, status_info, callbacks)
+            if index in self._row_keys:
+                self.address_list.data[self._row_keys.index(index)] = self._make_row(index)
 
     def show_completion_dialog(self, index):
         if not self._completion_dialog:
@@ -647,16 +3085,11 @@ class MainScreen(MDScreen):
             addr_data = self.addresses[index]
             address_text = addr_data.get('address', '') if isinstance(addr_data, dict) else str(addr_data)
             address_completion = {'index': index, 'address': address_text, 'outcome': outcome, 'amount': amount, 'timestamp': completion_time}
-            self.current_day_data['addresses_completed'].append(address_completion)
+            self._session.add(address_completion)
             self._update_day_status_bar()
-        if index in self._active_cards:
-            try:
-                card = self._active_cards.pop(index)
-                if card.parent:
-                    card.parent.remove_widget(card)
-                self._return_card_to_pool(card)
-            except Exception:
-                pass
+        self._remove_row(index)
+        self._spatial_remove(index)
+        self._apply_etas()
         if self.active_index == index:
             prev_active = self.active_index
             self.active_index = None
@@ -670,27 +3103,27 @@ class MainScreen(MDScreen):
                 lat = addr_data.get('lat') if isinstance(addr_data, dict) else None
                 lng = addr_data.get('lng') if isinstance(addr_data, dict) else None
                 app.db.insert_completion(index, address_text, lat, lng, outcome, float(amount) if amount else None, completion_time)
+                app.start_summary_prefetch()
         except Exception as e:
-            print(f"DB insert error: {e}")
+            logger.warning("DB: insert error: %s", e)
         self._save_data()
         toast(f"Address marked as {outcome}")
 
     def undo_completion(self, index):
         if index in self.completed_data:
             if self.current_day_data:
-                self.current_day_data['addresses_completed'] = [addr for addr in self.current_day_data['addresses_completed'] if addr.get('index') != index]
+                self._session.remove(index)
                 self._update_day_status_bar()
             del self.completed_data[index]
             try:
                 app = MDApp.get_running_app()
                 if hasattr(app, 'db') and app.db:
                     app.db.delete_latest_by_idx(index)
+                    app.start_summary_prefetch()
             except Exception as e:
-                print(f"DB delete error: {e}")
-            if index not in self._active_cards:
-                self._update_display()
-            else:
-                self._update_specific_cards([index])
+                logger.warning("DB: delete error: %s", e)
+            self._spatial_add(index)
+            self._reconcile_rows(changed=[index])
             self._save_data()
             toast("Completion undone")
 
@@ -723,6 +3156,19 @@ class MainScreen(MDScreen):
             except:
                 toast("Unable to open maps")
 
+    def navigate_to_nearest(self):
+        if self._reference_position() is None:
+            toast("No current position - set an address with GPS coordinates active first")
+            return
+        nearest = self.nearest_pending(k=1)
+        if not nearest:
+            toast("No pending addresses with GPS coordinates")
+            return
+        index, distance = nearest[0]
+        address_text, lat, lng = self._address_fields(index)
+        toast(f"Nearest: {index + 1}. {address_text[:40]} ({distance / 1000:.1f} km)")
+        self.navigate_to_address(address_text, index, lat, lng)
+
     def _open_android_maps_gps(self, lat, lng):
         try:
             intent = Intent()
@@ -749,21 +3195,71 @@ class MainScreen(MDScreen):
 
     def _update_day_status_bar(self):
         if self.current_day_data:
-            try:
-                completed_today = len(self.current_day_data['addresses_completed'])
-            except Exception:
-                completed_today = 0
+            completed_today = len(self._session)
             try:
                 start_time = datetime.fromisoformat(self.current_day_data.get('start_time', datetime.now().isoformat()))
                 start_str = start_time.strftime('%H:%M')
             except Exception:
                 start_str = "--:--"
-            self.day_status_label.text = f"Day started: {start_str} • Completed: {completed_today}"
+            self.day_status_label.text = f"Day started: {start_str} • Completed: {completed_today} • £{self._session.pif_total:.2f}"
             Animation(opacity=1, height=dp(40), duration=0.3).start(self.day_status_card)
         else:
             Animation(opacity=0, height=dp(0), duration=0.3).start(self.day_status_card)
 
+    def _start_tracking(self):
+        if not (self.track_enabled and self.current_day_data) or self._track_recorder is not None:
+            return
+        app = MDApp.get_running_app()
+        self._track_recorder = TrackRecorder(app.get_track_store(), self.current_day_data['date'])
+        if self._location_feed is None:
+            self._location_feed = LocationFeed(self._on_location_fix)
+        if platform == 'android' and ANDROID_AVAILABLE:
+            def on_permissions(permissions, grants):
+                Clock.schedule_once(lambda dt: self._start_location_feed() if any(grants) else toast("Location permission denied - track not recorded"), 0)
+            try:
+                request_permissions([Permission.ACCESS_FINE_LOCATION, Permission.ACCESS_COARSE_LOCATION], on_permissions)
+            except Exception as e:
+                logger.warning("Location: permission error: %s", e)
+
+    def _start_location_feed(self):
+        if self._track_recorder is not None and not self._location_feed.start():
+            toast("Location unavailable - track not recorded")
+
+    def _stop_tracking(self):
+        """Stop the location feed, flush the track and return its stats (None if nothing was recorded)."""
+        if self._location_feed is not None:
+            self._location_feed.stop()
+        recorder, self._track_recorder = self._track_recorder, None
+        if recorder is None:
+            return None
+        recorder.close()
+        try:
+            stats = recorder.store.stats(recorder.day)
+        except Exception as e:
+            logger.warning("Track: stats error: %s", e)
+            return None
+        return stats if stats['samples'] else None
+
+    def _on_location_fix(self, lat, lng, t):
+        if self._track_recorder is not None:
+            self._track_recorder.add_fix(lat, lng, t)
+        self.update_position(lat, lng)
+
+    def toggle_track_recording(self):
+        self.track_enabled = not self.track_enabled
+        if self.track_enabled:
+            self._start_tracking()
+        else:
+            self._stop_tracking()
+        self._save_data()
+        toast("GPS track recording on" if self.track_enabled else "GPS track recording off")
+        if getattr(self, '_day_dialog', None):
+            self._day_dialog.dismiss()
+
     def show_day_tracking_dialog(self):
+        if not self._state_loaded:
+            toast("Still loading saved data...")
+            return
         content = MDBoxLayout(orientation='vertical', spacing=dp(12), adaptive_height=True)
         if self.current_day_data:
             try:
@@ -771,7 +3267,7 @@ class MainScreen(MDScreen):
                 started = start_dt.strftime('%H:%M')
             except Exception:
                 started = '--:--'
-            completed = len(self.current_day_data.get('addresses_completed', []))
+            completed = len(self._session)
             status = MDLabel(text=f"Day started at {started}, completed: {completed}", theme_text_color="Primary")
         else:
             status = MDLabel(text="No active day session", theme_text_color="Primary")
@@ -786,6 +3282,8 @@ class MainScreen(MDScreen):
             start_btn = MDRaisedButton(text="Start Day", on_release=lambda _: self.start_new_day())
             btn_row.add_widget(start_btn)
         content.add_widget(btn_row)
+        track_btn = MDFlatButton(text=f"GPS track: {'On' if self.track_enabled else 'Off'}", on_release=lambda _: self.toggle_track_recording())
+        content.add_widget(track_btn)
         self._day_dialog = MDDialog(title="Day Tracking", type="custom", content_cls=content,
                                     buttons=[MDFlatButton(text="Close", on_release=lambda _: self._day_dialog.dismiss())])
         self._day_dialog.open()
@@ -799,11 +3297,12 @@ class MainScreen(MDScreen):
         self.current_day_data = {
             'date': today,
             'start_time': start_time,
-            'addresses_completed': [],
             'total_addresses': len(self.addresses)
         }
+        self._session = DaySessionTally()
         self._save_data()
         self._update_day_status_bar()
+        self._start_tracking()
         toast(f"Day started at {datetime.now().strftime('%H:%M')}")
         try:
             if hasattr(self, '_day_dialog') and self._day_dialog:
@@ -819,11 +3318,8 @@ class MainScreen(MDScreen):
         start_dt = datetime.fromisoformat(self.current_day_data['start_time'])
         end_dt = datetime.fromisoformat(end_time)
         duration_seconds = (end_dt - start_dt).total_seconds()
-        outcomes = {}
-        for entry in self.current_day_data['addresses_completed']:
-            out = entry.get('outcome', 'Done')
-            outcomes[out] = outcomes.get(out, 0) + 1
-        completion_count = len(self.current_day_data['addresses_completed'])
+        outcomes = dict(self._session.outcomes)
+        completion_count = len(self._session)
         total_count = max(1, self.current_day_data.get('total_addresses', 1))
         completion_rate = completion_count / total_count * 100.0
         summary = {
@@ -831,11 +3327,15 @@ class MainScreen(MDScreen):
             'start_time': self.current_day_data['start_time'],
             'end_time': end_time,
             'duration_seconds': duration_seconds,
-            'addresses_completed': list(self.current_day_data['addresses_completed']),
+            'addresses_completed': self._session.as_list(),
             'total_addresses': total_count,
             'outcomes_summary': outcomes,
             'completion_rate': completion_rate,
+            'pif_total': self._session.pif_total,
         }
+        track = self._stop_tracking()
+        if track:
+            summary['track'] = track
         day_key = self.current_day_data['date']
         if not self.day_history.get(day_key):
             self.day_history[day_key] = []
@@ -843,7 +3343,9 @@ class MainScreen(MDScreen):
             self.day_history[day_key] = [self.day_history[day_key]]
         self.day_history[day_key].append(summary)
         self.current_day_data = None
+        self._session = None
         self._save_data()
+        MDApp.get_running_app().start_summary_prefetch()
         self._update_day_status_bar()
         hrs = int(duration_seconds // 3600)
         mins = int((duration_seconds % 3600) // 60)
@@ -862,7 +3364,7 @@ class MainScreen(MDScreen):
         total_sessions = sum(len(v) if isinstance(v, list) else 1 for v in self.day_history.values())
         msg = f"History: {total_days} days, {total_sessions} sessions"
         if self.current_day_data:
-            current_completed = len(self.current_day_data['addresses_completed'])
+            current_completed = len(self._session)
             msg += f" • Today: {current_completed} completed"
         toast(msg)
         try:
@@ -880,6 +3382,14 @@ class MainScreen(MDScreen):
             self.manager.add_widget(summary_screen)
         self.manager.current = "completed_summary"
 
+    def show_map_screen(self):
+        if not hasattr(self, 'manager') or self.manager is None:
+            return
+        app = MDApp.get_running_app()
+        if not any(screen.name == "map" for screen in self.manager.screens):
+            self.manager.add_widget(MapScreen(app, name="map"))
+        self.manager.current = "map"
+
     # File handling methods - Updated to handle GPS coordinates
     def load_file(self):
         if platform == 'android' and hasattr(self, 'chooser') and self.chooser:
@@ -888,6 +3398,7 @@ class MainScreen(MDScreen):
                 return
             except Exception:
                 pass
+        self._init_file_manager()
         if not self.file_manager:
             toast("File manager not available")
             return
@@ -948,7 +3459,6 @@ class MainScreen(MDScreen):
         self.show_progress(True)
         def load_background():
             try:
-                addresses = []
                 workbook = load_workbook(file_path, read_only=True, data_only=True)
                 worksheet = workbook.active
                 rows = list(worksheet.iter_rows(values_only=True))
@@ -979,38 +3489,26 @@ class MainScreen(MDScreen):
                     elif 'lng' in hdr or 'lon' in hdr or ('long' in hdr and 'lat' not in hdr):
                         lng_col = i
                 
-                # Process data rows
-                for row in rows[1:]:
-                    if len(row) > address_col and row[address_col]:
-                        addr = str(row[address_col]).strip()
-                        if addr and addr.lower() not in ['none', 'null', '']:
-                            # Get GPS coordinates if available
-                            lat = None
-                            lng = None
-                            try:
-                                if lat_col is not None and len(row) > lat_col and row[lat_col] is not None:
-                                    lat = float(row[lat_col])
-                                if lng_col is not None and len(row) > lng_col and row[lng_col] is not None:
-                                    lng = float(row[lng_col])
-                            except (ValueError, TypeError):
-                                lat = None
-                                lng = None
-                            
-                            # Store as dictionary with address and GPS data
-                            addresses.append({
-                                'address': addr,
-                                'lat': lat,
-                                'lng': lng
-                            })
+                # Normalise and validate whole columns in one batch
+                data_rows = rows[1:]
+                def column(col):
+                    if col is None:
+                        return None
+                    return [row[col] if len(row) > col else None for row in data_rows]
+                addresses, report = normalise_import_columns(column(address_col), column(lat_col), column(lng_col))
                 
-                Clock.schedule_once(lambda dt, addrs=addresses: self._load_addresses_data(addrs), 0)
+                Clock.schedule_once(lambda dt, addrs=addresses, rep=report: self._load_addresses_data(addrs, rep), 0)
             except Exception as e:
                 Clock.schedule_once(lambda dt: toast(f"Error reading Excel: {str(e)}"), 0)
                 Clock.schedule_once(lambda dt: self.show_progress(False), 0)
         threading.Thread(target=load_background, daemon=True).start()
 
-    def _load_addresses_data(self, addresses):
+    def _load_addresses_data(self, addresses, report=None):
+        if not self._state_loaded:
+            self._run_when_state_loaded(lambda: self._load_addresses_data(addresses, report))
+            return
         self.show_progress(False)
+        self.last_import_report = report
         if not addresses:
             toast("No addresses found in file")
             return
@@ -1019,7 +3517,12 @@ class MainScreen(MDScreen):
         gps_count = sum(1 for addr in addresses if addr.get('lat') is not None and addr.get('lng') is not None)
         
         self.addresses = addresses
+        self._set_route_order([])
+        self.zone_filter = None
+        self.toolbar.title = "Address Navigator"
+        self._rebuild_search_index()
         self.completed_data = {}
+        self._rebuild_spatial_index()
         self.active_index = None
         self.current_search_query = ""
         if self.current_day_data:
@@ -1033,11 +3536,77 @@ class MainScreen(MDScreen):
             pass
         self._update_display()
         self._save_data()
+        self._start_geocoding()
         
+        issues = describe_import_report(report) if report else ""
+        issues_text = f" • fixed/flagged: {issues}" if issues else ""
         if gps_count > 0:
-            toast(f"Loaded {len(addresses)} addresses ({gps_count} with GPS coordinates)")
+            toast(f"Loaded {len(addresses)} addresses ({gps_count} with GPS coordinates){issues_text}")
         else:
-            toast(f"Loaded {len(addresses)} addresses (no GPS coordinates found)")
+            toast(f"Loaded {len(addresses)} addresses (no GPS coordinates found){issues_text}")
+
+    def _start_geocoding(self):
+        """Fill in coordinates for rows without them from the offline gazetteer, off the UI thread."""
+        if self._geocoding:
+            self._geocode_again = True  # a newer list arrived mid-run; geocode it once this run lands
+            return
+        entries = []
+        for i in range(len(self.addresses)):
+            address_text, lat, lng = self._address_fields(i)
+            if lat is None or lng is None:
+                entries.append((i, address_text))
+        app = MDApp.get_running_app()
+        if not entries or not getattr(app, 'db', None):
+            return
+        gazetteer_path = os.path.join(os.path.dirname(self._get_data_file_path()), GAZETTEER_FILENAME)
+        addresses = self.addresses
+        db_path = app.db.db_path
+        self._geocoding = True
+
+        def worker():
+            try:
+                if getattr(app, 'geocode_cache', None) is None:
+                    app.geocode_cache = GeocodeCache(db_path)
+                results, stats = geocode_addresses(entries, app.geocode_cache, gazetteer_path)
+                error = None
+            except Exception as e:
+                results, stats, error = {}, None, str(e)
+            Clock.schedule_once(lambda dt: self._on_geocoded(addresses, results, stats, error), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_geocoded(self, addresses, results, stats, error):
+        self._geocoding = False
+        rerun, self._geocode_again = self._geocode_again, False
+        self._apply_geocoded(addresses, results, stats, error)
+        if rerun:
+            self._start_geocoding()
+
+    def _apply_geocoded(self, addresses, results, stats, error):
+        if error:
+            logger.warning("Geocoding: failed: %s", error)
+            return
+        logger.info("Geocoding: %s", stats)
+        if addresses is not self.addresses or not results:
+            if stats and not stats['gazetteer_found'] and stats['rows'] - stats['no_postcode'] > stats['cache_hits']:
+                toast(f"{GAZETTEER_FILENAME} not found - rows without GPS use address search")
+            return
+        changed = []
+        for index, (lat, lng) in results.items():
+            addr_data = self.addresses[index]
+            if isinstance(addr_data, dict) and addr_data.get('lat') is None:
+                addr_data['lat'] = lat
+                addr_data['lng'] = lng
+                addr_data['geocoded'] = 'postcode'
+                self._etas_stale = True
+                changed.append(index)
+                if index not in self.completed_data:
+                    self._spatial_add(index)
+        if changed:
+            self.coords_generation += 1
+        self._assign_nearest_zones(changed)
+        self._reconcile_rows(changed=changed)
+        self._save_data()
+        toast(f"Located {len(changed)} of {stats['rows']} addresses by postcode ({stats['cache_hits']} cached)")
 
     def remove_from_completed(self, index):
         if index in self.completed_data:
@@ -1046,43 +3615,50 @@ class MainScreen(MDScreen):
             except Exception:
                 pass
             self._save_data()
-            self._update_display()
+            self._spatial_add(index)
+            self._reconcile_rows(changed=[index])
 
     def clear_all_completed(self):
         self.completed_data.clear()
+        self._rebuild_spatial_index()
         self._save_data()
-        self._update_display()
+        self._reconcile_rows(changed=[])
         toast("All completed addresses cleared")
 
     def refresh_display(self):
-        self._update_display()
+        if self.addresses and not self._welcome_card:
+            self._reconcile_rows()
+        else:
+            self._update_display()
         toast("Display refreshed")
 
     def _save_data(self):
+        if not self._state_loaded:
+            return
         try:
             data = {
                 'addresses': self.addresses,
                 'completed_data': self.completed_data,
                 'active_index': self.active_index,
-                'current_day_data': self.current_day_data,
+                'current_day_data': dict(self.current_day_data, addresses_completed=self._session.as_list()) if self.current_day_data else None,
                 'day_history': self.day_history,
+                'route_order': self.route_order,
+                'zone_filter': self.zone_filter,
+                'track_enabled': self.track_enabled,
+                'map_settings': self.map_settings,
             }
             filepath = self._get_data_file_path()
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            print(f"Save error: {e}")
+            logger.warning("Save: error: %s", e)
 
-    def _load_data(self):
+    def _read_saved_state(self, filepath):
+        """Read and parse the saved JSON state; runs on a worker thread and touches no widgets."""
+        state = {'addresses': [], 'completed_data': {}, 'active_index': None, 'current_day_data': None, 'day_history': {}, 'route_order': [], 'zone_filter': None, 'track_enabled': False, 'map_settings': {}}
         try:
-            filepath = self._get_data_file_path()
             if not os.path.exists(filepath):
-                self.addresses = []
-                self.completed_data = {}
-                self.active_index = None
-                self.current_day_data = None
-                self.day_history = {}
-                return
+                return state
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
@@ -1090,26 +3666,52 @@ class MainScreen(MDScreen):
             addresses = data.get('addresses', [])
             if addresses and isinstance(addresses[0], str):
                 # Convert old string format to new dict format
-                self.addresses = [{'address': addr, 'lat': None, 'lng': None} for addr in addresses]
+                state['addresses'] = [{'address': addr, 'lat': None, 'lng': None} for addr in addresses]
             else:
-                self.addresses = addresses
+                state['addresses'] = addresses
             
             cd = data.get('completed_data', {})
             try:
-                self.completed_data = {int(k): v for k, v in cd.items()}
+                state['completed_data'] = {int(k): v for k, v in cd.items()}
             except Exception:
-                self.completed_data = cd
-            self.active_index = data.get('active_index')
-            self.current_day_data = data.get('current_day_data')
-            self.day_history = data.get('day_history', {})
-            Clock.schedule_once(lambda dt: self._update_day_status_bar(), 0.1)
+                state['completed_data'] = cd
+            state['active_index'] = data.get('active_index')
+            state['current_day_data'] = data.get('current_day_data')
+            state['day_history'] = data.get('day_history', {})
+            state['route_order'] = data.get('route_order', [])
+            state['zone_filter'] = data.get('zone_filter')
+            state['track_enabled'] = bool(data.get('track_enabled', False))
+            state['map_settings'] = data.get('map_settings') or {}
         except Exception as e:
-            print(f"Load error: {e}")
-            self.addresses = []
-            self.completed_data = {}
-            self.active_index = None
-            self.current_day_data = None
-            self.day_history = {}
+            logger.warning("Load: error: %s", e)
+        return state
+
+    def _apply_saved_state(self, state):
+        _startup_mark("state read")
+        self.addresses = state['addresses']
+        self.completed_data = state['completed_data']
+        self.active_index = state['active_index']
+        self.current_day_data = state['current_day_data']
+        self._session = DaySessionTally(self.current_day_data.pop('addresses_completed', [])) if self.current_day_data else None
+        self.day_history = state['day_history']
+        self._set_route_order(state['route_order'])
+        self.zone_filter = state['zone_filter']
+        self.track_enabled = state['track_enabled']
+        self.map_settings = state['map_settings']
+        if self.zone_filter is not None:
+            self.toolbar.title = f"Zone {self.zone_filter + 1}"
+        self._rebuild_spatial_index()
+        self._state_loaded = True
+        self._hide_skeleton()
+        self._rebuild_search_index()
+        self._update_display()
+        self._update_day_status_bar()
+        _startup_mark("list populated", report=True)
+        callbacks, self._after_state_loaded = self._after_state_loaded, []
+        for callback in callbacks:
+            callback()
+        self._start_tracking()
+        Clock.schedule_once(lambda dt: MDApp.get_running_app().start_summary_prefetch(), 1.0)
 
     def _get_data_file_path(self):
         if platform == 'android' and ANDROID_AVAILABLE:
@@ -1129,181 +3731,1339 @@ class MainScreen(MDScreen):
 
 
 # -------------------------------------------------------------------
-# Completed summary and details screens - Updated for GPS
+# Offline map - cached slippy tiles and grid-clustered markers
 # -------------------------------------------------------------------
-class DayDetailsScreen(MDScreen):
-    def __init__(self, app_instance, date_obj, **kwargs):
+TILE_SIZE = 256
+MAP_MIN_ZOOM = 3
+MAP_MAX_ZOOM = 18
+MAP_CLUSTER_PX = 56  # markers closer than this on screen merge into one cluster
+MAP_TEXTURE_CACHE = 96
+# Tile source defaults; the map screen's settings dialog overrides them (saved with the app state).
+# The public OSM server's usage policy requires a descriptive User-Agent and visible attribution.
+MAP_DEFAULT_SETTINGS = {
+    'tile_url': "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
+    'user_agent': "AddressNavigator/1.0 (offline tile cache)",
+    'attribution': "\u00a9 OpenStreetMap contributors",
+}
+_MARKER_COLORS = {
+    'pending': (0.13, 0.59, 0.95, 1),
+    'active': (1.0, 0.6, 0.0, 1),
+    'completed': (0.3, 0.69, 0.31, 1),
+}
+
+
+def map_settings(overrides=None):
+    """``MAP_DEFAULT_SETTINGS`` with any non-empty saved overrides applied."""
+    settings = dict(MAP_DEFAULT_SETTINGS)
+    for key, value in (overrides or {}).items():
+        if key in settings and value:
+            settings[key] = value
+    return settings
+
+
+def mercator_xy(lat, lng):
+    """Web-mercator position of a point as fractions of the world (0..1, y down)."""
+    lat = max(-85.0511, min(85.0511, lat))
+    s = sin(radians(lat))
+    return (lng + 180.0) / 360.0, 0.5 - log((1 + s) / (1 - s)) / (4 * pi)
+
+
+def cluster_markers(points, zoom, cell_px=MAP_CLUSTER_PX):
+    """Bucket ``(index, mx, my, status)`` markers into screen-sized grid cells at ``zoom``.
+
+    Returns ``[(wx, wy, indices, status)]`` in world pixels, one entry per
+    occupied cell, positioned at the members' mean. A cluster takes the
+    most urgent status among its members: active, then pending, then
+    completed.
+    """
+    scale = TILE_SIZE * (1 << zoom)
+    cells = {}
+    for index, mx, my, status in points:
+        wx, wy = mx * scale, my * scale
+        key = (int(wx // cell_px), int(wy // cell_px))
+        cell = cells.get(key)
+        if cell is None:
+            cells[key] = [wx, wy, [index], status]
+        else:
+            cell[0] += wx
+            cell[1] += wy
+            cell[2].append(index)
+            if status == 'active' or (status == 'pending' and cell[3] == 'completed'):
+                cell[3] = status
+    return [(sx / len(members), sy / len(members), members, status) for sx, sy, members, status in cells.values()]
+
+
+class TileCache:
+    """Tile textures from an on-disk slippy-map cache, with missing tiles fetched by one background worker."""
+    def __init__(self, cache_dir, on_tile_ready, tile_url=MAP_DEFAULT_SETTINGS['tile_url'],
+                 user_agent=MAP_DEFAULT_SETTINGS['user_agent'], download=True):
+        self.cache_dir = cache_dir
+        self.on_tile_ready = on_tile_ready
+        self.tile_url = tile_url
+        self.user_agent = user_agent
+        self.download = download
+        self._textures = OrderedDict()
+        self._queued = set()
+        self._queue = None
+
+    def path(self, z, x, y):
+        return os.path.join(self.cache_dir, str(z), str(x), f"{y}.png")
+
+    def texture(self, z, x, y):
+        key = (z, x, y)
+        texture = self._textures.get(key)
+        if texture is not None:
+            self._textures.move_to_end(key)
+            return texture
+        path = self.path(z, x, y)
+        if not os.path.exists(path):
+            self._request(key)
+            return None
+        try:
+            texture = CoreImage(path).texture
+        except Exception as e:
+            logger.warning("Tiles: load error %s: %s", path, e)
+            return None
+        self._textures[key] = texture
+        while len(self._textures) > MAP_TEXTURE_CACHE:
+            self._textures.popitem(last=False)
+        return texture
+
+    def _request(self, key):
+        if not self.download or key in self._queued:
+            return
+        self._queued.add(key)
+        if self._queue is None:
+            import queue
+            self._queue = queue.LifoQueue()  # newest first: the tiles on screen now
+            threading.Thread(target=self._worker, daemon=True).start()
+        self._queue.put(key)
+
+    def _worker(self):
+        from urllib.request import Request, urlopen
+        while True:
+            z, x, y = key = self._queue.get()
+            path = self.path(z, x, y)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                request = Request(self.tile_url.format(z=z, x=x, y=y), headers={'User-Agent': self.user_agent})
+                with urlopen(request, timeout=10) as response:
+                    data = response.read()
+                with open(path + ".part", 'wb') as f:
+                    f.write(data)
+                os.replace(path + ".part", path)
+                Clock.schedule_once(lambda dt, k=key: self._loaded(k), 0)
+            except Exception as e:
+                logger.warning("Tiles: fetch error %s: %s", key, e)
+                Clock.schedule_once(lambda dt, k=key: self._queued.discard(k), 0)
+
+    def _loaded(self, key):
+        self._queued.discard(key)
+        self.on_tile_ready(key)
+
+
+class TileMapView(StencilView):
+    """Canvas map: tiles and markers are laid out around an anchor and panned with a single ``Translate``.
+
+    Dragging only moves the translation; tiles and clusters are re-laid out
+    when the view drifts a tile away from the anchor or the zoom changes,
+    so a pan frame costs one matrix update however many pins are loaded.
+    """
+    def __init__(self, tile_cache_dir, on_marker, settings=None, **kwargs):
+        super().__init__(**kwargs)
+        self.zoom = 12
+        self.center_world = (0.5, 0.5)  # mercator fractions
+        self.on_marker = on_marker
+        settings = settings or MAP_DEFAULT_SETTINGS
+        self.tiles = TileCache(tile_cache_dir, self._on_tile_ready, settings['tile_url'], settings['user_agent'])
+        self._points = []
+        self._clusters = {}
+        self._hits = []
+        self._anchor = None
+        self._drag = None
+        with self.canvas:
+            Color(0.93, 0.93, 0.9, 1)
+            self._background = Rectangle(pos=self.pos, size=self.size)
+            PushMatrix()
+            self._translate = Translate(0, 0)
+            self._tile_group = InstructionGroup()
+            self._marker_group = InstructionGroup()
+            PopMatrix()
+        self.bind(pos=self._relayout, size=self._relayout)
+
+    def set_points(self, points):
+        """``points`` is ``[(index, mx, my, status)]``; clusters are recomputed lazily per zoom."""
+        self._points = points
+        self._clusters = {}
+        self._relayout()
+
+    def fit(self, points):
+        if not points:
+            return
+        xs = [p[1] for p in points]
+        ys = [p[2] for p in points]
+        self.center_world = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+        span = max(max(xs) - min(xs), max(ys) - min(ys), 1e-9)
+        view = max(1.0, min(self.width, self.height) * 0.85)
+        zoom = int(log(view / (span * TILE_SIZE), 2)) if span else MAP_MAX_ZOOM
+        self.zoom = max(MAP_MIN_ZOOM, min(MAP_MAX_ZOOM, zoom))
+        self._relayout()
+
+    def set_zoom(self, zoom, focus=None):
+        zoom = max(MAP_MIN_ZOOM, min(MAP_MAX_ZOOM, zoom))
+        if focus is not None:
+            self.center_world = focus
+        if zoom != self.zoom or focus is not None:
+            self.zoom = zoom
+            self._relayout()
+
+    def _scale(self):
+        return TILE_SIZE * (1 << self.zoom)
+
+    def _world_to_local(self, wx, wy):
+        """World pixels to screen coordinates relative to the current anchor."""
+        ax, ay = self._anchor
+        return self.center_x + (wx - ax), self.center_y - (wy - ay)
+
+    def _relayout(self, *args):
+        self._background.pos = self.pos
+        self._background.size = self.size
+        scale = self._scale()
+        self._anchor = (self.center_world[0] * scale, self.center_world[1] * scale)
+        self._translate.x = self._translate.y = 0
+        self._draw_tiles()
+        self._draw_markers()
+
+    def _visible_world_rect(self, margin):
+        ax, ay = self._anchor
+        half_w = self.width / 2 + margin
+        half_h = self.height / 2 + margin
+        return ax - half_w, ay - half_h, ax + half_w, ay + half_h
+
+    def _draw_tiles(self):
+        group = self._tile_group
+        group.clear()
+        z = self.zoom
+        n = 1 << z
+        left, top, right, bottom = self._visible_world_rect(TILE_SIZE)
+        for ty in range(max(0, int(top // TILE_SIZE)), min(n, int(bottom // TILE_SIZE) + 1)):
+            for tx in range(int(left // TILE_SIZE), int(right // TILE_SIZE) + 1):
+                texture = self.tiles.texture(z, tx % n, ty)
+                sx, sy = self._world_to_local(tx * TILE_SIZE, (ty + 1) * TILE_SIZE)
+                if texture is None:
+                    group.add(Color(0.88, 0.88, 0.85, 1))
+                    group.add(Line(rectangle=(sx, sy, TILE_SIZE, TILE_SIZE), width=1))
+                else:
+                    group.add(Color(1, 1, 1, 1))
+                    group.add(Rectangle(texture=texture, pos=(sx, sy), size=(TILE_SIZE, TILE_SIZE)))
+
+    def _draw_markers(self):
+        group = self._marker_group
+        group.clear()
+        self._hits = []
+        clusters = self._clusters.get(self.zoom)
+        if clusters is None:
+            clusters = self._clusters[self.zoom] = cluster_markers(self._points, self.zoom, dp(MAP_CLUSTER_PX))
+        left, top, right, bottom = self._visible_world_rect(TILE_SIZE)
+        for wx, wy, members, status in clusters:
+            if not (left <= wx <= right and top <= wy <= bottom):
+                continue
+            sx, sy = self._world_to_local(wx, wy)
+            radius = dp(8) if len(members) == 1 else dp(12) + min(dp(10), dp(2) * log(len(members), 2))
+            group.add(Color(1, 1, 1, 1))
+            group.add(Ellipse(pos=(sx - radius - dp(2), sy - radius - dp(2)), size=(2 * radius + dp(4), 2 * radius + dp(4))))
+            group.add(Color(*_MARKER_COLORS[status]))
+            group.add(Ellipse(pos=(sx - radius, sy - radius), size=(2 * radius, 2 * radius)))
+            if len(members) > 1:
+                label = _shared_text_texture(str(len(members)), sp(11), (1, 1, 1, 1))
+                group.add(Color(1, 1, 1, 1))
+                group.add(Rectangle(texture=label, pos=(sx - label.width / 2, sy - label.height / 2), size=label.size))
+            self._hits.append((sx, sy, radius + dp(6), wx, wy, members))
+
+    def set_tile_source(self, tile_cache_dir, settings):
+        self.tiles = TileCache(tile_cache_dir, self._on_tile_ready, settings['tile_url'], settings['user_agent'])
+        self._draw_tiles()
+
+    def _on_tile_ready(self, key):
+        if key[0] == self.zoom:
+            self._draw_tiles()
+
+    def _pan_offset(self):
+        return self._translate.x, self._translate.y
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return False
+        if touch.is_double_tap:
+            self._zoom_at(touch, self.zoom + 1)
+            return True
+        touch.grab(self)
+        self._drag = (touch.x, touch.y, self._translate.x, self._translate.y, False)
+        return True
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is not self or self._drag is None:
+            return False
+        x0, y0, tx0, ty0, moved = self._drag
+        if not moved and hypot(touch.x - x0, touch.y - y0) < dp(6):
+            return True
+        self._drag = (x0, y0, tx0, ty0, True)
+        self._translate.x = tx0 + touch.x - x0
+        self._translate.y = ty0 + touch.y - y0
+        if abs(self._translate.x) > TILE_SIZE / 2 or abs(self._translate.y) > TILE_SIZE / 2:
+            self._recentre()
+            self._drag = (touch.x, touch.y, 0, 0, True)
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return False
+        touch.ungrab(self)
+        drag, self._drag = self._drag, None
+        if drag and drag[4]:
+            self._recentre()
+            return True
+        tx, ty = self._pan_offset()
+        lx, ly = touch.x - tx, touch.y - ty
+        best = None
+        for sx, sy, radius, wx, wy, members in self._hits:
+            d = hypot(lx - sx, ly - sy)
+            if d <= radius and (best is None or d < best[0]):
+                best = (d, wx, wy, members)
+        if best is not None:
+            _, wx, wy, members = best
+            if len(members) == 1:
+                self.on_marker(members[0])
+            else:
+                scale = self._scale()
+                self.set_zoom(self.zoom + 2, focus=(wx / scale, wy / scale))
+        return True
+
+    def _recentre(self):
+        """Fold the pan translation into the centre and lay out again around it."""
+        tx, ty = self._pan_offset()
+        if not tx and not ty:
+            return
+        scale = self._scale()
+        cx, cy = self._anchor
+        self.center_world = ((cx - tx) / scale, (cy + ty) / scale)
+        self._relayout()
+
+    def _zoom_at(self, touch, zoom):
+        tx, ty = self._pan_offset()
+        scale = self._scale()
+        ax, ay = self._anchor
+        wx = ax + (touch.x - tx - self.center_x)
+        wy = ay - (touch.y - ty - self.center_y)
+        self.set_zoom(zoom, focus=(wx / scale, wy / scale))
+
+
+class MapScreen(MDScreen):
+    """Map of the loaded addresses; tapping a pin activates it, tapping the active pin navigates."""
+    def __init__(self, app_instance, **kwargs):
         super().__init__(**kwargs)
         self.app = app_instance
-        self.date_obj = date_obj
-        self.name = f"details_{date_obj.isoformat()}"
+        self.name = "map"
+        self._addresses = None
+        self._coords_generation = None
+        self._mercator = []
+        self._fitted = False
         self._setup_ui()
 
     def _setup_ui(self):
         layout = MDBoxLayout(orientation='vertical')
-        date_str = self.date_obj.strftime("%d/%m/%Y")
-        toolbar = MDTopAppBar(title=f"Details: {date_str}", size_hint_y=None, height=dp(56))
+        toolbar = MDTopAppBar(title="Map", size_hint_y=None, height=dp(56))
+        toolbar.left_action_items = [["arrow-left", lambda x: self.go_back()]]
+        toolbar.right_action_items = [
+            ["magnify-plus-outline", lambda x: self.map_view.set_zoom(self.map_view.zoom + 1)],
+            ["magnify-minus-outline", lambda x: self.map_view.set_zoom(self.map_view.zoom - 1)],
+            ["fit-to-screen-outline", lambda x: self.map_view.fit(self._points())],
+            ["cog-outline", lambda x: self.show_tile_settings()],
+        ]
+        layout.add_widget(toolbar)
+        settings = self._settings()
+        map_area = FloatLayout()
+        self.map_view = TileMapView(self._tile_cache_dir(settings), self._on_marker, settings)
+        map_area.add_widget(self.map_view)
+        # Tile licences (OSM's ODbL included) require the attribution to stay visible over the map
+        self.attribution_label = MDLabel(text=settings['attribution'], font_style="Caption", theme_text_color="Primary",
+                                         adaptive_size=True, padding=(dp(4), dp(2)), pos_hint={'right': 1, 'y': 0})
+        with self.attribution_label.canvas.before:
+            Color(1, 1, 1, 0.75)
+            attribution_bg = Rectangle()
+        self.attribution_label.bind(pos=lambda w, v: setattr(attribution_bg, 'pos', v),
+                                    size=lambda w, v: setattr(attribution_bg, 'size', v))
+        map_area.add_widget(self.attribution_label)
+        layout.add_widget(map_area)
+        self.add_widget(layout)
+
+    def _settings(self):
+        return map_settings(self.app.get_main_screen().map_settings)
+
+    def _tile_cache_dir(self, settings):
+        """Tiles are cached per server so switching source never mixes imagery."""
+        import hashlib
+        main_screen = self.app.get_main_screen()
+        source = hashlib.sha1(settings['tile_url'].encode('utf-8')).hexdigest()[:10]
+        return os.path.join(os.path.dirname(main_screen._get_data_file_path()), "tiles", source)
+
+    def show_tile_settings(self):
+        settings = self._settings()
+        content = MDBoxLayout(orientation='vertical', spacing=dp(8), adaptive_height=True)
+        fields = {}
+        for key, hint in (('tile_url', "Tile URL ({z}/{x}/{y})"), ('user_agent', "User-Agent"), ('attribution', "Attribution")):
+            fields[key] = MDTextField(hint_text=hint, text=settings[key])
+            content.add_widget(fields[key])
+
+        def save(reset=False):
+            overrides = {} if reset else {key: field.text.strip() for key, field in fields.items()}
+            if not reset and not all(part in overrides['tile_url'] for part in ("{z}", "{x}", "{y}")):
+                toast("Tile URL needs {z}, {x} and {y}")
+                return
+            self._tile_dialog.dismiss()
+            self.apply_tile_settings(overrides)
+        self._tile_dialog = MDDialog(title="Map tiles", type="custom", content_cls=content, buttons=[
+            MDFlatButton(text="Defaults", on_release=lambda x: save(reset=True)),
+            MDFlatButton(text="Cancel", on_release=lambda x: self._tile_dialog.dismiss()),
+            MDRaisedButton(text="Save", on_release=lambda x: save()),
+        ])
+        self._tile_dialog.open()
+
+    def apply_tile_settings(self, overrides):
+        main_screen = self.app.get_main_screen()
+        main_screen.map_settings = {key: value for key, value in overrides.items() if value and value != MAP_DEFAULT_SETTINGS.get(key)}
+        main_screen._save_data()
+        settings = self._settings()
+        self.attribution_label.text = settings['attribution']
+        self.map_view.set_tile_source(self._tile_cache_dir(settings), settings)
+
+    def go_back(self):
+        if self.manager:
+            self.manager.current = 'main_screen'
+
+    def on_pre_enter(self, *args):
+        self.refresh_markers()
+
+    def _points(self):
+        main_screen = self.app.get_main_screen()
+        if main_screen.addresses is not self._addresses or main_screen.coords_generation != self._coords_generation:
+            # Projection is per address, not per status change: redo it only for a new list
+            # or when geocoding has filled in coordinates
+            self._addresses = main_screen.addresses
+            self._coords_generation = main_screen.coords_generation
+            self._mercator = []
+            for i in range(len(main_screen.addresses)):
+                _, lat, lng = main_screen._address_fields(i)
+                if lat is not None and lng is not None:
+                    self._mercator.append((i,) + mercator_xy(lat, lng))
+            self._fitted = False
+        completed = main_screen.completed_data
+        active = main_screen.active_index
+        return [(i, mx, my, 'completed' if i in completed else 'active' if i == active else 'pending') for i, mx, my in self._mercator]
+
+    def refresh_markers(self):
+        points = self._points()
+        self.map_view.set_points(points)
+        if not self._fitted and points:
+            self._fitted = True
+            Clock.schedule_once(lambda dt: self.map_view.fit(points), 0)
+        if not points:
+            toast("No addresses with GPS coordinates to show")
+
+    def _on_marker(self, index):
+        main_screen = self.app.get_main_screen()
+        address_text, lat, lng = main_screen._address_fields(index)
+        if index in main_screen.completed_data:
+            toast(f"Completed: {address_text[:40]}")
+        elif index == main_screen.active_index:
+            main_screen.navigate_to_address(address_text, index, lat, lng)
+        else:
+            main_screen.set_active_address(index)
+            toast(f"Active: {address_text[:40]} - tap again to navigate")
+        self.refresh_markers()
+
+
+# -------------------------------------------------------------------
+# Completed summary and details screens - Updated for GPS
+# -------------------------------------------------------------------
+DETAIL_SCREEN_CACHE_SIZE = 4
+
+
+class DetailScreenCache:
+    """Bounded LRU of detail screens attached to a screen manager.
+
+    A cached screen is reused when it is reopened with the same data
+    signature; otherwise, and when the cache is over capacity, screens are
+    removed from the manager and their widget trees released.
+    """
+    def __init__(self, manager, capacity=DETAIL_SCREEN_CACHE_SIZE):
+        self.manager = manager
+        self.capacity = capacity
+        self._screens = OrderedDict()  # name -> (screen, signature)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def open(self, name, signature, factory):
+        entry = self._screens.get(name)
+        if entry is not None and entry[1] == signature:
+            self._screens.move_to_end(name)
+            self.hits += 1
+            screen = entry[0]
+        else:
+            if entry is not None:
+                self._release(name)
+            self.misses += 1
+            screen = factory()
+            self.manager.add_widget(screen)
+            self._screens[name] = (screen, signature)
+        self.manager.current = name
+        self._evict()
+        return screen
+
+    def _evict(self):
+        evicted = False
+        for name in list(self._screens):
+            if len(self._screens) <= self.capacity:
+                break
+            if name == self.manager.current:
+                continue
+            self._release(name)
+            self.evictions += 1
+            evicted = True
+        if evicted:
+            logger.debug("DetailCache: %s", self.memory_report())
+
+    def _release(self, name):
+        screen, _ = self._screens.pop(name)
+        try:
+            if screen.manager:
+                self.manager.remove_widget(screen)
+            screen.clear_widgets()
+        except Exception as e:
+            logger.warning("DetailCache: release error: %s", e)
+
+    def clear(self):
+        for name in list(self._screens):
+            self._release(name)
+
+    def memory_report(self):
+        screens = [screen for screen, _ in self._screens.values()]
+        return {
+            'screens': len(screens),
+            'widgets': sum(_count_widgets(screen) for screen in screens),
+            'rows': sum(getattr(screen, 'row_count', 0) for screen in screens),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+DETAIL_PAGE_SIZE = 50
+_OUTCOME_COLORS = {"PIF": [0, 0.7, 0, 1], "DA": [0.8, 0.1, 0.1, 1], "Done": [0, 0.5, 0.8, 1]}
+
+
+class DetailRowCard(RecycleDataViewBehavior, MDCard):
+    """Recycled completion row used by the paged detail screens"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint_y = None
+        self.height = dp(110)
+        self.elevation = 1
+        self.padding = dp(12)
+        self._item = None
+        self._on_navigate = None
+        layout = MDBoxLayout(orientation='vertical', spacing=dp(6))
+        top_row = MDBoxLayout(orientation='horizontal')
+        self.address_label = MDLabel(size_hint_x=0.7, shorten=True)
+        self.outcome_label = MDLabel(size_hint_x=0.3, halign="right", theme_text_color="Custom")
+        top_row.add_widget(self.address_label)
+        top_row.add_widget(self.outcome_label)
+        info_row = MDBoxLayout(orientation='horizontal')
+        self.time_label = MDLabel(theme_text_color="Secondary", font_size='11sp')
+        self.amount_label = MDLabel(theme_text_color="Secondary", font_size='11sp')
+        info_row.add_widget(self.time_label)
+        info_row.add_widget(MDLabel())
+        info_row.add_widget(self.amount_label)
+        btn_row = MDBoxLayout(orientation='horizontal', size_hint_y=None, height=dp(32))
+        nav_btn = MDFlatButton(text="Navigate", size_hint=(None, None), size=(dp(80), dp(28)), font_size='11sp')
+        nav_btn.bind(on_release=lambda x: self._navigate())
+        btn_row.add_widget(nav_btn)
+        layout.add_widget(top_row)
+        layout.add_widget(info_row)
+        layout.add_widget(btn_row)
+        self.add_widget(layout)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self._item = data['item']
+        self._on_navigate = data['on_navigate']
+        self.address_label.text = data['address']
+        self.outcome_label.text = data['outcome']
+        self.outcome_label.text_color = data['outcome_color']
+        self.time_label.text = data['time_text']
+        self.amount_label.text = data['amount_text']
+
+    def _navigate(self):
+        if self._item is not None and self._on_navigate:
+            self._on_navigate(self._item)
+
+
+class PagedDetailsScreen(MDScreen):
+    """Completion list for a date range, fetched a page at a time off the UI thread.
+
+    The first page is requested as soon as the screen is built and further
+    pages are pulled when the list is scrolled near its end; rows are
+    rendered through a RecycleView so only the visible cards exist.
+    """
+    time_format = "%H:%M"
+    empty_text = "No completions in selected range"
+
+    def __init__(self, app_instance, start_date: date, end_date: date, **kwargs):
+        super().__init__(**kwargs)
+        self.app = app_instance
+        self.start_date = start_date
+        self.end_date = end_date
+        self.row_count = 0
+        self._after = None  # page key of the last loaded row
+        self._loading = False
+        self._exhausted = False
+
+    def _title(self):
+        if self.start_date == self.end_date:
+            return f"Details: {self.start_date.strftime('%d/%m/%Y')}"
+        return f"Details: {self.start_date.strftime('%d/%m/%Y')}  -  {self.end_date.strftime('%d/%m/%Y')}"
+
+    def _setup_ui(self):
+        layout = MDBoxLayout(orientation='vertical')
+        toolbar = MDTopAppBar(title=self._title(), size_hint_y=None, height=dp(56))
         toolbar.left_action_items = [["arrow-left", lambda x: self.go_back()]]
         layout.add_widget(toolbar)
-        self.scroll = MDScrollView()
-        self.content_layout = MDBoxLayout(orientation='vertical', adaptive_height=True, spacing=dp(8), padding=[dp(12), dp(12)])
-        self.scroll.add_widget(self.content_layout)
-        layout.add_widget(self.scroll)
+        self.status_label = MDLabel(text="Loading...", halign="center", theme_text_color="Secondary", size_hint_y=None, height=dp(48))
+        layout.add_widget(self.status_label)
+        self.rv = RecycleView(scroll_type=['bars', 'content'], bar_width=dp(4))
+        self.rv.viewclass = DetailRowCard
+        self._rv_layout = RecycleBoxLayout(orientation='vertical', default_size=(None, dp(110)), default_size_hint=(1, None), size_hint_y=None, spacing=dp(8), padding=[dp(12), dp(12)])
+        self._rv_layout.bind(minimum_height=self._rv_layout.setter('height'))
+        self.rv.add_widget(self._rv_layout)
+        self.rv.bind(scroll_y=self._on_scroll)
+        layout.add_widget(self.rv)
         self.add_widget(layout)
-        Clock.schedule_once(lambda dt: self._load_details(), 0)
+        Clock.schedule_once(lambda dt: self._load_next_page(), 0)
 
     def go_back(self):
         if self.manager:
             self.manager.current = 'completed_summary'
 
-    def _load_details(self):
-        start_dt = datetime(self.date_obj.year, self.date_obj.month, self.date_obj.day, 0, 0, 0)
-        end_dt = datetime(self.date_obj.year, self.date_obj.month, self.date_obj.day, 23, 59, 59)
-        try:
-            items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=10000, offset=0)
-        except Exception as e:
-            toast(f"Failed to load details: {str(e)}")
-            items = []
-        for item in items:
-            card = self._create_detail_card(item)
-            self.content_layout.add_widget(card)
-        if not items:
-            no_label = MDLabel(text="No completions on this day", halign="center", theme_text_color="Secondary")
-            self.content_layout.add_widget(no_label)
+    def _on_scroll(self, *args):
+        if self.rv.scroll_y <= 0.1 or self._rv_layout.height <= self.rv.height:
+            self._load_next_page()
 
-    def _create_detail_card(self, item):
-        card = MDCard(size_hint_y=None, height=dp(110), elevation=1, padding=dp(12))
-        layout = MDBoxLayout(orientation='vertical', spacing=dp(6))
-        top_row = MDBoxLayout(orientation='horizontal')
-        addr_label = MDLabel(text=item['address'], size_hint_x=0.7, shorten=True)
-        outcome = item['completion'].get('outcome', 'Done')
-        outcome_label = MDLabel(text=outcome, size_hint_x=0.3, halign="right", theme_text_color="Custom", text_color=self._get_outcome_color(outcome))
-        top_row.add_widget(addr_label)
-        top_row.add_widget(outcome_label)
-        ts = item['completion'].get('timestamp', '')
+    def _load_next_page(self):
+        if self._loading or self._exhausted:
+            return
+        self._loading = True
+        after = self._after
+        start_dt = datetime(self.start_date.year, self.start_date.month, self.start_date.day, 0, 0, 0)
+        end_dt = datetime(self.end_date.year, self.end_date.month, self.end_date.day, 23, 59, 59)
+
+        def worker():
+            try:
+                items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=DETAIL_PAGE_SIZE, after=after)
+                error = None
+            except Exception as e:
+                items = []
+                error = str(e)
+            Clock.schedule_once(lambda dt: self._on_page_loaded(items, error), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_page_loaded(self, items, error):
+        self._loading = False
+        if error:
+            toast(f"Failed to load details: {error}")
+            self._exhausted = True
+        else:
+            if items:
+                self._after = CompletionDB.page_key(items[-1])
+            if len(items) < DETAIL_PAGE_SIZE:
+                self._exhausted = True
+            self.rv.data.extend([self._make_row(item) for item in items])
+        self.row_count = len(self.rv.data)
+        if self.row_count:
+            self.status_label.text = ""
+            self.status_label.height = 0
+        else:
+            self.status_label.text = "Failed to load details" if error else self.empty_text
+        if not self._exhausted:
+            # Keep filling until the viewport is covered; later pages come from scrolling.
+            Clock.schedule_once(self._on_scroll, 0)
+
+    def _make_row(self, item):
+        comp = item['completion']
+        outcome = comp.get('outcome', 'Done')
+        ts = comp.get('timestamp', '')
         try:
-            dt_val = datetime.fromisoformat(ts)
-            time_text = dt_val.strftime("%H:%M:%S")
+            time_text = datetime.fromisoformat(ts).strftime(self.time_format)
         except Exception:
             time_text = ts or "Unknown"
-        time_label = MDLabel(text=time_text, theme_text_color="Secondary", font_size='11sp')
-        amount_text = item['completion'].get('amount', '')
-        amount_label = MDLabel(text=f"£{amount_text}" if amount_text else "", theme_text_color="Secondary", font_size='11sp')
-        layout.add_widget(top_row)
-        info_row = MDBoxLayout(orientation='horizontal')
-        info_row.add_widget(time_label)
-        info_row.add_widget(MDLabel())
-        info_row.add_widget(amount_label)
-        layout.add_widget(info_row)
-        
-        # Navigation button
-        btn_row = MDBoxLayout(orientation='horizontal', size_hint_y=None, height=dp(32))
-        nav_btn = MDFlatButton(text="Navigate", size_hint=(None, None), size=(dp(80), dp(28)), font_size='11sp')
-        nav_btn.bind(on_release=lambda x: self._navigate_to_address(item))
-        btn_row.add_widget(nav_btn)
-        layout.add_widget(btn_row)
-        
-        card.add_widget(layout)
-        return card
+        amount_text = comp.get('amount', '')
+        return {
+            'item': item,
+            'on_navigate': self._navigate_to_address,
+            'address': item['address'],
+            'outcome': outcome,
+            'outcome_color': self._get_outcome_color(outcome),
+            'time_text': time_text,
+            'amount_text': f"£{amount_text}" if amount_text else "",
+        }
 
     def _navigate_to_address(self, item):
-        main_screen = self.app.get_main_screen()
+        main_screen = self.app.get_main_screen() if hasattr(self.app, 'get_main_screen') else None
         if main_screen:
             lat = item.get('lat')
             lng = item.get('lng')
             main_screen.navigate_to_address(item['address'], -1, lat, lng, from_completed=True)
 
     def _get_outcome_color(self, outcome):
-        colors = {"PIF": [0, 0.7, 0, 1], "DA": [0.8, 0.1, 0.1, 1], "Done": [0, 0.5, 0.8, 1]}
-        return colors.get(outcome, [0.5, 0.5, 0.5, 1])
+        return _OUTCOME_COLORS.get(outcome, [0.5, 0.5, 0.5, 1])
+
+
+class DayDetailsScreen(PagedDetailsScreen):
+    time_format = "%H:%M:%S"
+    empty_text = "No completions on this day"
+
+    def __init__(self, app_instance, date_obj, **kwargs):
+        super().__init__(app_instance, date_obj, date_obj, **kwargs)
+        self.date_obj = date_obj
+        self.name = f"details_{date_obj.isoformat()}"
+        self._setup_ui()
 
 
-class RangeDetailsScreen(MDScreen):
+class RangeDetailsScreen(PagedDetailsScreen):
     def __init__(self, app_instance, start_date: date, end_date: date, **kwargs):
+        super().__init__(app_instance, start_date, end_date, **kwargs)
+        if start_date != end_date:
+            self.time_format = "%d/%m %H:%M"
+        self.name = f"details_{start_date.isoformat()}_{end_date.isoformat()}"
+        self._setup_ui()
+
+
+class HeatmapGrid(Widget):
+    """Weekday x hour-of-day grid drawn as canvas rectangles, shaded by count."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint_y = None
+        self.height = dp(7 * 18 + 16)
+        self.grid = [[0] * 24 for _ in range(7)]
+        self.bind(pos=self._draw, size=self._draw)
+
+    def set_grid(self, grid):
+        self.grid = grid
+        self._draw()
+
+    def _draw(self, *args):
+        self.canvas.clear()
+        label_w = dp(30)
+        cell_w = max(1.0, (self.width - label_w) / 24.0)
+        cell_h = dp(18)
+        peak = max(max(row) for row in self.grid) or 1
+        with self.canvas:
+            for weekday, row in enumerate(self.grid):
+                y = self.top - (weekday + 1) * cell_h
+                name = _shared_text_texture(WEEKDAY_NAMES[weekday], sp(10), _TEXT_SECONDARY)
+                Color(1, 1, 1, 1)
+                Rectangle(texture=name, pos=(self.x, y + (cell_h - name.height) / 2), size=name.size)
+                for hour, count in enumerate(row):
+                    shade = count / peak
+                    Color(0.13, 0.59, 0.95, 0.08 + 0.92 * shade if count else 0.04)
+                    Rectangle(pos=(self.x + label_w + hour * cell_w + 1, y + 1), size=(cell_w - 2, cell_h - 2))
+            for hour in range(0, 24, 6):
+                tick = _shared_text_texture(f"{hour:02d}", sp(10), _TEXT_SECONDARY)
+                Color(1, 1, 1, 1)
+                Rectangle(texture=tick, pos=(self.x + label_w + hour * cell_w, self.top - 7 * cell_h - tick.height), size=tick.size)
+
+
+class StatsScreen(MDScreen):
+    """Analytics over a date range of completions, opened from the Completed screen."""
+    def __init__(self, app_instance, **kwargs):
         super().__init__(**kwargs)
         self.app = app_instance
-        self.start_date = start_date
-        self.end_date = end_date
-        self.name = f"details_{start_date.isoformat()}_{end_date.isoformat()}"
+        self.name = "stats"
+        self.start_date = None
+        self.end_date = None
+        self._loading = False
         self._setup_ui()
 
     def _setup_ui(self):
         layout = MDBoxLayout(orientation='vertical')
-        if self.start_date == self.end_date:
-            title_text = f"Details: {self.start_date.strftime('%d/%m/%Y')}"
-        else:
-            title_text = f"Details: {self.start_date.strftime('%d/%m/%Y')}  -  {self.end_date.strftime('%d/%m/%Y')}"
-        toolbar = MDTopAppBar(title=title_text, size_hint_y=None, height=dp(56))
-        toolbar.left_action_items = [["arrow-left", lambda x: self.go_back()]]
-        layout.add_widget(toolbar)
+        self.toolbar = MDTopAppBar(title="Stats", size_hint_y=None, height=dp(56))
+        self.toolbar.left_action_items = [["arrow-left", lambda x: self.go_back()]]
+        layout.add_widget(self.toolbar)
         self.scroll = MDScrollView()
         self.content_layout = MDBoxLayout(orientation='vertical', adaptive_height=True, spacing=dp(8), padding=[dp(12), dp(12)])
         self.scroll.add_widget(self.content_layout)
         layout.add_widget(self.scroll)
         self.add_widget(layout)
-        Clock.schedule_once(lambda dt: self._load_details(), 0)
 
     def go_back(self):
         if self.manager:
             self.manager.current = 'completed_summary'
 
-    def _load_details(self):
-        start_dt = datetime(self.start_date.year, self.start_date.month, self.start_date.day, 0, 0, 0)
-        end_dt = datetime(self.end_date.year, self.end_date.month, self.end_date.day, 23, 59, 59)
+    def show_range(self, start_date=None, end_date=None):
+        """Load analytics for the range, defaulting to the last ANALYTICS_DEFAULT_DAYS days."""
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=ANALYTICS_DEFAULT_DAYS - 1)
+        self.start_date, self.end_date = start_date, end_date
+        self.toolbar.title = f"Stats {start_date.strftime('%d/%m')} - {end_date.strftime('%d/%m/%y')}"
+        if self._loading:
+            return
+        self._loading = True
+        self.content_layout.clear_widgets()
+        self.content_layout.add_widget(MDLabel(text="Crunching numbers...", halign="center", theme_text_color="Secondary", adaptive_height=True))
+        date_from = datetime(start_date.year, start_date.month, start_date.day)
+        date_to = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
+        db = self.app.db
+
+        def worker():
+            try:
+                cols = CompletionColumns(db.columns(date_from, date_to))
+                stats = compute_analytics(cols)
+                logger.info("Analytics: %d completions in %.0f ms", stats['visits'], stats['elapsed_ms'])
+                error = None
+            except Exception as e:
+                stats, error = None, str(e)
+            Clock.schedule_once(lambda dt: self._show_stats(stats, error, (start_date, end_date)), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _section(self, title):
+        self.content_layout.add_widget(MDLabel(text=title, font_style="Subtitle1", adaptive_height=True))
+
+    def _line(self, text, color="Primary"):
+        self.content_layout.add_widget(MDLabel(text=text, font_size='13sp', theme_text_color=color, adaptive_height=True))
+
+    def _show_stats(self, stats, error, loaded_range):
+        self._loading = False
+        if loaded_range != (self.start_date, self.end_date):
+            # The range changed while this load ran: drop it and load the one now in the title
+            self.show_range(self.start_date, self.end_date)
+            return
+        self.content_layout.clear_widgets()
+        if error:
+            self._line(f"Could not load stats: {error}", "Error")
+            return
+        if not stats['visits']:
+            self._line("No completions in this range", "Secondary")
+            return
+        self._section("Overview")
+        self._line(f"{stats['visits']} visits over {stats['days']} days, {stats['pif']} PIF ({stats['pif_rate'] * 100:.0f}%)")
+        rate = stats['earnings_per_hour']
+        self._line(f"£{stats['amount']:.2f} collected, {stats['hours_worked']:.1f} h worked" + (f", £{rate:.2f}/h" if rate is not None else ""))
+        self._section("When visits happen")
+        grid = HeatmapGrid()
+        grid.set_grid(stats['heatmap'])
+        self.content_layout.add_widget(grid)
+        best = max(range(24), key=lambda h: stats['earnings_by_hour'][h])
+        if stats['earnings_by_hour'][best]:
+            self._line(f"Best earning hour: {best:02d}:00-{best + 1:02d}:00 (£{stats['earnings_by_hour'][best]:.2f})", "Secondary")
+        self._section("PIF rate by week")
+        for week in stats['pif_trend'][-8:]:
+            self._line(f"{week['week']}: {week['rate'] * 100:.0f}% ({week['pif']}/{week['visits']}), £{week['amount']:.2f}")
+        self._section("Areas by conversion")
+        if not stats['areas']:
+            self._line(f"Areas need at least {ANALYTICS_MIN_AREA_VISITS} visits to rank", "Secondary")
+        for area in stats['areas'][:10]:
+            self._line(f"{area['area']}: {area['rate'] * 100:.0f}% of {area['visits']} visits, £{area['amount']:.2f}")
+
+
+# -------------------------------------------------------------------
+# Streaming export - rows flow from a DB cursor straight to the file
+# -------------------------------------------------------------------
+EXPORT_FORMATS = ("json", "ndjson", "csv", "xlsx")
+EXPORT_EXTENSIONS = {"json": ".json", "ndjson": ".ndjson", "csv": ".csv", "xlsx": ".xlsx"}
+EXPORT_COLUMNS = ('index', 'address', 'lat', 'lng', 'outcome', 'amount', 'timestamp')
+# Incremental exports add the completion id and whether the row was added or undone since the last hand-off
+DELTA_COLUMNS = ('id', 'change') + EXPORT_COLUMNS
+
+
+def export_records(rows, change=None):
+    """Turn ``CompletionDB.iter_rows`` tuples into the export record layout, one at a time.
+
+    With ``change`` set the records carry the ``DELTA_COLUMNS`` extras.
+    ``amount`` stays a number (or None) as in the JSON export; CSV formats it.
+    """
+    for row_id, idx, address, lat, lng, outcome, amount, ts in rows:
+        record = {
+            'index': idx + 1,
+            'address': address,
+            'lat': lat,
+            'lng': lng,
+            'outcome': outcome or 'Done',
+            'amount': amount,
+            'timestamp': ts or '',
+        }
+        if change:
+            record = dict(id=row_id, change=change, **record)
+        yield record
+
+
+_EXPORT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _write_json(records, f, ndjson=False):
+    """Write records as a JSON array or NDJSON without ever holding more than one of them."""
+    encode = _EXPORT_ENCODER.encode
+    count = 0
+    if ndjson:
+        for record in records:
+            f.write(encode(record))
+            f.write("\n")
+            count += 1
+        return count
+    f.write("[")
+    for record in records:
+        f.write(",\n  " if count else "\n  ")
+        f.write(encode(record))
+        count += 1
+    f.write("\n]\n" if count else "]\n")
+    return count
+
+
+def _write_csv(records, f, columns=EXPORT_COLUMNS):
+    writer = csv.writer(f)
+    writer.writerow(columns)
+    amount_col = columns.index('amount')
+    count = 0
+    for record in records:
+        row = [record[column] for column in columns]
+        amount = row[amount_col]
+        row[amount_col] = "" if amount is None else f"{amount:.2f}"
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _write_xlsx(records, path, columns=EXPORT_COLUMNS):
+    """Write an .xlsx with openpyxl's write-only workbook, which streams rows to disk instead of building cells."""
+    Workbook = lazy_import('openpyxl', 'Workbook')
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Completions")
+    ws.append([column.title() for column in columns])
+    time_col = columns.index('timestamp')
+    count = 0
+    for record in records:
+        row = [record[column] for column in columns]
         try:
-            items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=100000, offset=0)
-        except Exception as e:
-            toast(f"Failed to load details: {str(e)}")
-            items = []
-        for item in items:
-            card = self._create_detail_card(item)
-            self.content_layout.add_widget(card)
-        if not items:
-            empty_card = MDCard(size_hint_y=None, height=dp(80), elevation=1, padding=dp(16))
-            empty_card.add_widget(MDLabel(text="No completions in selected range", theme_text_color="Secondary"))
-            self.content_layout.add_widget(empty_card)
-
-    def _create_detail_card(self, item):
-        card = MDCard(size_hint_y=None, height=dp(110), elevation=1, padding=dp(12))
-        layout = MDBoxLayout(orientation='vertical', spacing=dp(4))
-        address_label = MDLabel(text=item['address'], shorten=True)
-        layout.add_widget(address_label)
-        comp = item['completion']
-        outcome = comp.get('outcome', 'Done')
-        amount = comp.get('amount', '')
-        outcome_text = outcome
-        if outcome == 'PIF' and amount:
-            outcome_text += f" £{amount}"
-        ts = comp.get('timestamp', '')
-        time_str = ""
-        if ts:
+            row[time_col] = datetime.fromisoformat(row[time_col])
+        except ValueError:
+            pass
+        ws.append(row)
+        count += 1
+    wb.save(path)
+    return count
+
+
+def _open_export(path, compress):
+    if compress:
+        import gzip
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def write_export(records, path, fmt, compress=False, columns=EXPORT_COLUMNS):
+    """Write a record stream in ``fmt``; every format consumes the stream once, row by row.
+
+    ``compress`` gzips the text formats; an .xlsx is already a zip, so it is ignored there.
+    ``columns`` sets the CSV/XLSX header; JSON writes whatever keys the records have.
+    """
+    if fmt == "xlsx":
+        return _write_xlsx(records, path, columns)
+    with _open_export(path, compress) as f:
+        if fmt == "csv":
+            return _write_csv(records, f, columns)
+        return _write_json(records, f, ndjson=(fmt == "ndjson"))
+
+
+def _export_stats(count, path, started):
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    size = os.path.getsize(path)
+    return {
+        'rows': count,
+        'bytes': size,
+        'elapsed_s': elapsed,
+        'rows_per_s': count / elapsed,
+        'mb_per_s': size / elapsed / 1e6,
+    }
+
+
+def export_completions(db, path, fmt="json", compress=False, date_from=None, date_to=None):
+    """Stream completions in ``date_from``..``date_to`` to ``path``; returns throughput stats.
+
+    Memory stays flat whatever the range: the cursor is read in
+    ``fetchmany`` batches and each record is serialised as it arrives.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    started = time.perf_counter()
+    count = write_export(export_records(db.iter_rows(date_from, date_to)), path, fmt, compress)
+    return _export_stats(count, path, started)
+
+
+def export_delta(db, path, fmt="json", compress=False, tombstones=False):
+    """Export only what changed since the last incremental export, then move the watermark.
+
+    New completions are selected by id, so the cost follows the size of the
+    delta rather than the history. With ``tombstones`` the file also lists
+    undone completions the receiver has already been sent. Returns the
+    ``export_completions`` stats plus ``since``; ``None`` when there was
+    nothing to send, in which case no file is left behind.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    last_id, last_seq, since = db.export_watermark()
+    head_id, head_seq = db.export_heads()
+    if not tombstones:
+        head_seq = last_seq
+    if head_id <= last_id and head_seq <= last_seq:
+        return None
+    started = time.perf_counter()
+    records = export_records(db.iter_since(last_id, head_id), "added")
+    if tombstones:
+        records = chain(records, export_records(db.iter_tombstones(last_seq, head_seq, last_id), "deleted"))
+    count = write_export(records, path, fmt, compress, DELTA_COLUMNS)
+    db.set_export_watermark(max(head_id, last_id), head_seq)
+    if not count:
+        # Only rows added and undone since the last export: the watermark moves past them, the file goes
+        os.remove(path)
+        return None
+    stats = _export_stats(count, path, started)
+    stats['since'] = since
+    return stats
+
+
+def describe_export(fname, stats):
+    return f"Exported {stats['rows']} rows to {fname} ({stats['bytes'] / 1024:.0f} KB, {stats['rows_per_s']:.0f} rows/s)"
+
+
+# -------------------------------------------------------------------
+# Summaries - plain functions so they can be prefetched before the Completed screen exists
+# -------------------------------------------------------------------
+def summary_sessions_signature(app, start_date, end_date):
+    """Session count per day in the range: day summaries also read ``day_history``, which is not in the DB."""
+    main_screen = app.get_main_screen() if hasattr(app, 'get_main_screen') else None
+    history = main_screen.day_history if main_screen else {}
+    signature = []
+    for day_str, rec in list(history.items()):
+        try:
+            day = datetime.strptime(day_str, "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        if start_date <= day <= end_date:
+            signature.append((day_str, len(rec) if isinstance(rec, list) else 1))
+    return tuple(sorted(signature))
+
+
+def summarise_day(app, day_date):
+    track_generation = app.get_track_store().generation if hasattr(app, 'get_track_store') else 0
+    key = (day_date, summary_sessions_signature(app, day_date, day_date), track_generation)
+    return app.db.memo('summary_day', key, lambda: _compute_day_summary(app, day_date))
+
+
+def _compute_day_summary(app, day_date):
+    start_dt = datetime(day_date.year, day_date.month, day_date.day, 0, 0, 0)
+    end_dt = datetime(day_date.year, day_date.month, day_date.day, 23, 59, 59)
+    items = []
+    try:
+        items = app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=100000, offset=0, cache=False)
+    except Exception:
+        items = []
+    outcomes = {"PIF": 0, "DA": 0, "Done": 0}
+    timestamps = []
+    for item in items:
+        oc = item['completion'].get('outcome', 'Done')
+        outcomes[oc] = outcomes.get(oc, 0) + 1
+        ts = item['completion'].get('timestamp')
+        try:
+            timestamps.append(datetime.fromisoformat(ts))
+        except Exception:
+            pass
+    hours_worked = None
+    main_screen = app.get_main_screen() if hasattr(app, 'get_main_screen') else None
+    day_str = day_date.strftime("%Y-%m-%d")
+    if main_screen and main_screen.day_history:
+        record = main_screen.day_history.get(day_str)
+        session = None
+        if record:
+            if isinstance(record, list):
+                if record:
+                    session = record[-1]
+            elif isinstance(record, dict):
+                session = record
+        if session:
             try:
-                dt_val = datetime.fromisoformat(ts)
-                if self.start_date == self.end_date:
-                    time_str = dt_val.strftime("%H:%M")
-                else:
-                    time_str = dt_val.strftime("%d/%m %H:%M")
+                st = datetime.fromisoformat(session.get('start_time'))
+                et = datetime.fromisoformat(session.get('end_time'))
+                hours_worked = (et - st).total_seconds() / 3600.0
             except Exception:
-                time_str = ts
-        info_row = MDBoxLayout(orientation='horizontal', size_hint_y=None, height=dp(22))
-        info_row.add_widget(MDLabel(text=outcome_text, theme_text_color="Primary"))
-        info_row.add_widget(MDLabel())
-        info_row.add_widget(MDLabel(text=time_str, theme_text_color="Secondary"))
-        layout.add_widget(info_row)
-        btn_row = MDBoxLayout(orientation='horizontal', size_hint_y=None, height=dp(28))
-        nav_btn = MDFlatButton(text="Navigate", size_hint=(None, None), size=(dp(80), dp(28)), font_size='11sp')
-        nav_btn.bind(on_release=lambda x: self._navigate_to_address(item))
-        btn_row.add_widget(nav_btn)
-        layout.add_widget(btn_row)
-        card.add_widget(layout)
-        return card
+                hours_worked = None
+    distance_km = None
+    try:
+        track = app.get_track_store().stats(day_str)
+    except Exception:
+        track = None
+    if track and track['samples']:
+        # Time actually covered by the recorded track beats session bounds or completion spread
+        hours_worked = (track['moving_s'] + track['idle_s']) / 3600.0
+        distance_km = track['distance_m'] / 1000.0
+    if hours_worked is None and timestamps:
+        earliest = min(timestamps)
+        latest = max(timestamps)
+        hours_worked = (latest - earliest).total_seconds() / 3600.0
+    return {
+        'date': day_date,
+        'outcomes': outcomes,
+        'hours': hours_worked,
+        'distance_km': distance_km,
+    }
+
+
+def summarise_range(app, start_date, end_date):
+    key = (start_date, end_date, summary_sessions_signature(app, start_date, end_date))
+    return app.db.memo('summary_range', key, lambda: _compute_range_summary(app, start_date, end_date))
+
+
+def _compute_range_summary(app, start_date, end_date):
+    start_dt = datetime(start_date.year, start_date.month, start_date.day, 0, 0, 0)
+    end_dt = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
+    try:
+        items = app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=1000000, offset=0, cache=False)
+    except Exception:
+        items = []
+    outcomes = {"PIF": 0, "DA": 0, "Done": 0}
+    timestamps = []
+    for item in items:
+        oc = item['completion'].get('outcome', 'Done')
+        outcomes[oc] = outcomes.get(oc, 0) + 1
+        ts = item['completion'].get('timestamp')
+        try:
+            timestamps.append(datetime.fromisoformat(ts))
+        except Exception:
+            pass
+    total_seconds = 0.0
+    main_screen = app.get_main_screen() if hasattr(app, 'get_main_screen') else None
+    ts_by_day = {}
+    for ts in timestamps:
+        day_key = ts.date()
+        ts_by_day.setdefault(day_key, []).append(ts)
+    current = start_date
+    while current <= end_date:
+        day_seconds = 0.0
+        day_str = current.strftime("%Y-%m-%d")
+        if main_screen and main_screen.day_history and day_str in main_screen.day_history:
+            rec = main_screen.day_history[day_str]
+            sessions = rec if isinstance(rec, list) else [rec]
+            for sess in sessions:
+                try:
+                    day_seconds += sess.get('duration_seconds', 0)
+                except Exception:
+                    pass
+        if day_seconds == 0 and ts_by_day.get(current):
+            day_ts = ts_by_day[current]
+            day_seconds = (max(day_ts) - min(day_ts)).total_seconds()
+        total_seconds += day_seconds
+        current += timedelta(days=1)
+    if total_seconds > 0:
+        hrs = int(total_seconds // 3600)
+        mins = int((total_seconds % 3600) // 60)
+        hours_text = f"{hrs}h {mins}m"
+    else:
+        hours_text = "N/A"
+    return {
+        'start_date': start_date,
+        'end_date': end_date,
+        'outcomes': outcomes,
+        'hours': hours_text,
+    }
 
-    def _navigate_to_address(self, item):
-        main_screen = self.app.get_main_screen() if hasattr(self.app, 'get_main_screen') else None
-        if main_screen:
-            lat = item.get('lat')
-            lng = item.get('lng')
-            main_screen.navigate_to_address(item['address'], -1, lat, lng, from_completed=True)
+
+SUMMARY_PRESETS = (
+    ("Today", start_of_today, end_of_today),
+    ("This week", start_of_week, end_of_week),
+    ("This month", start_of_month, end_of_month),
+)
+
+
+def preset_ranges():
+    """``[(name, start_date, end_date)]`` for the summary presets as of now."""
+    return [(name, start().date(), end().date()) for name, start, end in SUMMARY_PRESETS]
+
+
+def prefetch_summaries(app):
+    """Compute the preset summaries into the result cache; returns ``{name: summary}``."""
+    results = {}
+    for name, start, end in preset_ranges():
+        results[name] = summarise_day(app, start) if start == end else summarise_range(app, start, end)
+    return results
+
+
+def month_start(year, month, offset=0):
+    """First day of the month ``offset`` months away from ``year``/``month``."""
+    index = year * 12 + (month - 1) + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class MonthGrid(Widget):
+    """Month calendar drawn on the canvas: one cell per day with visit count and PIF takings."""
+    def __init__(self, on_day, on_swipe, **kwargs):
+        super().__init__(**kwargs)
+        self.on_day = on_day
+        self.on_swipe = on_swipe
+        self.first = date.today().replace(day=1)
+        self.totals = {}
+        self._cells = []
+        self._touch_start = None
+        self.bind(pos=self._draw, size=self._draw)
+
+    def set_month(self, first, totals):
+        self.first = first
+        self.totals = totals
+        self._draw()
+
+    def _draw(self, *args):
+        self.canvas.clear()
+        self._cells = []
+        header_h = dp(24)
+        cell_w = self.width / 7.0
+        next_month = month_start(self.first.year, self.first.month, 1)
+        days = (next_month - self.first).days
+        lead = self.first.weekday()
+        rows = (lead + days + 6) // 7
+        cell_h = max(dp(40), (self.height - header_h) / max(rows, 1))
+        today = date.today()
+        with self.canvas:
+            for col, name in enumerate(WEEKDAY_NAMES):
+                tex = _shared_text_texture(name, sp(11), _TEXT_SECONDARY)
+                Color(1, 1, 1, 1)
+                Rectangle(texture=tex, pos=(self.x + col * cell_w + (cell_w - tex.width) / 2, self.top - header_h + (header_h - tex.height) / 2), size=tex.size)
+            for day_number in range(1, days + 1):
+                slot = lead + day_number - 1
+                cx = self.x + (slot % 7) * cell_w
+                cy = self.top - header_h - (slot // 7 + 1) * cell_h
+                day = self.first.replace(day=day_number)
+                visits, pifs, amount = self.totals.get(day, (0, 0, 0.0))
+                if visits:
+                    Color(0.3, 0.69, 0.31, 0.15 + 0.5 * min(1.0, amount / 100.0) if amount else 0.12)
+                else:
+                    Color(0.5, 0.5, 0.5, 0.05)
+                Rectangle(pos=(cx + 1, cy + 1), size=(cell_w - 2, cell_h - 2))
+                if day == today:
+                    Color(*_BUTTON_BLUE)
+                    Line(rectangle=(cx + 1, cy + 1, cell_w - 2, cell_h - 2), width=1.2)
+                number = _shared_text_texture(str(day_number), sp(11), _TEXT_PRIMARY)
+                Color(1, 1, 1, 1)
+                Rectangle(texture=number, pos=(cx + dp(3), cy + cell_h - number.height - dp(2)), size=number.size)
+                if visits:
+                    lines = [f"£{amount:.0f}" if amount else f"{pifs} PIF", f"{visits} v"]
+                    y = cy + dp(3)
+                    for text in reversed(lines):
+                        tex = _shared_text_texture(text, sp(10), _TEXT_PRIMARY)
+                        Rectangle(texture=tex, pos=(cx + cell_w - tex.width - dp(3), y), size=tex.size)
+                        y += tex.height
+                self._cells.append((cx, cy, cell_w, cell_h, day))
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return False
+        self._touch_start = touch.pos
+        return True
+
+    def on_touch_up(self, touch):
+        if self._touch_start is None:
+            return False
+        x0, y0 = self._touch_start
+        self._touch_start = None
+        dx = touch.x - x0
+        if abs(dx) > dp(60) and abs(dx) > abs(touch.y - y0):
+            self.on_swipe(-1 if dx > 0 else 1)
+            return True
+        for cx, cy, w, h, day in self._cells:
+            if cx <= touch.x <= cx + w and cy <= touch.y <= cy + h:
+                self.on_day(day)
+                return True
+        return True
+
+
+class EarningsCalendarScreen(MDScreen):
+    """Month view of per-day visits and PIF takings; neighbouring months are fetched ahead of a swipe."""
+    def __init__(self, app_instance, **kwargs):
+        super().__init__(**kwargs)
+        self.app = app_instance
+        self.name = "earnings_calendar"
+        self.first = date.today().replace(day=1)
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = MDBoxLayout(orientation='vertical')
+        self.toolbar = MDTopAppBar(title="", size_hint_y=None, height=dp(56))
+        self.toolbar.left_action_items = [["arrow-left", lambda x: self.go_back()]]
+        self.toolbar.right_action_items = [
+            ["chevron-left", lambda x: self.show_month(-1)],
+            ["chevron-right", lambda x: self.show_month(1)],
+        ]
+        layout.add_widget(self.toolbar)
+        self.total_label = MDLabel(text="", halign="center", theme_text_color="Secondary", font_size='13sp', size_hint_y=None, height=dp(32))
+        layout.add_widget(self.total_label)
+        self.grid = MonthGrid(self._on_day, self.show_month)
+        layout.add_widget(self.grid)
+        self.add_widget(layout)
+
+    def go_back(self):
+        if self.manager:
+            self.manager.current = 'completed_summary'
+
+    def on_pre_enter(self, *args):
+        self.show_month(0)
+
+    def show_month(self, offset):
+        self.first = month_start(self.first.year, self.first.month, offset)
+        self.toolbar.title = self.first.strftime("%B %Y")
+        first = self.first
+        db = self.app.db
+
+        def worker():
+            try:
+                totals = db.day_totals(first.year, first.month)
+                error = None
+            except Exception as e:
+                totals, error = {}, str(e)
+            Clock.schedule_once(lambda dt: self._on_month_loaded(first, totals, error), 0)
+            # Neighbours land in the result cache so the next swipe is a cache hit
+            for step in (-1, 1):
+                neighbour = month_start(first.year, first.month, step)
+                try:
+                    db.day_totals(neighbour.year, neighbour.month)
+                except Exception as e:
+                    logger.warning("Calendar: prefetch error: %s", e)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_month_loaded(self, first, totals, error):
+        if first != self.first:
+            return
+        if error:
+            toast(f"Could not load month: {error}")
+        self.grid.set_month(first, totals)
+        visits = sum(t[0] for t in totals.values())
+        pifs = sum(t[1] for t in totals.values())
+        amount = sum(t[2] for t in totals.values())
+        self.total_label.text = f"£{amount:.2f} from {pifs} PIF • {visits} visits on {len(totals)} days"
+
+    def _on_day(self, day):
+        if not self.manager.has_screen("completed_summary"):
+            return
+        summary_screen = self.manager.get_screen("completed_summary")
+        summary_screen.start_date = summary_screen.end_date = day
+        summary_screen.load_summary()
+        self.manager.current = "completed_summary"
 
 
 class CompletedSummaryScreen(MDScreen):
@@ -1326,6 +5086,7 @@ class CompletedSummaryScreen(MDScreen):
         self._date_input_dialog = None
         self._start_date_field = None
         self._end_date_field = None
+        self._details_cache = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1335,9 +5096,18 @@ class CompletedSummaryScreen(MDScreen):
         toolbar.right_action_items = [
             ["calendar-range", lambda x: self.open_date_picker()],
             ["download", lambda x: self.export_summary()],
-            ["file-export", lambda x: self.export_summary_json()],
+            ["file-export", lambda x: self.show_export_dialog()],
+            ["chart-bar", lambda x: self.show_stats()],
+            ["calendar-month", lambda x: self.show_calendar()],
         ]
         layout.add_widget(toolbar)
+        presets_row = MDBoxLayout(orientation='horizontal', size_hint_y=None, height=dp(44), spacing=dp(4), padding=[dp(8), dp(4)])
+        self._preset_buttons = {}
+        for name, _, _ in SUMMARY_PRESETS:
+            button = MDFlatButton(text=name, font_size='12sp', on_release=lambda x, n=name: self.select_preset(n))
+            self._preset_buttons[name] = button
+            presets_row.add_widget(button)
+        layout.add_widget(presets_row)
         self.scroll = MDScrollView()
         self.content_layout = MDBoxLayout(orientation='vertical', adaptive_height=True, spacing=dp(8), padding=[dp(12), dp(12)])
         self.scroll.add_widget(self.content_layout)
@@ -1349,6 +5119,38 @@ class CompletedSummaryScreen(MDScreen):
         if self.manager:
             self.manager.current = 'main_screen'
 
+    def on_pre_enter(self, *args):
+        self.update_presets()
+
+    def update_presets(self):
+        presets = getattr(self.app, 'summary_presets', {})
+        for name, button in self._preset_buttons.items():
+            summary = presets.get(name)
+            if summary is None:
+                button.text = name
+            else:
+                visits = sum(summary['outcomes'].values())
+                button.text = f"{name}: {visits} ({summary['outcomes'].get('PIF', 0)} PIF)"
+
+    def select_preset(self, name):
+        for preset, start, end in preset_ranges():
+            if preset == name:
+                self.start_date, self.end_date = start, end
+                self.load_summary()
+                return
+
+    def show_calendar(self):
+        if not self.manager.has_screen("earnings_calendar"):
+            self.manager.add_widget(EarningsCalendarScreen(self.app, name="earnings_calendar"))
+        self.manager.current = "earnings_calendar"
+
+    def show_stats(self):
+        if not any(screen.name == "stats" for screen in self.manager.screens):
+            self.manager.add_widget(StatsScreen(self.app, name="stats"))
+        stats_screen = self.manager.get_screen("stats")
+        stats_screen.show_range(self.start_date, self.end_date)
+        self.manager.current = "stats"
+
     def open_date_picker(self):
         """
         Open a date picker dialog that supports both single-date and
@@ -1383,19 +5185,20 @@ class CompletedSummaryScreen(MDScreen):
         """
         # Try to import MDDatePicker from either the new or old module paths.
         MDDatePicker = None  # type: ignore
-        try:
-            from kivymd.uix.picker import MDDatePicker  # type: ignore
-        except Exception:
-            try:
-                from kivymd.uix.pickers import MDDatePicker  # type: ignore
-            except Exception:
-                MDDatePicker = None  # type: ignore
+        for module_name in ("kivymd.uix.picker", "kivymd.uix.pickers"):
+            if module_available(module_name):
+                try:
+                    MDDatePicker = lazy_import(module_name, "MDDatePicker")  # type: ignore
+                    break
+                except Exception:
+                    MDDatePicker = None  # type: ignore
         # Try to import MDModalDatePicker (available in KivyMD 2.0.0+).
         MDModalDatePicker = None  # type: ignore
-        try:
-            from kivymd.uix.pickers import MDModalDatePicker  # type: ignore
-        except Exception:
-            MDModalDatePicker = None  # type: ignore
+        if PICKERS_AVAILABLE:
+            try:
+                MDModalDatePicker = lazy_import("kivymd.uix.pickers", "MDModalDatePicker")  # type: ignore
+            except Exception:
+                MDModalDatePicker = None  # type: ignore
         # First, attempt to use the modern MDDatePicker with range support.
         if MDDatePicker:
             try:
@@ -1653,6 +5456,9 @@ class CompletedSummaryScreen(MDScreen):
         self.content_layout.clear_widgets()
         if not self.start_date or not self.end_date:
             return
+        stats = self.app.db.cache_stats()
+        logger.debug("ResultCache: %d entries, hit rate %.0f%% (%d/%d)",
+                     stats['entries'], stats['hit_rate'] * 100, stats['hits'], stats['hits'] + stats['misses'])
         if self.start_date == self.end_date:
             summary = self._summarise_day(self.start_date)
             card = self._create_day_card(summary)
@@ -1665,51 +5471,10 @@ class CompletedSummaryScreen(MDScreen):
         self.content_layout.add_widget(card)
 
     def _summarise_day(self, day_date):
-        start_dt = datetime(day_date.year, day_date.month, day_date.day, 0, 0, 0)
-        end_dt = datetime(day_date.year, day_date.month, day_date.day, 23, 59, 59)
-        items = []
-        try:
-            items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=100000, offset=0)
-        except Exception:
-            items = []
-        outcomes = {"PIF": 0, "DA": 0, "Done": 0}
-        timestamps = []
-        for item in items:
-            oc = item['completion'].get('outcome', 'Done')
-            outcomes[oc] = outcomes.get(oc, 0) + 1
-            ts = item['completion'].get('timestamp')
-            try:
-                timestamps.append(datetime.fromisoformat(ts))
-            except Exception:
-                pass
-        hours_worked = None
-        main_screen = self.app.get_main_screen() if hasattr(self.app, 'get_main_screen') else None
-        day_str = day_date.strftime("%Y-%m-%d")
-        if main_screen and main_screen.day_history:
-            record = main_screen.day_history.get(day_str)
-            session = None
-            if record:
-                if isinstance(record, list):
-                    if record:
-                        session = record[-1]
-                elif isinstance(record, dict):
-                    session = record
-            if session:
-                try:
-                    st = datetime.fromisoformat(session.get('start_time'))
-                    et = datetime.fromisoformat(session.get('end_time'))
-                    hours_worked = (et - st).total_seconds() / 3600.0
-                except Exception:
-                    hours_worked = None
-        if hours_worked is None and timestamps:
-            earliest = min(timestamps)
-            latest = max(timestamps)
-            hours_worked = (latest - earliest).total_seconds() / 3600.0
-        return {
-            'date': day_date,
-            'outcomes': outcomes,
-            'hours': hours_worked,
-        }
+        return summarise_day(self.app, day_date)
+
+    def _summarise_range(self, start_date, end_date):
+        return summarise_range(self.app, start_date, end_date)
 
     def _create_day_card(self, summary):
         card = MDCard(size_hint_y=None, height=dp(100), elevation=2, padding=dp(12), radius=[6])
@@ -1723,6 +5488,8 @@ class CompletedSummaryScreen(MDScreen):
             hours_text = f"{hours_int}h {minutes_int}m"
         else:
             hours_text = "N/A"
+        if summary.get('distance_km') is not None:
+            hours_text += f" • {summary['distance_km']:.1f} km"
         hours_label = MDLabel(text=f"Hours: {hours_text}", theme_text_color="Secondary", font_size='12sp')
         left_col.add_widget(date_label)
         left_col.add_widget(hours_label)
@@ -1748,64 +5515,25 @@ class CompletedSummaryScreen(MDScreen):
         card.add_widget(layout)
         return card
 
-    def _on_view_day(self, day_date):
-        details_screen = DayDetailsScreen(self.app, day_date)
-        if not any(s.name == details_screen.name for s in self.manager.screens):
-            self.manager.add_widget(details_screen)
-        self.manager.current = details_screen.name
+    def _get_details_cache(self):
+        if self._details_cache is None:
+            self._details_cache = DetailScreenCache(self.manager)
+        return self._details_cache
 
-    def _summarise_range(self, start_date, end_date):
+    def _range_signature(self, start_date, end_date):
         start_dt = datetime(start_date.year, start_date.month, start_date.day, 0, 0, 0)
         end_dt = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
         try:
-            items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=1000000, offset=0)
+            return self.app.db.range_signature(start_dt, end_dt)
         except Exception:
-            items = []
-        outcomes = {"PIF": 0, "DA": 0, "Done": 0}
-        timestamps = []
-        for item in items:
-            oc = item['completion'].get('outcome', 'Done')
-            outcomes[oc] = outcomes.get(oc, 0) + 1
-            ts = item['completion'].get('timestamp')
-            try:
-                timestamps.append(datetime.fromisoformat(ts))
-            except Exception:
-                pass
-        total_seconds = 0.0
-        main_screen = self.app.get_main_screen() if hasattr(self.app, 'get_main_screen') else None
-        ts_by_day = {}
-        for ts in timestamps:
-            day_key = ts.date()
-            ts_by_day.setdefault(day_key, []).append(ts)
-        current = start_date
-        while current <= end_date:
-            day_seconds = 0.0
-            day_str = current.strftime("%Y-%m-%d")
-            if main_screen and main_screen.day_history and day_str in main_screen.day_history:
-                rec = main_screen.day_history[day_str]
-                sessions = rec if isinstance(rec, list) else [rec]
-                for sess in sessions:
-                    try:
-                        day_seconds += sess.get('duration_seconds', 0)
-                    except Exception:
-                        pass
-            if day_seconds == 0 and ts_by_day.get(current):
-                day_ts = ts_by_day[current]
-                day_seconds = (max(day_ts) - min(day_ts)).total_seconds()
-            total_seconds += day_seconds
-            current += timedelta(days=1)
-        if total_seconds > 0:
-            hrs = int(total_seconds // 3600)
-            mins = int((total_seconds % 3600) // 60)
-            hours_text = f"{hrs}h {mins}m"
-        else:
-            hours_text = "N/A"
-        return {
-            'start_date': start_date,
-            'end_date': end_date,
-            'outcomes': outcomes,
-            'hours': hours_text,
-        }
+            return None
+
+    def _on_view_day(self, day_date):
+        self._get_details_cache().open(
+            f"details_{day_date.isoformat()}",
+            self._range_signature(day_date, day_date),
+            lambda: DayDetailsScreen(self.app, day_date),
+        )
 
     def _create_range_card(self, summary):
         card = MDCard(size_hint_y=None, height=dp(100), elevation=2, padding=dp(12), radius=[6])
@@ -1842,37 +5570,27 @@ class CompletedSummaryScreen(MDScreen):
         return card
 
     def _on_view_range(self, start_date, end_date):
-        details_screen = RangeDetailsScreen(self.app, start_date, end_date)
-        if not any(s.name == details_screen.name for s in self.manager.screens):
-            self.manager.add_widget(details_screen)
-        self.manager.current = details_screen.name
+        self._get_details_cache().open(
+            f"details_{start_date.isoformat()}_{end_date.isoformat()}",
+            self._range_signature(start_date, end_date),
+            lambda: RangeDetailsScreen(self.app, start_date, end_date),
+        )
 
     def export_summary(self):
-        if self.start_date and self.end_date:
-            start_dt = datetime(self.start_date.year, self.start_date.month, self.start_date.day, 0, 0, 0)
-            end_dt = datetime(self.end_date.year, self.end_date.month, self.end_date.day, 23, 59, 59)
-        else:
-            start_dt = None
-            end_dt = None
+        start_dt, end_dt = self._export_range()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         fname = f"completed_addresses_{timestamp}.txt"
-        if platform == 'android' and ANDROID_AVAILABLE:
-            try:
-                app_path = PythonActivity.mActivity.getFilesDir().getAbsolutePath()
-                filepath = os.path.join(app_path, fname)
-            except Exception:
-                filepath = fname
-        else:
-            filepath = os.path.join(os.path.expanduser("~"), fname)
+        filepath = self._export_path(fname)
         def worker():
             try:
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    offset = 0
+                    after = None
                     batch = 500
                     while True:
-                        items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=batch, offset=offset)
+                        items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=batch, cache=False, after=after)
                         if not items:
                             break
+                        after = CompletionDB.page_key(items[-1])
                         for item in items:
                             comp = item['completion']
                             idx = item['index'] + 1
@@ -1886,73 +5604,155 @@ class CompletedSummaryScreen(MDScreen):
                             gps_text = f" | GPS: {lat},{lng}" if lat and lng else ""
                             line = f"{idx}. {addr} | {outcome_text} | {ts}{gps_text}\n"
                             f.write(line)
-                        offset += len(items)
                 Clock.schedule_once(lambda dt: toast(f"Exported to {fname}"), 0)
             except Exception as e:
-                Clock.schedule_once(lambda dt: toast(f"Export failed: {str(e)}"), 0)
+                error = str(e)
+                Clock.schedule_once(lambda dt, error=error: toast(f"Export failed: {error}"), 0)
         threading.Thread(target=worker, daemon=True).start()
 
-    def export_summary_json(self):
+    def _export_range(self):
         if self.start_date and self.end_date:
             start_dt = datetime(self.start_date.year, self.start_date.month, self.start_date.day, 0, 0, 0)
             end_dt = datetime(self.end_date.year, self.end_date.month, self.end_date.day, 23, 59, 59)
-        else:
-            start_dt = None
-            end_dt = None
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fname = f"completed_addresses_{timestamp}.json"
+            return start_dt, end_dt
+        return None, None
+
+    def _export_path(self, fname):
         if platform == 'android' and ANDROID_AVAILABLE:
             try:
                 app_path = PythonActivity.mActivity.getFilesDir().getAbsolutePath()
-                filepath = os.path.join(app_path, fname)
+                return os.path.join(app_path, fname)
             except Exception:
-                filepath = fname
-        else:
-            filepath = os.path.join(os.path.expanduser("~"), fname)
+                return fname
+        return os.path.join(os.path.expanduser("~"), fname)
+
+    def show_export_dialog(self):
+        MDCheckbox = lazy_import('kivymd.uix.selectioncontrol', 'MDCheckbox')
+        content = MDBoxLayout(orientation='vertical', spacing=dp(8), adaptive_height=True)
+        gzip_row = MDBoxLayout(orientation='horizontal', spacing=dp(8), size_hint_y=None, height=dp(40))
+        gzip_box = MDCheckbox(size_hint=(None, None), size=(dp(40), dp(40)))
+        gzip_row.add_widget(gzip_box)
+        gzip_row.add_widget(MDLabel(text="Compress (gzip)", theme_text_color="Primary"))
+        content.add_widget(gzip_row)
+        _, _, since = self.app.db.export_watermark()
+        delta_row = MDBoxLayout(orientation='horizontal', spacing=dp(8), size_hint_y=None, height=dp(40))
+        delta_box = MDCheckbox(size_hint=(None, None), size=(dp(40), dp(40)))
+        delta_row.add_widget(delta_box)
+        delta_row.add_widget(MDLabel(text=f"Only new since last export ({since.replace('T', ' ') if since else 'never'})", theme_text_color="Primary"))
+        content.add_widget(delta_row)
+        tomb_row = MDBoxLayout(orientation='horizontal', spacing=dp(8), size_hint_y=None, height=dp(40))
+        tomb_box = MDCheckbox(size_hint=(None, None), size=(dp(40), dp(40)))
+        tomb_row.add_widget(tomb_box)
+        tomb_row.add_widget(MDLabel(text="Include undone completions", theme_text_color="Primary"))
+        content.add_widget(tomb_row)
+        buttons_row = MDBoxLayout(orientation='horizontal', spacing=dp(8), adaptive_height=True)
+        for fmt in EXPORT_FORMATS:
+            if fmt == "xlsx" and not OPENPYXL_AVAILABLE:
+                continue
+            buttons_row.add_widget(MDRaisedButton(
+                text=fmt.upper(),
+                on_release=lambda x, f=fmt: self._start_export(f, gzip_box.active, delta_box.active, tomb_box.active)))
+        content.add_widget(buttons_row)
+        self._export_dialog = MDDialog(title="Export completions", type="custom", content_cls=content,
+                                       buttons=[MDFlatButton(text="Cancel", on_release=lambda x: self._export_dialog.dismiss())])
+        self._export_dialog.open()
+
+    def _start_export(self, fmt, compress=False, delta=False, tombstones=False):
+        """Export the selected range, or with ``delta`` everything since the last incremental export."""
+        if getattr(self, '_export_dialog', None):
+            self._export_dialog.dismiss()
+        start_dt, end_dt = self._export_range()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        compress = compress and fmt != "xlsx"
+        prefix = "completed_delta" if delta else "completed_addresses"
+        fname = f"{prefix}_{timestamp}{EXPORT_EXTENSIONS[fmt]}" + (".gz" if compress else "")
+        filepath = self._export_path(fname)
+        db = self.app.db
+
         def worker():
             try:
-                data = []
-                offset = 0
-                batch = 500
-                while True:
-                    items = self.app.db.query(start_dt, end_dt, outcome=None, search_text="", limit=batch, offset=offset)
-                    if not items:
-                        break
-                    for item in items:
-                        comp = item['completion']
-                        data.append({
-                            'index': item['index'] + 1,
-                            'address': item['address'],
-                            'lat': item.get('lat'),
-                            'lng': item.get('lng'),
-                            'outcome': comp.get('outcome', 'Done'),
-                            'amount': comp.get('amount', ''),
-                            'timestamp': comp.get('timestamp', '')
-                        })
-                    offset += len(items)
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
-                Clock.schedule_once(lambda dt: toast(f"Exported to {fname}"), 0)
+                if delta:
+                    stats = export_delta(db, filepath, fmt, compress, tombstones)
+                    if stats is None:
+                        Clock.schedule_once(lambda dt: toast("Nothing new since the last export"), 0)
+                        return
+                else:
+                    stats = export_completions(db, filepath, fmt, compress, start_dt, end_dt)
+                logger.info("Export: %s, %d rows, %d bytes in %.2f s (%.0f rows/s, %.1f MB/s)",
+                            fmt, stats['rows'], stats['bytes'], stats['elapsed_s'], stats['rows_per_s'], stats['mb_per_s'])
+                Clock.schedule_once(lambda dt: toast(describe_export(fname, stats)), 0)
             except Exception as e:
-                Clock.schedule_once(lambda dt: toast(f"Export failed: {str(e)}"), 0)
+                error = str(e)
+                Clock.schedule_once(lambda dt, error=error: toast(f"Export failed: {error}"), 0)
         threading.Thread(target=worker, daemon=True).start()
 
+    def export_summary_json(self):
+        self._start_export("json")
+
 
 class AddressNavigatorApp(MDApp):
     def build(self):
+        self.startup = StartupTimer()
         self.title = "Address Navigator"
         self.theme_cls.theme_style = "Light"
         self.theme_cls.primary_palette = "Blue"
         self.db = CompletionDB(self._get_db_path())
+        self._track_store_lock = threading.Lock()
+        self.summary_presets = {}  # preset name -> summary, filled in the background
+        self.startup.mark("database opened")
         self.screen_manager = MDScreenManager()
+        # Secondary screens (completed summary, details) are created on first navigation
         self.main_screen = MainScreen(name="main_screen")
         self.screen_manager.add_widget(self.main_screen)
-        self.screen_manager.add_widget(CompletedSummaryScreen(self, name="completed_summary"))
         return self.screen_manager
 
     def get_main_screen(self):
         return self.main_screen
 
+    def start_summary_prefetch(self):
+        """Recompute the today/week/month summaries off the UI thread; coalesces overlapping requests."""
+        if getattr(self, '_prefetching', False):
+            self._prefetch_again = True
+            return
+        self._prefetching = True
+        self._prefetch_again = False
+
+        def worker():
+            try:
+                started = time.perf_counter()
+                results = prefetch_summaries(self)
+                logger.info("Summaries: prefetched %d presets in %.0f ms", len(results), (time.perf_counter() - started) * 1000)
+                error = None
+            except Exception as e:
+                results, error = None, str(e)
+            Clock.schedule_once(lambda dt: self._on_summaries_prefetched(results, error), 0)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_summaries_prefetched(self, results, error):
+        self._prefetching = False
+        if error:
+            logger.warning("Summaries: prefetch error: %s", error)
+        else:
+            self.summary_presets = results
+            if self.screen_manager.has_screen("completed_summary"):
+                self.screen_manager.get_screen("completed_summary").update_presets()
+        if self._prefetch_again:
+            self.start_summary_prefetch()
+
+    def get_track_store(self):
+        # First use can come from the summary prefetch worker as well as the UI thread;
+        # both must get the same store so they share its write lock and generation.
+        with self._track_store_lock:
+            if getattr(self, 'track_store', None) is None:
+                self.track_store = TrackStore(self.db.db_path)
+        return self.track_store
+
+    def on_pause(self):
+        recorder = self.main_screen._track_recorder if getattr(self, 'main_screen', None) else None
+        if recorder is not None:
+            recorder.flush(background=True)
+        return True
+
     def _get_db_path(self):
         fname = "address_navigator.db"
         if platform == 'android' and ANDROID_AVAILABLE:
@@ -1965,4 +5765,7 @@ class AddressNavigatorApp(MDApp):
 
 
 if __name__ == "__main__":
-    AddressNavigatorApp().run()
+    if os.environ.get("ADDRESS_NAV_BENCH") == "cards":
+        CardBenchmarkApp().run()
+    else:
+        AddressNavigatorApp().run()
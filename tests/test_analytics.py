@@ -0,0 +1,47 @@
+from main import CompletionColumns, compute_analytics
+
+
+def rows():
+    # Monday 2026-10-12 and Tuesday 2026-10-13; LS1 gets 5 visits, YO1 only 2
+    return [
+        ("1 High St, Leeds LS1 6DT", 53.8, -1.55, "PIF", 10.0, "2026-10-12T09:00:00"),
+        ("2 High St, Leeds LS1 6DT", 53.8, -1.55, "DA", None, "2026-10-12T09:30:00"),
+        ("3 High St, Leeds LS1 6DT", None, None, "PIF", 20.0, "2026-10-12T11:00:00"),
+        ("4 High St, Leeds LS1 6DT", 53.8, -1.55, "Done", None, "2026-10-13T14:00:00"),
+        ("5 High St, Leeds LS1 6DT", 53.8, -1.55, "DA", None, "2026-10-13T15:00:00"),
+        ("1 Low Rd, York YO1 6HT", 53.9, -1.08, "PIF", 5.0, "2026-10-13T15:30:00"),
+        ("2 Low Rd, York YO1 6HT", 53.9, -1.08, "DA", None, "2026-10-13T16:00:00"),
+        ("No postcode", None, None, "DA", None, "not a timestamp"),
+    ]
+
+
+def test_columns_skip_bad_timestamps_and_code_areas():
+    cols = CompletionColumns(rows())
+    assert len(cols) == 7
+    assert cols.areas == ["LS1", "YO1"]
+    assert list(cols.area) == [0, 0, 0, 0, 0, 1, 1]
+
+
+def test_totals_rates_and_hours():
+    stats = compute_analytics(CompletionColumns(rows()))
+    assert stats['visits'] == 7 and stats['pif'] == 3
+    assert abs(stats['pif_rate'] - 3 / 7) < 1e-9
+    assert stats['amount'] == 35.0
+    assert stats['days'] == 2
+    assert stats['hours_worked'] == 2.0 + 2.0  # 09:00-11:00 and 14:00-16:00
+    assert stats['earnings_per_hour'] == 35.0 / 4.0
+    assert stats['earnings_by_hour'][9] == 10.0 and stats['earnings_by_hour'][11] == 20.0
+
+
+def test_heatmap_trend_and_areas():
+    stats = compute_analytics(CompletionColumns(rows()))
+    assert stats['heatmap'][0][9] == 2 and stats['heatmap'][1][15] == 2
+    assert stats['heatmap_pif'][0][9] == 1 and sum(map(sum, stats['heatmap_pif'])) == 3
+    assert stats['pif_trend'] == [{'week': "2026-W42", 'visits': 7, 'pif': 3, 'rate': 3 / 7, 'amount': 35.0}]
+    # YO1 has too few visits to rank
+    assert stats['areas'] == [{'area': "LS1", 'visits': 5, 'pif': 2, 'rate': 0.4, 'amount': 30.0}]
+
+
+def test_empty_range():
+    stats = compute_analytics(CompletionColumns([]))
+    assert stats['visits'] == 0 and stats['earnings_per_hour'] is None and stats['areas'] == []
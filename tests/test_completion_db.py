@@ -0,0 +1,79 @@
+from datetime import date, datetime
+
+import pytest
+
+from main import CompletionDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    return CompletionDB(str(tmp_path / "completions.db"))
+
+
+def add(db, idx, ts, outcome="DA", amount=None):
+    db.insert_completion(idx, f"{idx} High St", 51.5, -0.1, outcome, amount, ts)
+
+
+def pages(db, size, **filters):
+    after = None
+    while True:
+        items = db.query(limit=size, after=after, **filters)
+        if not items:
+            return
+        yield items
+        after = CompletionDB.page_key(items[-1])
+
+
+def test_keyset_pages_are_stable_across_equal_timestamps(db):
+    for i in range(12):
+        add(db, i, "2026-10-19T09:00:00")
+    for i in range(12, 20):
+        add(db, i, f"2026-10-19T10:{i:02d}:00")
+    seen = [item['index'] for page in pages(db, 5) for item in page]
+    assert seen == list(range(19, -1, -1))
+
+
+def test_rows_added_while_paging_do_not_shift_later_pages(db):
+    for i in range(10):
+        add(db, i, f"2026-10-19T09:{i:02d}:00")
+    seen = []
+    for n, page in enumerate(pages(db, 3)):
+        if n == 1:
+            add(db, 99, "2026-10-19T11:00:00")
+        seen.extend(item['index'] for item in page)
+    assert seen == list(range(9, -1, -1))
+
+
+def test_filters_share_one_where_builder(db):
+    for i in range(10):
+        add(db, i, f"2026-10-1{i}T09:00:00", "PIF" if i % 2 else "DA", 5.0 if i % 2 else None)
+    date_from, date_to = datetime(2026, 10, 12), datetime(2026, 10, 15, 23, 59, 59)
+    assert [item['index'] for item in db.query(date_from, date_to)] == [5, 4, 3, 2]
+    assert db.count(date_from, date_to, outcome="PIF") == 2
+    assert db.count(search_text="3 HIGH") == 1
+    assert len(list(db.iter_rows(date_from, date_to))) == 4
+    assert len(db.columns(date_from, date_to)) == 4
+    assert db.range_signature(date_from, date_to) == (4, 6)
+    assert len(db.visit_history(date_from)) == 8
+
+
+def test_memoised_reads_are_invalidated_by_writes(db):
+    add(db, 0, "2026-10-19T09:00:00")
+    assert db.count() == 1 and db.count() == 1
+    assert db.cache_stats()['hits'] == 1
+    add(db, 1, "2026-10-19T09:05:00")
+    assert db.count() == 2
+    db.delete_latest_by_idx(0)
+    assert [item['index'] for item in db.query()] == [1]
+    db.clear_all()
+    assert db.count() == 0 and db.query() == []
+
+
+def test_day_totals_group_one_month(db):
+    add(db, 0, "2026-09-30T23:59:00", "PIF", 9.0)
+    add(db, 1, "2026-10-01T09:00:00", "PIF", 10.0)
+    add(db, 2, "2026-10-01T10:00:00", "DA")
+    add(db, 3, "2026-10-31T18:00:00", "PIF", 2.5)
+    add(db, 4, "2026-11-01T00:00:00", "Done")
+    assert db.day_totals(2026, 10) == {date(2026, 10, 1): (2, 1, 10.0), date(2026, 10, 31): (1, 1, 2.5)}
+    assert db.day_totals(2026, 12) == {}
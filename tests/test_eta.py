@@ -0,0 +1,25 @@
+import pytest
+
+from main import eta_labels, format_eta
+
+
+@pytest.mark.parametrize("distance_m, text", [
+    (0, "0 m · 1 min"),
+    (380, "400 m · 1 min"),
+    (974, "950 m · 3 min"),
+    (999, "1.0 km · 3 min"),
+    (1049, "1.0 km · 3 min"),
+    (2460, "2.5 km · 7 min"),
+    (9949, "9.9 km · 27 min"),
+    (9999, "10 km · 27 min"),
+    (123456, "123 km · 334 min"),
+])
+def test_format_eta_rounds_before_picking_the_unit(distance_m, text):
+    assert format_eta(distance_m) == text
+
+
+def test_eta_labels_skip_stops_already_reached():
+    origin = (51.5, -0.1)
+    labels = eta_labels(origin, [(51.5, -0.1), (51.5001, -0.1), (51.51, -0.1)])
+    assert labels[:2] == ["", ""]
+    assert labels[2] == format_eta(1112)
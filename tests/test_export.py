@@ -0,0 +1,129 @@
+import csv
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+from main import EXPORT_COLUMNS, CompletionDB, export_completions, export_delta, export_records, write_export
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = CompletionDB(str(tmp_path / "completions.db"))
+    db.insert_completion(0, "1 High St, Leeds", 53.8, -1.55, "PIF", 12.5, "2026-10-19T09:00:00")
+    db.insert_completion(1, "2 \"Quoted\" Rd, Leeds", None, None, "DA", None, "2026-10-19T09:30:00")
+    db.insert_completion(2, "3 Café Lane", 53.9, -1.5, None, None, "2026-10-20T10:00:00")
+    return db
+
+
+EXPECTED = [
+    {'index': 3, 'address': "3 Café Lane", 'lat': 53.9, 'lng': -1.5, 'outcome': "Done", 'amount': None, 'timestamp': "2026-10-20T10:00:00"},
+    {'index': 2, 'address': "2 \"Quoted\" Rd, Leeds", 'lat': None, 'lng': None, 'outcome': "DA", 'amount': None, 'timestamp': "2026-10-19T09:30:00"},
+    {'index': 1, 'address': "1 High St, Leeds", 'lat': 53.8, 'lng': -1.55, 'outcome': "PIF", 'amount': 12.5, 'timestamp': "2026-10-19T09:00:00"},
+]
+
+
+def test_json_export_streams_every_row_newest_first(db, tmp_path):
+    path = tmp_path / "out.json"
+    stats = export_completions(db, str(path), "json")
+    assert json.loads(path.read_text(encoding="utf-8")) == EXPECTED
+    assert stats['rows'] == 3 and stats['bytes'] == path.stat().st_size
+
+
+def test_gzipped_ndjson_has_one_record_per_line(db, tmp_path):
+    path = tmp_path / "out.ndjson.gz"
+    export_completions(db, str(path), "ndjson", compress=True)
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == EXPECTED
+
+
+def test_empty_json_export_is_an_empty_array(tmp_path):
+    path = tmp_path / "out.json"
+    assert write_export(iter(()), str(path), "json") == 0
+    assert json.loads(path.read_text(encoding="utf-8")) == []
+
+
+def test_unknown_format_is_rejected(db, tmp_path):
+    with pytest.raises(ValueError):
+        export_completions(db, str(tmp_path / "out.txt"), "txt")
+
+
+def test_csv_export_quotes_and_keeps_header(db, tmp_path):
+    path = tmp_path / "out.csv"
+    export_completions(db, str(path), "csv")
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert rows[2] == ["2", "2 \"Quoted\" Rd, Leeds", "", "", "DA", "", "2026-10-19T09:30:00"]
+    assert rows[3][5] == "12.50"
+    assert len(rows) == 4
+
+
+def test_xlsx_export_writes_typed_cells(db, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "out.xlsx"
+    export_completions(db, str(path), "xlsx", compress=True)  # compress is ignored for xlsx
+    sheet = openpyxl.load_workbook(path, read_only=True)["Completions"]
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0] == tuple(column.title() for column in EXPORT_COLUMNS)
+    assert rows[3] == (1, "1 High St, Leeds", 53.8, -1.55, "PIF", 12.5, datetime(2026, 10, 19, 9, 0))
+    assert rows[1][5] is None
+
+
+def test_records_can_carry_delta_columns():
+    rows = [(7, 0, "1 High St", 53.8, -1.55, "PIF", 5.0, "2026-10-19T09:00:00")]
+    assert list(export_records(rows, "added")) == [{
+        'id': 7, 'change': "added", 'index': 1, 'address': "1 High St", 'lat': 53.8, 'lng': -1.55,
+        'outcome': "PIF", 'amount': 5.0, 'timestamp': "2026-10-19T09:00:00",
+    }]
+
+
+def read_delta(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return [(int(row['id']), row['change'], row['address']) for row in csv.DictReader(f)]
+
+
+def test_delta_exports_only_what_changed_since_the_watermark(db, tmp_path):
+    first = tmp_path / "d1.csv"
+    stats = export_delta(db, str(first), "csv")
+    assert stats['rows'] == 3 and stats['since'] is None
+    assert [change for _, change, _ in read_delta(first)] == ["added"] * 3
+    assert export_delta(db, str(tmp_path / "d2.csv")) is None
+    assert not (tmp_path / "d2.csv").exists()
+
+    db.insert_completion(5, "6 New St", None, None, "DA", None, "2026-10-21T09:00:00")
+    db.delete_latest_by_idx(0)
+    third = tmp_path / "d3.csv"
+    assert export_delta(db, str(third), "csv")['rows'] == 1  # deletions are opt-in
+    fourth = tmp_path / "d4.csv"
+    assert export_delta(db, str(fourth), "csv", tombstones=True)['rows'] == 1
+    assert read_delta(third) == [(4, "added", "6 New St")]
+    assert read_delta(fourth) == [(1, "deleted", "1 High St, Leeds")]
+
+
+def test_rows_added_and_undone_between_exports_leave_no_file(db, tmp_path):
+    export_delta(db, str(tmp_path / "d1.json"))
+    db.insert_completion(9, "Brief visit", None, None, "DA", None, "2026-10-21T09:00:00")
+    db.delete_latest_by_idx(9)
+    path = tmp_path / "d2.json"
+    assert export_delta(db, str(path), tombstones=True) is None
+    assert not path.exists()
+    assert db.export_heads()[1] == 0  # never sent, so no tombstone was kept
+
+
+def test_tombstones_are_pruned_once_exported(db, tmp_path):
+    def tombstones():
+        with db._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM completion_tombstones").fetchone()[0]
+    db.clear_all()
+    assert tombstones() == 0  # nothing had been exported yet
+    db.insert_completion(0, "1 High St", None, None, "DA", None, "2026-10-21T09:00:00")
+    db.insert_completion(1, "2 High St", None, None, "DA", None, "2026-10-21T09:05:00")
+    export_delta(db, str(tmp_path / "d1.json"))
+    db.clear_all()
+    assert tombstones() == 2
+    path = tmp_path / "d2.json"
+    export_delta(db, str(path), tombstones=True)
+    assert [r['change'] for r in json.loads(path.read_text(encoding="utf-8"))] == ["deleted", "deleted"]
+    assert tombstones() == 0
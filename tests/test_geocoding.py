@@ -0,0 +1,28 @@
+from main import GeocodeCache, geocode_addresses, postcode_key
+
+
+def write_gazetteer(path):
+    path.write_text("pcd,lat,long\nSW1A 1AA,51.501009,-0.141588\nLS1 6DT,53.797,-1.544\n", encoding="utf-8")
+
+
+def test_postcode_key_takes_the_last_postcode():
+    assert postcode_key("Flat 1, 10 Downing St, London sw1a 2aa") == "SW1A2AA"
+    assert postcode_key("Unit B1 Park, LS1 6DT") == "LS16DT"
+    assert postcode_key("No postcode here") is None
+
+
+def test_geocode_resolves_from_gazetteer_then_cache(tmp_path):
+    gazetteer = tmp_path / "postcodes.csv"
+    write_gazetteer(gazetteer)
+    cache = GeocodeCache(str(tmp_path / "geo.db"))
+    entries = [(0, "Buckingham Palace, SW1A 1AA"), (3, "12 Market St, Leeds ls1 6dt"), (4, "Nowhere ZZ9 9ZZ"), (7, "No postcode")]
+    results, stats = geocode_addresses(entries, cache, str(gazetteer))
+    assert results == {0: (51.501009, -0.141588), 3: (53.797, -1.544)}
+    assert stats['resolved'] == 2 and stats['no_postcode'] == 1 and stats['unresolved'] == 2
+    assert stats['cache_hits'] == 0
+
+    # Second run: every postcode, including the unknown one, is answered by the cache
+    gazetteer.unlink()
+    results, stats = geocode_addresses(entries, cache, str(gazetteer))
+    assert results == {0: (51.501009, -0.141588), 3: (53.797, -1.544)}
+    assert stats['cache_hits'] == 3 and stats['cache_misses'] == 0
@@ -0,0 +1,46 @@
+from main import address_key, describe_import_report, normalise_import_columns
+
+
+def test_address_key_folds_case_spacing_and_punctuation():
+    assert address_key("1 High St.") == address_key("1 HIGH ST")
+    assert address_key("1\thigh  st\u200b") == address_key("1 High St")
+    assert address_key("Flat 2, 1 High-St") == address_key("flat 2 1 high st")
+    assert address_key("1 High St") != address_key("2 High St")
+
+
+def test_address_key_keeps_one_key_per_line():
+    assert address_key("1 High St\n2 LOW RD").split("\n") == ["1highst", "2lowrd"]
+
+
+def test_duplicates_ignore_case_and_spacing():
+    addresses, report = normalise_import_columns(["1 High St", "1 HIGH ST", "1  high st.", "2 High St"])
+    assert [a.get('duplicate_of') for a in addresses] == [None, 0, 0, None]
+    assert report['duplicates'] == 2
+
+
+def test_cells_are_cleaned_and_empty_rows_dropped():
+    addresses, report = normalise_import_columns(["  1 High St ,,London sw1a1aa ", "", None, "n/a"])
+    assert [a['address'] for a in addresses] == ["1 High St, London SW1A 1AA"]
+    assert report['dropped_empty'] == 3
+    assert report['postcodes_normalised'] == 1
+
+
+def test_postcodes_never_span_adjacent_rows():
+    addresses, report = normalise_import_columns(['Unit B2', '4th Floor, 10 King St', 'Flat 3'])
+    assert [a['address'] for a in addresses] == ['Unit B2', '4th Floor, 10 King St', 'Flat 3']
+    assert report['postcodes_normalised'] == 0
+
+
+def test_coordinates_are_validated_and_swaps_corrected():
+    texts = ["1 A St", "2 A St", "3 A St", "4 A St", "5 A St", "6 A St"]
+    lats = [51.50, 51.51, "-0.12", 0, 200, 51.52]
+    lngs = [-0.10, -0.11, "51.49", 0, 300, None]
+    addresses, report = normalise_import_columns(texts, lats, lngs)
+    coords = [(a['lat'], a['lng']) for a in addresses]
+    assert coords[:3] == [(51.50, -0.10), (51.51, -0.11), (51.49, -0.12)]
+    assert coords[3:] == [(None, None)] * 3
+    assert report['coords_swapped'] == 1
+    assert report['coords_zero'] == 1
+    assert report['coords_out_of_range'] == 1
+    assert report['coords_valid'] == 3 and report['coords_missing'] == 3
+    assert describe_import_report(report) == "1 swapped, 1 zero, 1 out of range"
@@ -0,0 +1,31 @@
+from main import diff_keyed_rows
+
+
+def apply_diff(old_keys, diff):
+    removals, insertions = diff
+    keys = list(old_keys)
+    for pos in removals:
+        del keys[pos]
+    for pos, key in insertions:
+        keys.insert(pos, key)
+    return keys
+
+
+def test_removals_and_insertions_rebuild_the_new_list():
+    old, new = [0, 1, 2, 3, 4, 5], [0, 2, 7, 3, 5, 8]
+    diff = diff_keyed_rows(old, new)
+    assert diff == ([4, 1], [(2, 7), (5, 8)])
+    assert apply_diff(old, diff) == new
+
+
+def test_identical_lists_need_no_edits():
+    assert diff_keyed_rows([3, 1, 2], [3, 1, 2]) == ([], [])
+
+
+def test_from_and_to_empty():
+    assert apply_diff([], diff_keyed_rows([], [1, 2])) == [1, 2]
+    assert apply_diff([1, 2], diff_keyed_rows([1, 2], [])) == []
+
+
+def test_reordered_survivors_ask_for_a_full_replace():
+    assert diff_keyed_rows([0, 1, 2], [0, 2, 1]) is None
@@ -0,0 +1,28 @@
+from main import MAP_DEFAULT_SETTINGS, TILE_SIZE, cluster_markers, map_settings, mercator_xy
+
+
+def test_mercator_fractions():
+    assert mercator_xy(0, 0) == (0.5, 0.5)
+    x, y = mercator_xy(51.5, -0.1)
+    assert 0.49 < x < 0.5 and 0 < y < 0.5  # north of the equator is above the middle
+    assert mercator_xy(89.9, 180)[1] == mercator_xy(85.0511, 180)[1]
+
+
+def test_markers_merge_per_cell_and_keep_the_most_urgent_status():
+    zoom = 10
+    cell = 56
+    scale = TILE_SIZE * (1 << zoom)
+    near = [(0, 0.5, 0.5, 'completed'), (1, 0.5 + 5 / scale, 0.5, 'pending'), (2, 0.5, 0.5 + 5 / scale, 'active')]
+    far = [(3, 0.5 + 500 / scale, 0.5, 'completed')]
+    clusters = sorted(cluster_markers(near + far, zoom, cell), key=lambda c: c[0])
+    assert [(sorted(members), status) for _, _, members, status in clusters] == [([0, 1, 2], 'active'), ([3], 'completed')]
+    # Zoomed far out, everything shares a cell
+    assert len(cluster_markers(near + far, 2, cell)) == 1
+
+
+def test_map_settings_overrides_only_known_non_empty_values():
+    settings = map_settings({'tile_url': "https://tiles.example/{z}/{x}/{y}.png", 'attribution': "", 'other': "x"})
+    assert settings['tile_url'] == "https://tiles.example/{z}/{x}/{y}.png"
+    assert settings['attribution'] == MAP_DEFAULT_SETTINGS['attribution'] == "© OpenStreetMap contributors"
+    assert 'other' not in settings
+    assert map_settings(None) == MAP_DEFAULT_SETTINGS
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+from main import PLANNER_DEFAULT_VISIT_S, VisitTimeModel, plan_days
+
+
+def history(outcome_gaps, address="1 High St, Leeds LS1 6DT", start=datetime(2026, 10, 5, 9, 0)):
+    """Completions at one spot separated by the given gaps in seconds, so no travel is subtracted."""
+    rows = [(address, 53.8, -1.55, "DA", start.isoformat())]
+    when = start
+    for outcome, gap in outcome_gaps:
+        when += timedelta(seconds=gap)
+        rows.append((address, 53.8, -1.55, outcome, when.isoformat()))
+    return rows
+
+
+def test_visit_times_are_per_outcome_medians_mixed_by_area():
+    rows = history([("DA", 120)] * 6 + [("PIF", 600)] * 3 + [("DA", 4 * 3600)])
+    model = VisitTimeModel(rows)
+    assert model.samples == 9  # the four-hour break is not a visit
+    assert model.outcome_seconds == {"DA": 120.0, "PIF": 600.0}
+    # LS1 has 8 DA completions (including the first and the one after the break) and 3 PIF
+    assert abs(model.visit_seconds("9 Other St, Leeds LS1 2AB") - (8 * 120 + 3 * 600) / 11) < 1e-6
+
+
+def test_no_history_falls_back_to_default():
+    model = VisitTimeModel([])
+    assert model.visit_seconds("Anywhere") == PLANNER_DEFAULT_VISIT_S
+
+
+def test_plan_days_keeps_route_order_and_respects_the_shift():
+    model = VisitTimeModel([])
+    stops = [(i, f"{i} High St", 53.8, -1.55 + 0.001 * i) for i in range(30)]
+    days = plan_days(stops, model, shift_s=3600.0)
+    assert [i for day in days for i in day['stops']] == list(range(30))
+    for day in days:
+        assert day['visit_s'] + day['travel_s'] <= 3600.0
+        assert day['travel_s'] == day['distance_m'] / model.speed_mps
+    assert len(days) == 4  # 6-minute visits plus a few seconds of travel: 9 stops a day
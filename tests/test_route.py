@@ -0,0 +1,39 @@
+import itertools
+import random
+
+from main import haversine_m, optimise_route
+
+
+def route_length(points, order, start=None):
+    stops = ([start] if start is not None else []) + [points[i] for i in order]
+    return sum(haversine_m(*a, *b) for a, b in zip(stops, stops[1:]))
+
+
+def test_empty_and_single_point():
+    assert optimise_route([])[0] == []
+    assert optimise_route([(51.5, -0.1)])[0] == [0]
+
+
+def test_visits_every_point_once_and_never_gets_longer():
+    rng = random.Random(3)
+    points = [(51.5 + rng.uniform(-0.03, 0.03), -0.1 + rng.uniform(-0.05, 0.05)) for _ in range(120)]
+    order, info = optimise_route(points, start=(51.5, -0.1))
+    assert sorted(order) == list(range(len(points)))
+    assert info['stops'] == 120
+    assert info['length_m'] <= info['initial_m'] + 1e-6
+    assert abs(route_length(points, order, (51.5, -0.1)) - info['length_m']) < info['length_m'] * 1e-3
+
+
+def test_small_routes_are_optimal():
+    rng = random.Random(11)
+    points = [(51.5 + rng.uniform(-0.01, 0.01), -0.1 + rng.uniform(-0.01, 0.01)) for _ in range(7)]
+    start = (51.5, -0.1)
+    best = min(route_length(points, perm, start) for perm in itertools.permutations(range(len(points))))
+    order, _ = optimise_route(points, start=start)
+    assert route_length(points, order, start) <= best * 1.02
+
+
+def test_points_on_a_line_are_walked_in_order():
+    points = [(51.5, -0.1 + 0.001 * i) for i in (4, 0, 3, 1, 2)]
+    order, _ = optimise_route(points, start=(51.5, -0.1))
+    assert order == [1, 3, 4, 2, 0]
@@ -0,0 +1,52 @@
+import random
+
+from main import AddressSearchIndex
+
+TEXTS = [
+    "12 Market Street, Leeds LS1 6DT",
+    "3 Streetly Road, Birmingham B23 7AA",
+    "Flat 4, 9 Station Road, York YO1 6HT",
+    "Market House, 1 High St, Leeds LS2 7EE",
+    "77 Upstreet Lane, Hull HU1 1AA",
+]
+
+
+def scan(texts, query):
+    query = query.strip().lower()
+    return {i for i, text in enumerate(texts) if query in text.lower()}
+
+
+def test_matches_are_the_substring_matches():
+    index = AddressSearchIndex(TEXTS)
+    for query in ("street", "leeds", "ls", "road, b", "zz", "1", "Market"):
+        assert set(index.search(query)) == scan(TEXTS, query), query
+
+
+def test_whole_words_and_prefixes_rank_first():
+    index = AddressSearchIndex(TEXTS)
+    # "street" is a whole word in 0, starts a word in 1 and sits inside one in 4
+    assert index.search("market") == [0, 3]
+    assert index.search("street") == [0, 1, 4]
+
+
+def test_positions_break_ties_in_display_order():
+    index = AddressSearchIndex(TEXTS)
+    assert index.search("market", positions={0: 5, 3: 1}) == [3, 0]
+
+
+def test_blank_query_returns_everything():
+    assert AddressSearchIndex(TEXTS).search("   ") == list(range(len(TEXTS)))
+
+
+def test_narrowing_from_history_matches_a_fresh_index():
+    rng = random.Random(7)
+    words = ["high", "street", "road", "lane", "leeds", "york", "flat", "house"]
+    texts = [f"{rng.randint(1, 99)} {rng.choice(words)} {rng.choice(words)}" for _ in range(300)]
+    index = AddressSearchIndex(texts)
+    typed = ""
+    for ch in "high stre":
+        typed += ch
+        assert set(index.search(typed)) == scan(texts, typed)
+    for _ in range(4):
+        typed = typed[:-1]
+        assert set(index.search(typed)) == scan(texts, typed)
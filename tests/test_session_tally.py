@@ -0,0 +1,27 @@
+from main import DaySessionTally
+
+
+def test_counts_follow_completions_and_undos():
+    tally = DaySessionTally([
+        {'index': 0, 'outcome': 'PIF', 'amount': "12.10"},
+        {'index': 3, 'outcome': 'DA'},
+        {'index': 5, 'outcome': 'PIF', 'amount': "0.20"},
+    ])
+    assert len(tally) == 3
+    assert tally.outcomes == {'PIF': 2, 'DA': 1}
+    assert tally.pif_total == 12.30
+    assert tally.remove(0)['amount'] == "12.10"
+    assert tally.remove(0) is None
+    assert tally.outcomes == {'PIF': 1, 'DA': 1} and tally.pif_total == 0.20
+    assert [e['index'] for e in tally.as_list()] == [3, 5]
+
+
+def test_recompleting_an_index_replaces_its_entry():
+    tally = DaySessionTally([{'index': 1, 'outcome': 'PIF', 'amount': "5"}])
+    tally.add({'index': 1, 'outcome': 'Done'})
+    assert len(tally) == 1 and tally.outcomes == {'Done': 1} and tally.pif_total == 0
+
+
+def test_bad_amounts_count_as_zero():
+    tally = DaySessionTally([{'index': 0, 'outcome': 'PIF', 'amount': "n/a"}, {'index': 1, 'outcome': 'PIF', 'amount': None}])
+    assert tally.outcomes == {'PIF': 2} and tally.pif_total == 0
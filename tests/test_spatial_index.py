@@ -0,0 +1,74 @@
+import random
+import types
+
+import pytest
+
+import main
+from main import MainScreen, SpatialIndex, haversine_m
+
+
+def brute_nearest(points, lat, lng, k, exclude=()):
+    found = sorted((haversine_m(lat, lng, plat, plng), i) for i, (plat, plng) in points.items() if i not in exclude)
+    return [i for _, i in found[:k]]
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(5)
+    return {i: (51.5 + rng.uniform(-0.05, 0.05), -0.1 + rng.uniform(-0.08, 0.08)) for i in range(400)}
+
+
+def test_nearest_matches_brute_force_near_and_far(points):
+    index = SpatialIndex((i, lat, lng) for i, (lat, lng) in points.items())
+    rng = random.Random(9)
+    for _ in range(200):
+        # Mostly inside the cloud, some a degree or two away where the linear fallback kicks in
+        spread = rng.choice((0.05, 0.05, 2.0))
+        lat, lng = 51.5 + rng.uniform(-spread, spread), -0.1 + rng.uniform(-spread, spread)
+        k = rng.choice((1, 3, 8))
+        exclude = {rng.randrange(400) for _ in range(3)}
+        got = [i for i, _ in index.nearest(lat, lng, k, exclude)]
+        assert got == brute_nearest(points, lat, lng, k, exclude)
+
+
+def test_add_and_remove_keep_queries_correct(points):
+    index = SpatialIndex((i, lat, lng) for i, (lat, lng) in points.items())
+    for i in range(0, 400, 2):
+        index.remove(i)
+        del points[i]
+    index.add(1000, 51.5, -0.1)
+    points[1000] = (51.5, -0.1)
+    assert len(index) == len(points) and 1000 in index and 0 not in index
+    assert index.nearest(51.5, -0.1)[0] == (1000, 0.0)
+    assert [i for i, _ in index.nearest(51.52, -0.07, 5)] == brute_nearest(points, 51.52, -0.07, 5)
+
+
+def test_within_returns_everything_in_the_radius_closest_first(points):
+    index = SpatialIndex((i, lat, lng) for i, (lat, lng) in points.items())
+    hits = index.within(51.5, -0.1, 1500)
+    expected = {i for i, (lat, lng) in points.items() if haversine_m(51.5, -0.1, lat, lng) <= 1500}
+    assert {i for i, _ in hits} == expected
+    assert [d for _, d in hits] == sorted(d for _, d in hits)
+
+
+def test_empty_index():
+    index = SpatialIndex()
+    assert index.nearest(51.5, -0.1) == [] and index.within(51.5, -0.1, 100) == []
+
+
+def test_arrival_fires_on_entering_the_radius_only(monkeypatch):
+    monkeypatch.setattr(main, 'toast', lambda text: None)
+    screen = types.SimpleNamespace(
+        _spatial_index=SpatialIndex([(0, 51.5, -0.1), (1, 51.6, -0.1)]), active_index=None, _arrived_index=None,
+        _address_fields=lambda i: (f"{i} High St", None, None), _apply_etas=lambda: None,
+    )
+    screen.check_arrival = lambda lat, lng: MainScreen.check_arrival(screen, lat, lng)
+    screen.set_active_address = lambda i: setattr(screen, 'active_index', i)
+    MainScreen.update_position(screen, 51.5, -0.1)
+    assert screen.active_index == 0
+    screen.active_index = 1  # the user switches while still standing at address 0
+    MainScreen.update_position(screen, 51.50001, -0.1)
+    assert screen.active_index == 1
+    MainScreen.update_position(screen, 51.55, -0.1)  # walk away and come back
+    MainScreen.update_position(screen, 51.5, -0.1)
+    assert screen.active_index == 0
@@ -0,0 +1,49 @@
+import threading
+import types
+from datetime import date, datetime
+
+import pytest
+
+from main import AddressNavigatorApp, CompletionDB, month_start, prefetch_summaries, preset_ranges
+
+
+@pytest.fixture
+def app(tmp_path):
+    return types.SimpleNamespace(db=CompletionDB(str(tmp_path / "completions.db")))
+
+
+def test_preset_ranges_cover_today():
+    today = date.today()
+    ranges = preset_ranges()
+    assert [name for name, _, _ in ranges] == ["Today", "This week", "This month"]
+    assert ranges[0][1:] == (today, today)
+    assert all(start <= today <= end for _, start, end in ranges)
+
+
+def test_prefetch_fills_the_cache_and_sees_new_rows(app):
+    now = datetime.now().replace(microsecond=0).isoformat()
+    app.db.insert_completion(0, "1 High St, Leeds LS1 6DT", 53.8, -1.55, "PIF", 12.5, now)
+    first = prefetch_summaries(app)
+    assert first['Today']['outcomes'] == {'PIF': 1, 'DA': 0, 'Done': 0}
+    hits = app.db.cache_stats()['hits']
+    prefetch_summaries(app)
+    assert app.db.cache_stats()['hits'] == hits + 3
+    app.db.insert_completion(1, "2 High St", None, None, "DA", None, now)
+    assert prefetch_summaries(app)['Today']['outcomes'] == {'PIF': 1, 'DA': 1, 'Done': 0}
+
+
+def test_month_start_crosses_years():
+    assert month_start(2026, 1, -1) == date(2025, 12, 1)
+    assert month_start(2026, 12, 1) == date(2027, 1, 1)
+    assert month_start(2026, 10) == date(2026, 10, 1)
+
+
+def test_track_store_is_created_once_across_threads(app):
+    app._track_store_lock = threading.Lock()
+    stores = []
+    threads = [threading.Thread(target=lambda: stores.append(AddressNavigatorApp.get_track_store(app))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(stores) == 8 and all(store is stores[0] for store in stores)
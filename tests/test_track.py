@@ -0,0 +1,66 @@
+import random
+
+from main import TrackRecorder, TrackStore, TRACK_SCALE, _fixed_sample, decode_track, encode_track, track_stats
+
+
+def walk(n, seed=1, start=1_760_000_000):
+    rng = random.Random(seed)
+    lat, lng, t = 51.5, -0.1, start
+    samples = []
+    for _ in range(n):
+        t += rng.randint(10, 40)
+        lat += rng.uniform(-0.0004, 0.0004)
+        lng += rng.uniform(-0.0004, 0.0004)
+        samples.append(_fixed_sample(t, lat, lng))
+    return samples
+
+
+def degrees(samples):
+    return [(t, lat / TRACK_SCALE, lng / TRACK_SCALE) for t, lat, lng in samples]
+
+
+def test_encode_decode_round_trip_is_compact():
+    samples = walk(2000)
+    blob = encode_track(samples)
+    assert decode_track(blob) == degrees(samples)
+    assert len(blob) < 2000 * 8
+
+
+def test_encoded_batches_concatenate():
+    samples = walk(300)
+    blob = encode_track(samples[:120]) + encode_track(samples[120:], samples[119])
+    assert decode_track(blob) == degrees(samples)
+
+
+def test_stats_split_moving_idle_and_gaps():
+    t0 = 1_760_000_000
+    samples = [(t0, 51.5, -0.1), (t0 + 60, 51.501, -0.1), (t0 + 120, 51.501, -0.1), (t0 + 3600, 51.6, -0.1)]
+    stats = track_stats(samples)
+    assert stats['samples'] == 4
+    assert abs(stats['distance_m'] - 111.2) < 1.0
+    assert stats['moving_s'] == 60 and stats['idle_s'] == 60  # the hour-long jump is a recording gap
+    assert (stats['start'], stats['end']) == (t0, t0 + 3600)
+
+
+def test_recorder_background_flushes_land_in_order(tmp_path):
+    store = TrackStore(str(tmp_path / "tracks.db"))
+    recorder = TrackRecorder(store, "2026-10-19")
+    t0 = 1_760_000_000
+    for i in range(600):
+        recorder.add_fix(51.5 + i * 0.0005, -0.1, t0 + i * 15)
+        if i % 7 == 0:
+            recorder.flush(background=True)
+    recorder.close()
+    samples = store.load("2026-10-19")
+    assert len(samples) == 600
+    assert [t for t, _, _ in samples] == [t0 + i * 15 for i in range(600)]
+    assert all(abs(lat - (51.5 + i * 0.0005)) < 1e-5 for i, (_, lat, _) in enumerate(samples))
+
+
+def test_recorder_thins_fixes_too_close_in_time_or_space(tmp_path):
+    recorder = TrackRecorder(TrackStore(str(tmp_path / "tracks.db")), "2026-10-19")
+    t0 = 1_760_000_000
+    assert recorder.add_fix(51.5, -0.1, t0)
+    assert not recorder.add_fix(51.6, -0.1, t0 + 2)  # too soon
+    assert not recorder.add_fix(51.50001, -0.1, t0 + 30)  # barely moved
+    assert recorder.add_fix(51.501, -0.1, t0 + 30)
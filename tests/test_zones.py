@@ -0,0 +1,41 @@
+import random
+
+from main import cluster_zones
+
+
+def cloud(n, seed=2):
+    rng = random.Random(seed)
+    return [(51.5 + rng.uniform(-0.06, 0.06), -0.1 + rng.uniform(-0.1, 0.1)) for _ in range(n)]
+
+
+def test_default_zone_count_and_balanced_sizes():
+    points = cloud(600)
+    labels, info = cluster_zones(points)
+    assert len(labels) == 600
+    assert info['zones'] == 10
+    sizes = [labels.count(z) for z in range(10)]
+    assert sizes == info['sizes']
+    assert max(sizes) <= 60 and min(sizes) >= 50
+
+
+def test_zones_are_numbered_north_to_south():
+    points = cloud(300)
+    labels, info = cluster_zones(points, k=5)
+    mean_lat = []
+    for zone in range(5):
+        members = [points[i][0] for i, label in enumerate(labels) if label == zone]
+        mean_lat.append(sum(members) / len(members))
+    assert mean_lat == sorted(mean_lat, reverse=True)
+
+
+def test_separate_towns_land_in_separate_zones():
+    rng = random.Random(4)
+    leeds = [(53.80 + rng.uniform(-0.01, 0.01), -1.55 + rng.uniform(-0.01, 0.01)) for _ in range(40)]
+    york = [(53.96 + rng.uniform(-0.01, 0.01), -1.08 + rng.uniform(-0.01, 0.01)) for _ in range(40)]
+    labels, _ = cluster_zones(leeds + york, k=2)
+    assert set(labels[:40]) == {1} and set(labels[40:]) == {0}
+
+
+def test_fewer_points_than_zones():
+    labels, info = cluster_zones([(51.5, -0.1), (51.6, -0.1)], k=5)
+    assert sorted(labels) == [0, 1] and info['zones'] == 2